@@ -2,4 +2,5 @@ import os
 
 
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.environ.get('AOC_CACHE_DIR', os.path.abspath(os.path.join(ROOT_DIR, '../../.aoc_cache')))
 RUNNING_ALL = False
@@ -0,0 +1,50 @@
+import importlib
+import os
+import pkgutil
+import random
+from typing import List, Optional, Tuple
+
+GENERATOR_PACKAGE = 'adventofcode.generators'
+
+
+def generate_input(year: int, day: int, scale: int = 1, seed: Optional[int] = None) -> str:
+    """
+    Generates an input for the year/day in the format of the input files. Scale 1 gives an
+    input of about the size of the real input, scale n about n times as much data.
+    The same seed and scale always give the same input
+    """
+    if scale < 1:
+        raise ValueError('scale should be at least 1')
+
+    lines = _generator_module(year, day).generate(random.Random(seed), scale)
+    return '\n'.join(lines) + '\n'
+
+
+def available_generators() -> List[Tuple[int, int]]:
+    """
+    Returns the year and day of every input generator
+    """
+    package_path = os.path.dirname(__file__)
+    found = []
+
+    # The packages are listed from their directories, so no generator is imported
+    for year_info in pkgutil.iter_modules([package_path]):
+        if not year_info.ispkg or not year_info.name.startswith('year_'):
+            continue
+
+        for day_info in pkgutil.iter_modules([os.path.join(package_path, year_info.name)]):
+            if day_info.name.startswith('day_'):
+                found.append((int(year_info.name[5:]), int(day_info.name[4:6])))
+
+    return sorted(found)
+
+
+def _generator_module(year: int, day: int):
+    module_name = f'{GENERATOR_PACKAGE}.year_{year}.day_{day:02}_{year}'
+
+    try:
+        return importlib.import_module(module_name)
+    except ModuleNotFoundError as e:
+        if e.name is not None and module_name.startswith(e.name):
+            raise ValueError(f'there is no input generator for {year} day {day:02}') from None
+        raise
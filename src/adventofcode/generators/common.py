@@ -0,0 +1,14 @@
+import math
+import random
+from typing import List
+
+
+def scaled_side(base: int, scale: int) -> int:
+    """
+    Side length of a square grid that holds about scale times as many cells as a base x base grid
+    """
+    return max(1, round(base * math.sqrt(scale)))
+
+
+def digit_grid(rng: random.Random, width: int, height: int, digits: str = '0123456789') -> List[str]:
+    return [''.join(rng.choices(digits, k=width)) for _ in range(height)]
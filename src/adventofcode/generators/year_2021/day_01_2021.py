@@ -0,0 +1,16 @@
+"""
+Sonar depth measurements, a slowly increasing random walk of 2000 * scale depths
+"""
+import random
+from typing import List
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    depth = rng.randint(100, 200)
+    lines = []
+
+    for _ in range(2000 * scale):
+        depth = max(0, depth + rng.randint(-12, 18))
+        lines.append(str(depth))
+
+    return lines
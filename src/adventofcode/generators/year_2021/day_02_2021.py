@@ -0,0 +1,22 @@
+"""
+Submarine commands, 1000 * scale forward, down and up commands that never go above the surface
+"""
+import random
+from typing import List
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    depth = 0
+    lines = []
+
+    for _ in range(1000 * scale):
+        command = rng.choice(('forward', 'forward', 'down', 'up'))
+        amount = rng.randint(1, 9)
+
+        if command == 'up' and depth < amount:
+            command = 'down'
+        depth += amount if command == 'down' else -amount if command == 'up' else 0
+
+        lines.append(f'{command} {amount}')
+
+    return lines
@@ -0,0 +1,18 @@
+"""
+Bingo, 100 * scale boards. Every number is drawn, so every board wins eventually
+"""
+import random
+from typing import List
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    numbers = list(range(100 * scale))
+    rng.shuffle(numbers)
+    lines = [','.join(map(str, numbers))]
+
+    for _ in range(100 * scale):
+        board = rng.sample(numbers, 25)
+        lines.append('')
+        lines.extend(' '.join(f'{num:2}' for num in board[row:row + 5]) for row in range(0, 25, 5))
+
+    return lines
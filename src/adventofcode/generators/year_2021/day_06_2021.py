@@ -0,0 +1,9 @@
+"""
+Lanternfish timers, 300 * scale fish
+"""
+import random
+from typing import List
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    return [','.join(str(rng.randint(1, 5)) for _ in range(300 * scale))]
@@ -0,0 +1,9 @@
+"""
+Crab positions, 1000 * scale crabs, most of them close to zero like in the real input
+"""
+import random
+from typing import List
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    return [','.join(str(min(1999, int(rng.expovariate(1 / 400)))) for _ in range(1000 * scale))]
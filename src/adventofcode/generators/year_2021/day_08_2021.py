@@ -0,0 +1,21 @@
+"""
+Seven segment displays, 200 * scale entries with a random wiring each
+"""
+import random
+from typing import List
+
+DIGITS = ['abcefg', 'cf', 'acdeg', 'acdfg', 'bcdf', 'abdfg', 'abdefg', 'acf', 'abcdefg', 'abcdfg']
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    lines = []
+
+    for _ in range(200 * scale):
+        wiring = dict(zip('abcdefg', rng.sample('abcdefg', 7)))
+        patterns = [''.join(rng.sample([wiring[segment] for segment in digit], len(digit))) for digit in DIGITS]
+
+        signals = rng.sample(patterns, 10)
+        output = [''.join(rng.sample(pattern, len(pattern))) for pattern in rng.choices(patterns, k=4)]
+        lines.append(f"{' '.join(signals)} | {' '.join(output)}")
+
+    return lines
@@ -0,0 +1,42 @@
+"""
+Heightmap of (100 * sqrt(scale))² locations. Every basin slopes down to a single low point and basins
+are separated by walls of 9, so there are no plateaus
+"""
+import random
+from collections import deque
+from typing import Deque, List, Tuple
+
+from adventofcode.generators.common import scaled_side
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    side = scaled_side(100, scale)
+    basin = [[-1] * side for _ in range(side)]
+    distance = [[0] * side for _ in range(side)]
+    queue: Deque[Tuple[int, int]] = deque()
+
+    for index in range(max(3, side * side // 40)):
+        x, y = rng.randrange(side), rng.randrange(side)
+        if basin[y][x] == -1:
+            basin[y][x] = index
+            queue.append((x, y))
+
+    # Grows all basins at once, so every location belongs to the basin of its closest low point
+    while queue:
+        x, y = queue.popleft()
+        for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            if 0 <= nx < side and 0 <= ny < side and basin[ny][nx] == -1:
+                basin[ny][nx] = basin[y][x]
+                distance[ny][nx] = distance[y][x] + 1
+                queue.append((nx, ny))
+
+    lines = []
+    for y in range(side):
+        row = []
+        for x in range(side):
+            on_border = any(basin[ny][nx] != basin[y][x] for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1))
+                            if 0 <= nx < side and 0 <= ny < side)
+            row.append('9' if on_border else str(min(distance[y][x], 9)))
+        lines.append(''.join(row))
+
+    return lines
@@ -0,0 +1,33 @@
+"""
+Navigation subsystem, 100 * scale lines of chunks. About half of the lines are corrupted,
+the others are incomplete
+"""
+import random
+from typing import List
+
+CLOSING = {'(': ')', '[': ']', '{': '}', '<': '>'}
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    lines = []
+
+    for i in range(100 * scale):
+        length = rng.randint(90, 110)
+        # The first line is always incomplete, so there is a middle score
+        corrupt_at = rng.randrange(length // 2, length) if i and rng.random() < 0.5 else -1
+        stack: List[str] = []
+        line: List[str] = []
+
+        while len(line) < length or not stack:
+            if stack and len(line) == corrupt_at:
+                line.append(rng.choice([closing for closing in CLOSING.values() if closing != CLOSING[stack[-1]]]))
+                stack.pop()
+            elif not stack or rng.random() < 0.55:
+                stack.append(rng.choice(list(CLOSING)))
+                line.append(stack[-1])
+            else:
+                line.append(CLOSING[stack.pop()])
+
+        lines.append(''.join(line))
+
+    return lines
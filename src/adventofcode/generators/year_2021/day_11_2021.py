@@ -0,0 +1,50 @@
+"""
+Octopus energy levels on a (10 * sqrt(scale))² grid. Most octopuses start with the same energy level,
+and a grid is only returned when the octopuses synchronise within 1000 steps
+"""
+import random
+from typing import List
+
+from adventofcode.generators.common import scaled_side
+
+MAX_STEPS = 1000
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    side = scaled_side(10, scale)
+
+    while True:
+        base = rng.randint(0, 9)
+        grid = [[base if rng.random() < 0.85 else rng.randint(0, 9) for _ in range(side)] for _ in range(side)]
+
+        if _synchronizes([row[:] for row in grid]):
+            return [''.join(map(str, row)) for row in grid]
+
+
+def _synchronizes(grid: List[List[int]]) -> bool:
+    side = len(grid)
+
+    for _ in range(MAX_STEPS):
+        flashing = [(x, y) for y in range(side) for x in range(side) if _charge(grid, x, y)]
+        flashed = set(flashing)
+
+        while flashing:
+            x, y = flashing.pop()
+            for ny in range(max(y - 1, 0), min(y + 2, side)):
+                for nx in range(max(x - 1, 0), min(x + 2, side)):
+                    if (nx, ny) not in flashed and _charge(grid, nx, ny):
+                        flashed.add((nx, ny))
+                        flashing.append((nx, ny))
+
+        if len(flashed) == side * side:
+            return True
+
+        for x, y in flashed:
+            grid[y][x] = 0
+
+    return False
+
+
+def _charge(grid: List[List[int]], x: int, y: int) -> bool:
+    grid[y][x] += 1
+    return grid[y][x] > 9
@@ -0,0 +1,52 @@
+"""
+Cave system like the real one, plus scale - 1 branches between start and end. A branch is a big cave
+with a few small caves that are only connected to it. Paths cannot go from one branch to another,
+so the amount of paths grows linearly with scale, instead of exponentially with the size of the
+cave system. Big caves are never connected to each other, which would allow infinitely many paths
+"""
+import random
+import string
+from typing import List, Set, Tuple
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    taken = {'start', 'end'}
+    small = _names(rng, string.ascii_lowercase, 7, taken)
+    big = _names(rng, string.ascii_uppercase, 3, taken)
+    edges: Set[Tuple[str, str]] = set()
+
+    for cave in small:
+        for other in rng.sample(big, rng.randint(1, 2)):
+            edges.add((cave, other))
+        for other in small:
+            if cave < other and rng.random() < 0.2:
+                edges.add((cave, other))
+
+    for cave in ('start', 'end'):
+        for other in rng.sample(small, 2) + rng.sample(big, 1):
+            edges.add((cave, other))
+
+    for _ in range(scale - 1):
+        cave, = _names(rng, string.ascii_uppercase, 1, taken)
+        edges.update({('start', cave), (cave, 'end')})
+        edges.update((other, cave) for other in _names(rng, string.ascii_lowercase, 3, taken))
+
+    lines = ['-'.join(edge if rng.random() < 0.5 else edge[::-1]) for edge in sorted(edges)]
+    rng.shuffle(lines)
+    return lines
+
+
+def _names(rng: random.Random, letters: str, amount: int, taken: Set[str]) -> List[str]:
+    """
+    Returns amount new cave names, which are added to taken
+    """
+    names: List[str] = []
+
+    while len(names) < amount:
+        # Longer names once most of the two letter names are taken
+        name = ''.join(rng.choices(letters, k=2 if len(taken) < 200 else 3))
+        if name not in taken:
+            names.append(name)
+            taken.add(name)
+
+    return names
@@ -0,0 +1,35 @@
+"""
+Transparent paper with 900 * scale dots that folds into a 40x6 code. The paper gets an extra fold
+whenever the dots would not fit anymore. Dots are created by unfolding the pixels of the code,
+so no dot ever lies on a fold line
+"""
+import random
+from typing import List, Set, Tuple
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    folds: List[Tuple[str, int]] = []
+    size = {'x': 40, 'y': 6}
+    axes = ['x', 'y'] * 5 + ['y', 'y']
+    dots = 900 * scale
+
+    while axes or (size['x'] + 1) * (size['y'] + 1) < dots * 2:
+        axis = axes.pop() if axes else min(size, key=size.get)  # type: ignore
+        folds.append((axis, size[axis]))
+        size[axis] = 2 * size[axis] + 1
+
+    pixels = [(x, y) for x in range(40) for y in range(6) if rng.random() < 0.4]
+    found: Set[Tuple[int, int]] = set()
+
+    while len(found) < dots:
+        x, y = rng.choice(pixels)
+        for axis, value in folds:
+            if rng.random() < 0.5:
+                x, y = (2 * value - x, y) if axis == 'x' else (x, 2 * value - y)
+        found.add((x, y))
+
+    lines = [f'{x},{y}' for x, y in found]
+    rng.shuffle(lines)
+    lines.append('')
+    lines.extend(f'fold along {axis}={value}' for axis, value in reversed(folds))
+    return lines
@@ -0,0 +1,16 @@
+"""
+Polymer template of 20 * scale elements with an insertion rule for every pair of elements.
+The amount of elements grows with the square root of scale, so the amount of rules grows with scale
+"""
+import math
+import random
+import string
+from typing import List
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    elements = rng.sample(string.ascii_uppercase, min(26, round(10 * math.sqrt(scale))))
+    rules = [f'{first}{second} -> {rng.choice(elements)}' for first in elements for second in elements]
+    rng.shuffle(rules)
+
+    return [''.join(rng.choices(elements, k=20 * scale)), ''] + rules
@@ -0,0 +1,12 @@
+"""
+Risk levels on a (100 * sqrt(scale))² cave map
+"""
+import random
+from typing import List
+
+from adventofcode.generators.common import scaled_side, digit_grid
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    side = scaled_side(100, scale)
+    return digit_grid(rng, side, side, '123456789')
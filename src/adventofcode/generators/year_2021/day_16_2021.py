@@ -0,0 +1,50 @@
+"""
+BITS transmission of 250 * scale nested packets, encoded as hexadecimal. The outermost packet
+is a sum, so the transmission does not evaluate to zero
+"""
+import random
+from typing import List, Optional
+
+MAX_DEPTH = 12
+COMPARISONS = (5, 6, 7)
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    bits = _packet(rng, 250 * scale, 0, type_id=0)
+    bits += '0' * (-len(bits) % 4)
+    return [''.join(f'{int(bits[i:i + 4], 2):X}' for i in range(0, len(bits), 4))]
+
+
+def _packet(rng: random.Random, budget: int, depth: int, type_id: Optional[int] = None) -> str:
+    """
+    Returns the bits of a packet that contains budget packets, including itself
+    """
+    version = f'{rng.randrange(8):03b}'
+
+    if type_id is None and (budget == 1 or depth == MAX_DEPTH):
+        return version + '100' + _literal(rng.randrange(2 ** rng.randint(1, 24)))
+
+    if type_id is None and budget == 3 and rng.random() < 0.5:
+        type_id = rng.choice(COMPARISONS)
+        budgets = [1, 1]
+    else:
+        type_id = rng.choice((0, 1, 2, 3)) if type_id is None else type_id
+        children = rng.randint(1, min(budget - 1, 2047, max(3, int(budget ** 0.5))))
+        cuts = sorted(rng.sample(range(1, budget - 1), children - 1))
+        budgets = [end - start for start, end in zip([0] + cuts, cuts + [budget - 1])]
+
+    content = ''.join(_packet(rng, child, depth + 1) for child in budgets)
+
+    if len(content) < 2 ** 15 and rng.random() < 0.5:
+        header = '0' + f'{len(content):015b}'
+    else:
+        header = '1' + f'{len(budgets):011b}'
+
+    return version + f'{type_id:03b}' + header + content
+
+
+def _literal(value: int) -> str:
+    bits = f'{value:b}'
+    bits = '0' * (-len(bits) % 4) + bits
+    groups = [bits[i:i + 4] for i in range(0, len(bits), 4)]
+    return ''.join(('1' if i < len(groups) - 1 else '0') + group for i, group in enumerate(groups))
@@ -0,0 +1,20 @@
+"""
+Target area whose coordinates grow with the square root of scale. The x range always contains a
+triangular number, so the probe can drop straight down into the target
+"""
+import math
+import random
+from typing import List
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    factor = math.sqrt(scale)
+    n = math.isqrt(2 * round(rng.randint(150, 200) * factor))
+    triangular = n * (n + 1) // 2
+
+    x_1 = max(1, triangular - round(rng.randint(0, 20) * factor))
+    x_2 = triangular + round(rng.randint(10, 40) * factor)
+    y_1 = -round(rng.randint(100, 130) * factor)
+    y_2 = y_1 + round(rng.randint(25, 45) * factor)
+
+    return [f'target area: x={x_1}..{x_2}, y={y_1}..{y_2}']
@@ -0,0 +1,27 @@
+"""
+Homework of 100 * scale reduced snailfish numbers, nested at most four pairs deep
+"""
+import random
+from typing import List, Union
+
+SnailfishNumber = Union[int, List]
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    return [_format(_pair(rng, 1)) for _ in range(100 * scale)]
+
+
+def _pair(rng: random.Random, depth: int) -> List[SnailfishNumber]:
+    return [_element(rng, depth), _element(rng, depth)]
+
+
+def _element(rng: random.Random, depth: int) -> SnailfishNumber:
+    if depth < 4 and rng.random() < 0.75 - depth * 0.1:
+        return _pair(rng, depth + 1)
+    return rng.randint(0, 9)
+
+
+def _format(number: SnailfishNumber) -> str:
+    if isinstance(number, int):
+        return str(number)
+    return f'[{_format(number[0])},{_format(number[1])}]'
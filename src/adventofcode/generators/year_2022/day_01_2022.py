@@ -0,0 +1,17 @@
+"""
+Calories carried by 250 * scale elves
+"""
+import random
+from typing import List
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    lines = []
+
+    for elf in range(250 * scale):
+        if elf:
+            lines.append('')
+        items = rng.randint(1, 15)
+        lines.extend(str(rng.randint(1000, 60000 // items)) for _ in range(items))
+
+    return lines
@@ -0,0 +1,9 @@
+"""
+Rock paper scissors strategy guide with 2500 * scale rounds
+"""
+import random
+from typing import List
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    return [f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(2500 * scale)]
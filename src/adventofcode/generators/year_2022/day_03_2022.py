@@ -0,0 +1,33 @@
+"""
+300 * scale rucksacks in groups of three. Both compartments of a rucksack share exactly one item
+type and the rucksacks of a group share exactly one item type, their badge
+"""
+import random
+import string
+from typing import List
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    lines = []
+
+    for _ in range(100 * scale):
+        badge, *others = rng.sample(string.ascii_letters, 52)
+        # Every rucksack of the group gets its own item types, so the badge is the only common one
+        for pool in (others[:17], others[17:34], others[34:]):
+            lines.append(_rucksack(rng, pool + [badge], badge))
+
+    return lines
+
+
+def _rucksack(rng: random.Random, pool: List[str], badge: str) -> str:
+    duplicate, *rest = rng.sample(pool, len(pool))
+    size = rng.randint(8, 24)
+    compartments = []
+
+    # The compartments only share the duplicate, the badge has to be in one of them
+    for items in (rest[:len(rest) // 2], rest[len(rest) // 2:]):
+        required = [duplicate] + [badge] * (badge in items)
+        compartment = required + rng.choices(items, k=size - len(required))
+        compartments.append(''.join(rng.sample(compartment, size)))
+
+    return ''.join(compartments)
@@ -0,0 +1,18 @@
+"""
+1000 * scale pairs of section assignments
+"""
+import random
+from typing import List
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    lines = []
+
+    for _ in range(1000 * scale):
+        sections = []
+        for _ in range(2):
+            start = rng.randint(1, 99)
+            sections.append(f'{start}-{rng.randint(start, 99)}')
+        lines.append(','.join(sections))
+
+    return lines
@@ -0,0 +1,40 @@
+"""
+Drawing of nine stacks of up to 8 * scale crates, followed by 500 * scale moves. The moves never take
+more crates from a stack than it holds and leave a crate on top of every stack
+"""
+import random
+import string
+from typing import List
+
+STACKS = 9
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    heights = [rng.randint(1, 8 * scale) for _ in range(STACKS)]
+    stacks = [rng.choices(string.ascii_uppercase, k=height) for height in heights]
+
+    lines = []
+    for level in reversed(range(max(heights))):
+        row = ' '.join(f'[{stack[level]}]' if level < len(stack) else '   ' for stack in stacks)
+        lines.append(row.rstrip())
+    lines.append(' '.join(f' {i} ' for i in range(1, STACKS + 1)).rstrip())
+    lines.append('')
+
+    moves = []
+    for _ in range(500 * scale - STACKS):
+        source = rng.choice([i for i in range(STACKS) if heights[i]])
+        dest = rng.choice([i for i in range(STACKS) if i != source])
+        amount = rng.randint(1, min(heights[source], 3 * scale))
+        heights[source] -= amount
+        heights[dest] += amount
+        moves.append((amount, source, dest))
+
+    # Refill the stacks that ended up empty from the highest stack
+    for empty in [i for i in range(STACKS) if not heights[i]]:
+        highest = max(range(STACKS), key=lambda i: heights[i])
+        heights[highest] -= 1
+        heights[empty] += 1
+        moves.append((1, highest, empty))
+
+    lines.extend(f'move {amount} from {source + 1} to {dest + 1}' for amount, source, dest in moves)
+    return lines
@@ -0,0 +1,23 @@
+"""
+Datastream of 4096 * scale characters. The start-of-packet marker comes after about a quarter
+of the stream and the start-of-message marker after about three quarters
+"""
+import random
+import string
+from typing import List
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    length = 4096 * scale
+    packet = rng.randint(length // 5, length // 3)
+    message = rng.randint(2 * length // 3, 4 * length // 5)
+
+    # Streams of at most three and thirteen different characters cannot contain a marker
+    letters = rng.sample(string.ascii_lowercase, 13)
+    stream = rng.choices(letters[:3], k=packet - 4)
+    stream += rng.sample(letters[:7], 4)
+    stream += rng.choices(letters, k=message - len(stream) - 14)
+    stream += rng.sample(string.ascii_lowercase, 14)
+    stream += rng.choices(string.ascii_lowercase, k=length - len(stream))
+
+    return [''.join(stream)]
@@ -0,0 +1,69 @@
+"""
+Terminal transcript that browses a file system of 180 * scale directories and 300 * scale files.
+New directories are mostly created below recent ones, so the tree gets deeper as it grows,
+up to 8 + 4 * log2(scale) levels
+"""
+import random
+import string
+from typing import Dict, List, Optional, Set
+
+
+class _Directory:
+    def __init__(self, parent: Optional['_Directory']):
+        self.parent = parent
+        self.depth: int = parent.depth + 1 if parent is not None else 0
+        self.directories: Dict[str, '_Directory'] = {}
+        self.files: Dict[str, int] = {}
+
+    def entries(self) -> Set[str]:
+        return set(self.directories) | set(self.files)
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    root = _Directory(None)
+    directories = [root]
+    max_depth = 8 + 4 * (scale.bit_length() - 1)
+
+    for _ in range(180 * scale):
+        parent = directories[-rng.randint(1, min(len(directories), 10))]
+        while parent.depth >= max_depth:
+            parent = parent.parent  # type: ignore
+        directory = _Directory(parent)
+        parent.directories[_name(rng, parent)] = directory
+        directories.append(directory)
+
+    for _ in range(300 * scale):
+        parent = rng.choice(directories)
+        name = _name(rng, parent)
+        parent.files[f'{name}.{_random_word(rng, 3)}' if rng.random() < 0.6 else name] = rng.randint(1000, 330000)
+
+    lines = ['$ cd /']
+    _browse(root, lines)
+
+    # Leaves the transcript in the last directory, like the real transcripts
+    while lines[-1] == '$ cd ..':
+        lines.pop()
+
+    return lines
+
+
+def _browse(directory: _Directory, lines: List[str]) -> None:
+    lines.append('$ ls')
+    entries = [f'dir {name}' for name in directory.directories] + [f'{size} {name}' for name, size in directory.files.items()]
+    lines.extend(sorted(entries, key=lambda entry: entry.split()[1]))
+
+    for name, child in directory.directories.items():
+        lines.append(f'$ cd {name}')
+        _browse(child, lines)
+        lines.append('$ cd ..')
+
+
+def _name(rng: random.Random, parent: _Directory) -> str:
+    while True:
+        name = _random_word(rng, rng.randint(1, 8))
+        if name not in parent.entries():
+            return name
+
+
+def _random_word(rng: random.Random, length: int) -> str:
+    return ''.join(rng.choices(string.ascii_lowercase, k=length))
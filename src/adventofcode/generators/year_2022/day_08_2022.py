@@ -0,0 +1,12 @@
+"""
+Tree heights on a (99 * sqrt(scale))² grid
+"""
+import random
+from typing import List
+
+from adventofcode.generators.common import scaled_side, digit_grid
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    side = scaled_side(99, scale)
+    return digit_grid(rng, side, side)
@@ -0,0 +1,9 @@
+"""
+2000 * scale rope motions of mostly short distances
+"""
+import random
+from typing import List
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    return [f"{rng.choice('RLUD')} {rng.randint(1, 19 if rng.random() < 0.1 else 9)}" for _ in range(2000 * scale)]
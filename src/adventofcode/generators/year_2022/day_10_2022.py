@@ -0,0 +1,26 @@
+"""
+Program for the CRT that takes exactly 240 cycles, one for every pixel of the 40x6 screen. The screen
+has a fixed size, so the solution cannot handle longer programs and scale does not change the input
+"""
+import random
+from typing import List
+
+CYCLES = 240
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    lines = []
+    cycles = CYCLES
+    x = 1
+
+    while cycles:
+        if cycles >= 2 and rng.random() < 0.6:
+            value = rng.choice([value for value in range(-10, 11) if value and 0 <= x + value < 40])
+            x += value
+            lines.append(f'addx {value}')
+            cycles -= 2
+        else:
+            lines.append('noop')
+            cycles -= 1
+
+    return lines
@@ -0,0 +1,38 @@
+"""
+8 * scale monkeys with 1 to 8 items each. Only one monkey squares the worry level, otherwise
+the worry levels of the first part grow too large
+"""
+import random
+from typing import List
+
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23]
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    monkeys = 8 * scale
+    squares = rng.randrange(monkeys)
+    lines = []
+
+    for monkey in range(monkeys):
+        if monkey == squares:
+            operation = 'old * old'
+        elif rng.random() < 0.5:
+            operation = f'old * {rng.randint(2, 19)}'
+        else:
+            operation = f'old + {rng.randint(1, 8)}'
+
+        items = ', '.join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8)))
+        true_to, false_to = rng.sample([other for other in range(monkeys) if other != monkey], 2)
+
+        if monkey:
+            lines.append('')
+        lines.extend([
+            f'Monkey {monkey}:',
+            f'  Starting items: {items}',
+            f'  Operation: new = {operation}',
+            f'  Test: divisible by {rng.choice(PRIMES)}',
+            f'    If true: throw to monkey {true_to}',
+            f'    If false: throw to monkey {false_to}',
+        ])
+
+    return lines
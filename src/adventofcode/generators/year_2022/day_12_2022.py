@@ -0,0 +1,33 @@
+"""
+Heightmap of scale times 41 x 159 squares. The elevation rises towards the best signal location, by
+at most one between neighboring squares, so it can always be reached from the start, which lies
+in the lowest area. Some squares of elevation b are lowered to a
+"""
+import math
+import random
+from typing import List
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    rows = round(41 * math.sqrt(scale))
+    cols = round(159 * math.sqrt(scale))
+    start = (rng.randrange(rows), 0)
+    end = (rng.randrange(rows), rng.randrange(cols // 2, cols))
+
+    # Every band of width distance // 26 around the end is one elevation lower, the start lies in the lowest
+    width = (abs(start[0] - end[0]) + abs(start[1] - end[1])) // 26
+    lines = []
+
+    for row in range(rows):
+        line = []
+        for col in range(cols):
+            height = max(0, 25 - (abs(row - end[0]) + abs(col - end[1])) // width)
+            if height == 1 and rng.random() < 0.3:
+                height = 0
+            line.append(chr(ord('a') + height))
+        lines.append(''.join(line))
+
+    for (row, col), char in ((start, 'S'), (end, 'E')):
+        lines[row] = lines[row][:col] + char + lines[row][col + 1:]
+
+    return lines
@@ -0,0 +1,24 @@
+"""
+150 * scale pairs of packets, nested up to four lists deep
+"""
+import json
+import random
+from typing import List, Union
+
+Packet = Union[int, List]
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    lines = []
+
+    for pair in range(150 * scale):
+        if pair:
+            lines.append('')
+        lines.extend(json.dumps(_packet(rng, 0), separators=(',', ':')) for _ in range(2))
+
+    return lines
+
+
+def _packet(rng: random.Random, depth: int) -> List[Packet]:
+    return [_packet(rng, depth + 1) if depth < 4 and rng.random() < 0.3 else rng.randint(0, 10)
+            for _ in range(rng.randint(0, 5))]
@@ -0,0 +1,77 @@
+"""
+Scan of 150 * scale rock paths, about 170 * sqrt(scale) deep. The paths are cups and ledges within
+reach of the falling sand, and the first ledge lies right below the source of the sand. A scan is
+only returned when the sand of the first part eventually falls into the abyss instead of
+blocking the source, which would never end
+"""
+import math
+import random
+from typing import List, Optional, Set, Tuple
+
+SOURCE = 500
+
+Path = List[Tuple[int, int]]
+
+
+def generate(rng: random.Random, scale: int) -> List[str]:
+    depth = round(170 * math.sqrt(scale))
+
+    while True:
+        ledge_y = rng.randint(10, 20)
+        paths = [[(SOURCE - rng.randint(2, 6), ledge_y), (SOURCE + rng.randint(2, 6), ledge_y)]]
+
+        while len(paths) < 150 * scale:
+            # Spread evenly over the area the sand can reach, which widens with the depth
+            y = ledge_y + 2 + int((depth - ledge_y - 2) * math.sqrt(rng.random()))
+            x = rng.randint(SOURCE - y, SOURCE + y)
+            width = rng.randint(2, 12)
+
+            if rng.random() < 0.5:
+                height = rng.randint(2, 10)
+                paths.append([(x, y), (x, y + height), (x + width, y + height), (x + width, y)])
+            else:
+                paths.append([(x, y), (x + width, y)])
+
+        if _reaches_abyss(paths):
+            return [' -> '.join(f'{x},{y}' for x, y in path) for path in paths]
+
+
+def _reaches_abyss(paths: List[Path]) -> bool:
+    blocked = _rock(paths)
+    bottom = max(y for _, y in blocked)
+
+    while (SOURCE, 0) not in blocked:
+        resting = _drop_sand(blocked, bottom)
+        if resting is None:
+            return True
+        blocked.add(resting)
+
+    return False
+
+
+def _rock(paths: List[Path]) -> Set[Tuple[int, int]]:
+    rock: Set[Tuple[int, int]] = set()
+    for path in paths:
+        for (x_1, y_1), (x_2, y_2) in zip(path, path[1:]):
+            rock.update((x, y) for x in range(min(x_1, x_2), max(x_1, x_2) + 1)
+                        for y in range(min(y_1, y_2), max(y_1, y_2) + 1))
+
+    return rock
+
+
+def _drop_sand(blocked: Set[Tuple[int, int]], bottom: int) -> Optional[Tuple[int, int]]:
+    """
+    Returns where a unit of sand from the source comes to rest, or None when it falls into the abyss
+    """
+    x, y = SOURCE, 0
+    while y < bottom:
+        if (x, y + 1) not in blocked:
+            y += 1
+        elif (x - 1, y + 1) not in blocked:
+            x, y = x - 1, y + 1
+        elif (x + 1, y + 1) not in blocked:
+            x, y = x + 1, y + 1
+        else:
+            return x, y
+
+    return None
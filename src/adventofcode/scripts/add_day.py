@@ -3,8 +3,6 @@ import sys
 from argparse import ArgumentParser
 from typing import List, Tuple
 
-from requests import HTTPError  # noqa
-
 from adventofcode.config import ROOT_DIR
 from adventofcode.scripts.get_inputs import get_input
 from adventofcode.util.console import console
@@ -34,6 +32,8 @@ def verify_input_exists(year: int, day: int) -> None:
         console.print(f'Input data already exists for year {year} day {day}, skipping download')
         return
     except FileNotFoundError:
+        from requests import HTTPError  # importing requests is slow, it is only imported for a download
+
         try:
             get_input(year, day)
             console.print(f'Automatically downloaded input data for year {year} day {day}')
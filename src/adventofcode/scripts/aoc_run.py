@@ -0,0 +1,68 @@
+import argparse
+import json
+import sys
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+from adventofcode.util.daemon import DAEMON_SOCKET, send_request
+from adventofcode.util.output import output_format, result_record, get_writer
+
+
+def aoc_run():
+    """
+    Runs a day on the warm workers of aoc-daemon. The client only imports what it needs to talk
+    to the daemon, the solutions and the inputs are already loaded by the workers
+    """
+    args = _parse_args(sys.argv[1:])
+    parts = [args.part] if args.part else [1, 2]
+
+    try:
+        response = send_request({'op': 'run', 'year': args.year, 'day': args.day, 'parts': parts}, args.socket)
+    except ConnectionError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+    if response['status'] != 'ok':
+        print(response['error'], file=sys.stderr)
+        sys.exit(1)
+
+    results = response['results']
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    elif output_format() == 'jsonl':
+        for result in results:
+            get_writer().write(result_record(_as_result(result)))
+    else:
+        _print_results(results)
+
+
+def _as_result(result: Dict[str, Any]) -> Any:
+    """
+    Returns the result dictionary of the daemon with the attributes of a SolutionResult
+    """
+    memory = SimpleNamespace(**result['memory']) if result['memory'] else None
+    return SimpleNamespace(**{**result, 'memory': memory})
+
+
+def _print_results(results: List[Dict[str, Any]]) -> None:
+    # rich is only imported for printing, the JSON outputs do not need it
+    from adventofcode.util.helpers import print_result
+
+    for result in results:
+        print_result(_as_result(result))
+
+
+def _parse_args(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Run a solution on the warm workers of aoc-daemon')
+    parser.add_argument('year', type=int, help='The year of the exercise')
+    parser.add_argument('day', type=int, help='The day of the exercise')
+    parser.add_argument('part', type=int, nargs='?', choices=[1, 2], help='The part to run. Default is both')
+    parser.add_argument('--json', action='store_true', help='Output the results as JSON')
+    parser.add_argument('--socket', type=str, default=DAEMON_SOCKET,
+                        help='Path of the unix socket of the daemon. Default is .aoc_cache/daemon.sock or AOC_DAEMON_SOCKET')
+    return parser.parse_args(args)
+
+
+if __name__ == '__main__':
+    aoc_run()
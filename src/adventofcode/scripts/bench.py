@@ -0,0 +1,134 @@
+import argparse
+import json
+import os
+import sys
+from dataclasses import asdict
+from typing import Any, Dict, List
+
+from rich.table import Table
+
+from adventofcode.scripts.runner import PARTS, parse_input
+from adventofcode.util.benchmark import benchmark_part, calculate_stats
+from adventofcode.util.console import console
+from adventofcode.util.helpers import SolutionResult, collect_results
+from adventofcode.util.history import HISTORY_DB, record_results
+from adventofcode.util.input_helpers import get_input_for_day
+from adventofcode.util.module_helpers import get_full_module_from_year_day
+from adventofcode.util.profiling import format_bytes
+
+
+def bench():
+    args = _parse_args(sys.argv[1:])
+
+    if args.track_memory:
+        os.environ['AOC_TRACK_MEMORY'] = '1'
+
+    module = __import__(get_full_module_from_year_day(args.year, args.day), fromlist=['object'])
+
+    with collect_results(silent=True):
+        data = parse_input(module, get_input_for_day(args.year, args.day))
+
+    parts = [args.part] if args.part else [1, 2]
+    results: List[SolutionResult] = []
+    reports = [_bench_part(module, data, args.year, args.day, part, args.warmup, args.repeat, results) for part in parts]
+
+    if args.json:
+        print(json.dumps(reports, indent=2, default=str))
+    else:
+        _print_reports(reports)
+
+    if args.record:
+        recorded = record_results(results)
+
+        if not args.json:
+            console.print(f'Recorded {recorded} timings in {HISTORY_DB}')
+
+
+def _bench_part(module: Any, data: Any, year: int, day: int, part: int, warmup: int, repeat: int,
+                all_results: List[SolutionResult]) -> Dict[str, Any]:
+    report: Dict[str, Any] = {
+        'year': year,
+        'day': day,
+        'part': part,
+        'version': '',
+        'answer': None,
+        'status': 'ok',
+        'warmup': warmup,
+        'repeat': repeat,
+        'stats': None,
+        'memory': None,
+    }
+
+    func = getattr(module, PARTS[part - 1], None)
+
+    if func is None:
+        report['status'] = 'missing'
+        return report
+
+    results = benchmark_part(module, func, data, warmup, repeat)
+    all_results.extend(results)
+    failed = [result for result in results if result.status != 'ok']
+
+    if not results or failed:
+        report['status'] = failed[0].status if failed else 'not timed'
+        return report
+
+    report['version'] = results[0].version
+    report['answer'] = results[0].answer
+    report['stats'] = calculate_stats([result.duration for result in results]).as_dict()
+
+    memories = [result.memory for result in results if result.memory is not None]
+    if memories:
+        # The allocations are the same in every run, only the peak can differ
+        report['memory'] = {**asdict(memories[-1]), 'peak': max(memory.peak for memory in memories)}
+
+    return report
+
+
+def _print_reports(reports: List[Dict[str, Any]]) -> None:
+    track_memory = any(report['memory'] for report in reports)
+    table = Table(title='Benchmark (ms)')
+    columns = ['solution', 'answer', 'runs', 'min', 'median', 'p95', 'stdev', 'ops/sec']
+    for column in columns + (['peak memory'] if track_memory else []):
+        table.add_column(column, justify='left' if column in ('solution', 'answer') else 'right')
+
+    for report in reports:
+        solution = f'{report["year"]} day {report["day"]:02} part {report["part"]:02}'
+        if report['version']:
+            solution += f' {report["version"]}'
+
+        stats = report['stats']
+        if stats is None:
+            table.add_row(solution, f'[red]{report["status"]}')
+            continue
+
+        # ops/sec is only meaningful for sub-millisecond solutions
+        ops = f'{stats["ops_per_sec"]:,.0f}' if stats['median'] < 1 else ''
+        memory = [format_bytes(report['memory']['peak'])] if report['memory'] else []
+        table.add_row(solution, str(report['answer']).strip(), str(stats['runs']), f'{stats["min"]:.4f}',
+                      f'{stats["median"]:.4f}', f'{stats["p95"]:.4f}', f'{stats["stdev"]:.4f}', ops, *memory)
+
+    console.print(table)
+
+
+def _parse_args(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Benchmark a solution')
+    parser.add_argument('year', type=int, help='The year of the exercise')
+    parser.add_argument('day', type=int, help='The day of the exercise')
+    parser.add_argument('part', type=int, nargs='?', choices=[1, 2], help='The part to benchmark. Default is both')
+    parser.add_argument('--warmup', type=int, default=1, help='Amount of untimed warmup runs. Default is 1')
+    parser.add_argument('--repeat', type=int, default=10, help='Amount of timed runs. Default is 10')
+    parser.add_argument('--json', action='store_true', help='Output the results as JSON')
+    parser.add_argument('--record', action='store_true', help='Append the timings to the timing history')
+    parser.add_argument('--track-memory', action='store_true',
+                        help='Trace the peak memory and allocation sites, this slows the solutions down')
+    parsed = parser.parse_args(args)
+
+    if parsed.warmup < 0 or parsed.repeat < 1:
+        parser.error('--warmup cannot be negative and --repeat should be at least 1')
+
+    return parsed
+
+
+if __name__ == '__main__':
+    bench()
@@ -0,0 +1,196 @@
+import argparse
+import json
+import statistics
+import sys
+from typing import Any, Callable, Dict, List
+
+from rich.table import Table
+
+from adventofcode.scripts.runner import parse_input
+from adventofcode.util.benchmark import benchmark_part, bootstrap_interval, calculate_stats
+from adventofcode.util.console import console
+from adventofcode.util.helpers import SolutionResult, collect_results
+from adventofcode.util.input_helpers import get_input_for_day
+from adventofcode.util.registry import load_registry, part_versions
+
+
+def compare():
+    """
+    Runs every version of a part on the same input, checks that their answers agree and
+    reports the speed of every version relative to the baseline with confidence intervals.
+    Exits with status 1 when the answers differ or a version fails
+    """
+    args = _parse_args(sys.argv[1:])
+    entry = next((entry for entry in load_registry() if (entry.year, entry.day) == (args.year, args.day)), None)
+
+    if entry is None:
+        console.print(f'[red]there is no solution for {args.year} day {args.day:02}')
+        sys.exit(1)
+
+    versions = part_versions(entry, args.part)
+    if args.versions:
+        unknown = [version for version in args.versions if version not in versions]
+        if unknown:
+            console.print(f'[red]unknown versions {", ".join(unknown)}, available are {", ".join(versions)}')
+            sys.exit(1)
+        versions = {version: versions[version] for version in args.versions}
+
+    if args.baseline is not None and args.baseline not in versions:
+        console.print(f'[red]the baseline {args.baseline} is not one of the compared versions {", ".join(versions)}')
+        sys.exit(1)
+
+    if len(versions) < 2:
+        console.print(f'[yellow]{args.year} day {args.day:02} part {args.part:02} has no versions to compare')
+        sys.exit(1)
+
+    module = __import__(entry.module, fromlist=['object'])
+    funcs = {version: getattr(module, function) for version, function in versions.items()}
+
+    with collect_results(silent=True):
+        data = parse_input(module, get_input_for_day(args.year, args.day))
+
+    results = run_versions(module, funcs, data, args.warmup, args.repeat)
+    report = _build_report(args, versions, results)
+
+    if args.json:
+        print(json.dumps(report, indent=2, default=str))
+    else:
+        _print_report(report)
+
+    if not report['agree']:
+        sys.exit(1)
+
+
+def run_versions(module: Any, funcs: Dict[str, Callable[..., Any]], data: Any, warmup: int = 1,
+                 repeat: int = 20) -> Dict[str, List[SolutionResult]]:
+    """
+    Runs every version warmup + repeat times and returns the results of the repeated runs per version.
+    The runs are interleaved in a rotating order, so drift of the machine, like other load or
+    thermal throttling, affects all versions alike
+    """
+    results: Dict[str, List[SolutionResult]] = {version: [] for version in funcs}
+    order = list(funcs)
+
+    for i in range(warmup + repeat):
+        for version in order[i % len(order):] + order[:i % len(order)]:
+            run = benchmark_part(module, funcs[version], data, 0, 1)
+
+            if i >= warmup:
+                results[version].extend(run)
+
+    return results
+
+
+def _median_ratio(baseline: List[float], timings: List[float]) -> float:
+    return statistics.median(baseline) / statistics.median(timings)
+
+
+def _build_report(args: argparse.Namespace, versions: Dict[str, str],
+                  results: Dict[str, List[SolutionResult]]) -> Dict[str, Any]:
+    baseline = args.baseline or next(iter(versions))
+    timings = {version: [result.duration for result in runs if result.status == 'ok'] for version, runs in results.items()}
+    reports: List[Dict[str, Any]] = []
+
+    for version, runs in results.items():
+        report: Dict[str, Any] = {'version': version, 'function': versions[version], 'status': 'ok', 'answer': None,
+                                  'stats': None, 'median_interval': None, 'speedup': None, 'speedup_interval': None}
+        reports.append(report)
+        failed = [run for run in runs if run.status != 'ok']
+
+        if not runs or failed:
+            report['status'] = failed[0].status if failed else 'not timed'
+            continue
+
+        report['answer'] = runs[0].answer
+        report['stats'] = calculate_stats(timings[version]).as_dict()
+        report['median_interval'] = bootstrap_interval(statistics.median, timings[version], confidence=args.confidence)
+
+        if timings[baseline]:
+            report['speedup'] = _median_ratio(timings[baseline], timings[version])
+            if version != baseline:
+                report['speedup_interval'] = bootstrap_interval(_median_ratio, timings[baseline], timings[version],
+                                                                confidence=args.confidence)
+
+    answers = {str(report['answer']) for report in reports}
+    return {
+        'year': args.year,
+        'day': args.day,
+        'part': args.part,
+        'baseline': baseline,
+        'confidence': args.confidence,
+        'agree': len(answers) == 1 and all(report['status'] == 'ok' for report in reports),
+        'versions': reports,
+    }
+
+
+def _print_report(report: Dict[str, Any]) -> None:
+    confidence = f'{report["confidence"]:.0%}'
+    table = Table(title=f'{report["year"]} day {report["day"]:02} part {report["part"]:02} versions (ms)')
+    for column in ['version', 'answer', 'runs', 'median', f'{confidence} CI', 'speedup', f'{confidence} CI']:
+        table.add_column(column, justify='left' if column in ('version', 'answer') else 'right')
+
+    for version in report['versions']:
+        stats = version['stats']
+        if stats is None:
+            table.add_row(version['version'], f'[red]{version["status"]}')
+            continue
+
+        low, high = version['median_interval']
+        speedup = f'{version["speedup"]:.2f}x' if version['speedup'] is not None else ''
+        interval = f'{version["speedup_interval"][0]:.2f}x - {version["speedup_interval"][1]:.2f}x' \
+            if version['speedup_interval'] else ''
+        table.add_row(version['version'], str(version['answer']).strip(), str(stats['runs']), f'{stats["median"]:.4f}',
+                      f'{low:.4f} - {high:.4f}', speedup, interval)
+
+    console.print(table)
+
+    if not report['agree']:
+        answers = ', '.join(f'{version["version"]}={str(version["answer"]).strip()}' for version in report['versions'])
+        console.print(f'[red]The versions do not agree: {answers}')
+
+    _print_speedups(report)
+
+
+def _print_speedups(report: Dict[str, Any]) -> None:
+    """
+    Prints whether every version is significantly faster or slower than the baseline
+    """
+    for version in report['versions']:
+        if version['speedup_interval'] is None:
+            continue
+
+        low, high = version['speedup_interval']
+        if low > 1:
+            console.print(f'[green]{version["version"]} is {version["speedup"]:.2f}x faster than {report["baseline"]}')
+        elif high < 1:
+            console.print(f'[red]{version["version"]} is {1 / version["speedup"]:.2f}x slower than {report["baseline"]}')
+        else:
+            console.print(f'[yellow]{version["version"]} is not significantly faster or slower than {report["baseline"]}')
+
+
+def _parse_args(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Compare the speed and answers of the versions of a solution')
+    parser.add_argument('year', type=int, help='The year of the exercise')
+    parser.add_argument('day', type=int, help='The day of the exercise')
+    parser.add_argument('part', type=int, choices=[1, 2], help='The part to compare')
+    parser.add_argument('--versions', type=lambda value: value.split(','), default=None,
+                        help='Comma separated versions to compare. Default is all versions of the part')
+    parser.add_argument('--baseline', type=str, default=None,
+                        help='The version the others are compared to. Default is the unversioned solution')
+    parser.add_argument('--warmup', type=int, default=1, help='Amount of untimed warmup runs per version. Default is 1')
+    parser.add_argument('--repeat', type=int, default=20, help='Amount of timed runs per version. Default is 20')
+    parser.add_argument('--confidence', type=float, default=0.95,
+                        help='Confidence level of the bootstrapped intervals. Default is 0.95')
+    parser.add_argument('--json', action='store_true', help='Output the results as JSON')
+    parsed = parser.parse_args(args)
+
+    if parsed.warmup < 0 or parsed.repeat < 1:
+        parser.error('--warmup cannot be negative and --repeat should be at least 1')
+    if not 0 < parsed.confidence < 1:
+        parser.error('--confidence should be between 0 and 1')
+
+    return parsed
+
+
+if __name__ == '__main__':
+    compare()
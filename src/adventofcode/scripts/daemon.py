@@ -0,0 +1,217 @@
+import argparse
+import importlib
+import multiprocessing
+import os
+import socketserver
+import sys
+import threading
+import time
+from dataclasses import asdict
+from multiprocessing.pool import Pool
+from typing import Any, Dict, List, Optional, Tuple
+
+from adventofcode.scripts.runner import PARTS, _find_days, _run_day
+from adventofcode.util import input_archive
+from adventofcode.util.console import console
+from adventofcode.util.daemon import DAEMON_SOCKET, DaemonNotRunning, read_message, send_request, write_message
+from adventofcode.util.helpers import collect_results
+from adventofcode.util.input_helpers import get_input_for_day, get_input_path
+from adventofcode.util.module_helpers import get_full_module_from_year_day
+
+
+def aoc_daemon():
+    """
+    Starts a daemon with a pool of workers that have all solutions imported and all inputs
+    loaded, which runs the requests of aoc-run. Stops or shows the status of a running daemon
+    """
+    args = _parse_args(sys.argv[1:])
+
+    if args.action != 'start':
+        try:
+            response = send_request({'op': args.action}, args.socket)
+        except DaemonNotRunning as e:
+            console.print(f'[red]{e}')
+            sys.exit(1)
+
+        if args.action == 'status':
+            console.print(f'Daemon {response["pid"]} on {args.socket}: {response["workers"]} workers, '
+                          f'{response["requests"]} requests in {response["uptime"]:.0f} s')
+        return
+
+    _serve(args.socket, args.workers)
+
+
+def _serve(path: str, workers: int) -> None:
+    try:
+        send_request({'op': 'status'}, path)
+    except ConnectionError:
+        pass
+    else:
+        console.print(f'[red]a daemon is already listening on {path}')
+        sys.exit(1)
+
+    if os.path.exists(path):
+        os.remove(path)  # left behind by a daemon that was killed
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    # The workers warm up in the background, requests that arrive earlier wait for them
+    with multiprocessing.Pool(workers, initializer=_warm_worker) as pool:
+        console.print(f'Warming up {workers} workers, listening on {path}')
+
+        with DaemonServer(path, pool, workers) as server:
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                os.remove(path)
+
+    console.print('Stopped the daemon')
+
+
+class DaemonServer(socketserver.ThreadingUnixStreamServer):
+    """
+    Accepts the requests of the clients on a unix socket, every connection is handled in its
+    own thread, so a request waits only for a free worker
+    """
+    daemon_threads = True
+
+    def __init__(self, path: str, pool: Pool, workers: int):
+        self.pool = pool
+        self.workers = workers
+        self.started = time.time()
+        self.requests = 0
+        self._requests_lock = threading.Lock()  # every connection is dispatched on its own thread
+        super().__init__(path, DaemonRequestHandler)
+
+    def dispatch(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        op = message.get('op')
+
+        if op == 'run':
+            with self._requests_lock:
+                self.requests += 1
+            try:
+                results = self.pool.apply(_run_request, (message['year'], message['day'], message.get('parts', [1, 2])))
+            except Exception as e:
+                return {'status': 'error', 'error': str(e) or repr(e)}
+            return {'status': 'ok', 'results': results}
+
+        if op == 'status':
+            return {'status': 'ok', 'pid': os.getpid(), 'workers': self.workers, 'requests': self.requests,
+                    'uptime': time.time() - self.started}
+
+        if op == 'stop':
+            # shutdown waits for serve_forever to return, which is waiting for this request
+            threading.Thread(target=self.shutdown).start()
+            return {'status': 'ok'}
+
+        return {'status': 'error', 'error': f'unknown operation {op!r}'}
+
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        message = read_message(self.rfile)
+
+        if message is not None:
+            write_message(self.wfile, self.server.dispatch(message))  # type: ignore
+
+
+# The modules and input lines of a worker, with the modification time of their file
+_modules: Dict[Tuple[int, int], Tuple[Any, int]] = {}
+_inputs: Dict[Tuple[int, int], Tuple[List[str], Optional[int]]] = {}
+
+
+def _warm_worker() -> None:
+    """
+    Imports every solution and loads every input, so the first request of a day is fast as well
+    """
+    for year, day, _ in _find_days():
+        try:
+            _load_module(year, day)
+            _load_input(year, day)
+        except Exception:
+            pass  # reported when the day is requested
+
+
+def _load_module(year: int, day: int) -> Any:
+    """
+    Returns the module of the day, which is reloaded when its file changed since it was imported
+    """
+    cached = _modules.get((year, day))
+
+    if cached is None:
+        module = importlib.import_module(get_full_module_from_year_day(year, day))
+    elif os.stat(cached[0].__file__).st_mtime_ns != cached[1]:
+        module = importlib.reload(cached[0])
+    else:
+        return cached[0]
+
+    _modules[(year, day)] = module, os.stat(module.__file__).st_mtime_ns
+    return module
+
+
+def _input_version(year: int, day: int) -> Optional[int]:
+    for path in (get_input_path(year, day), input_archive.INPUTS_ARCHIVE):
+        try:
+            return os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            continue
+
+    return None
+
+
+def _load_input(year: int, day: int) -> List[str]:
+    """
+    Returns the input lines of the day, which are read again when the input file changed
+    """
+    version = _input_version(year, day)
+    cached = _inputs.get((year, day))
+
+    if cached is None or cached[1] != version:
+        if cached is not None:
+            input_archive.close_archive()  # the archive is checked for changed inputs when it is opened
+        cached = get_input_for_day(year, day), version
+        _inputs[(year, day)] = cached
+
+    return cached[0]
+
+
+def _run_request(year: int, day: int, parts: List[int]) -> List[Dict[str, Any]]:
+    """
+    Runs the parts of the day in a worker and returns the results as dictionaries
+    """
+    try:
+        module = _load_module(year, day)
+    except ModuleNotFoundError:
+        raise LookupError(f'there is no solution for {year} day {day:02}')
+
+    try:
+        lines = _load_input(year, day)
+    except FileNotFoundError:
+        raise LookupError(f'the input of {year} day {day:02} is not found')
+
+    with collect_results(silent=True) as results:
+        # Parts without a parse hook get the lines themselves, which some of them modify
+        _run_day(module, year, day, [PARTS[part - 1] for part in parts], lines.copy())
+
+    return [asdict(result) for result in results]
+
+
+def _parse_args(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Run the solutions on warm workers, see aoc-run')
+    parser.add_argument('action', nargs='?', choices=['start', 'stop', 'status'], default='start',
+                        help='Start the daemon in the foreground, or stop or show the running daemon. Default is start')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Amount of worker processes. Default is the amount of cores')
+    parser.add_argument('--socket', type=str, default=DAEMON_SOCKET,
+                        help='Path of the unix socket. Default is .aoc_cache/daemon.sock or AOC_DAEMON_SOCKET')
+    parsed = parser.parse_args(args)
+
+    if parsed.workers < 1:
+        parser.error('--workers should be at least 1')
+
+    return parsed
+
+
+if __name__ == '__main__':
+    aoc_daemon()
@@ -0,0 +1,54 @@
+import argparse
+import os
+import sys
+from typing import List
+
+from adventofcode.generators import generate_input
+from adventofcode.util.console import console
+
+
+def gen_input():
+    """
+    Generates a synthetic input of arbitrary size for a day, to find out how a solution scales
+    """
+    args = _parse_args(sys.argv[1:])
+
+    try:
+        data = generate_input(args.year, args.day, args.scale, args.seed)
+    except ValueError as e:
+        console.print(f'[red]{e}')
+        sys.exit(1)
+
+    if args.output is None:
+        sys.stdout.write(data)
+        return
+
+    directory = os.path.dirname(args.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with open(args.output, 'w') as f:
+        f.write(data)
+
+    console.print(f'Generated {data.count(chr(10))} lines ({len(data) / 1024:.1f} KiB) for {args.year} day {args.day:02} '
+                  f'into {args.output}')
+
+
+def _parse_args(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Generate a large synthetic input for a day')
+    parser.add_argument('year', type=int, help='The year of the exercise')
+    parser.add_argument('day', type=int, help='The day of the exercise')
+    parser.add_argument('--scale', type=int, default=1,
+                        help='Size of the input, 1 is about the size of the real input. Default is 1')
+    parser.add_argument('--seed', type=int, default=None, help='Seed of the generator, the same seed gives the same input')
+    parser.add_argument('--output', type=str, default=None, help='File to write the input to. Default is stdout')
+    parsed = parser.parse_args(args)
+
+    if parsed.scale < 1:
+        parser.error('--scale should be at least 1')
+
+    return parsed
+
+
+if __name__ == '__main__':
+    gen_input()
@@ -3,30 +3,37 @@ import re
 from typing import Dict
 
 from adventofcode.config import ROOT_DIR
-from adventofcode.util.module_helpers import get_functions_from_day_file, get_full_day_paths, get_full_year_paths, clean_day, clean_year
+from adventofcode.util.registry import load_registry
 
 
 YearDayType = Dict[int, Dict[int, Dict[str, bool]]]
 
 
 def generate_readme():
+    """
+    Updates the completed section and the star badge of the README. The completed days come
+    from the registry, so only changed day files are parsed, and the README is only written
+    when its content changes
+    """
     path = os.path.join(ROOT_DIR, '../../README.md')
     readme_file = os.path.abspath(path)
 
     with open(readme_file) as f:
         current_readme = f.read()
 
+    found = _find_completed_days()
     readme = _replace_between_tags(
         current_readme,
-        _create_completed_text(),
+        _create_completed_text(found),
         '<!-- start completed section -->',
         '<!-- end completed section -->'
     )
 
-    readme = _update_stars(readme)
+    readme = _update_stars(readme, found)
 
-    with open(readme_file, 'w') as f:
-        f.write(readme)
+    if readme != current_readme:
+        with open(readme_file, 'w') as f:
+            f.write(readme)
 
 
 def _replace_between_tags(readme: str, content: str, start: str, end: str) -> str:
@@ -40,8 +47,8 @@ def _replace_between_tags(readme: str, content: str, start: str, end: str) -> st
     )
 
 
-def _update_stars(readme: str) -> str:
-    star_count = _count_stars()
+def _update_stars(readme: str, found: YearDayType) -> str:
+    star_count = _count_stars(found)
 
     return re.sub(
         pattern=r'&message=\d+',
@@ -51,14 +58,11 @@ def _update_stars(readme: str) -> str:
     )
 
 
-def _count_stars() -> int:
-    found = _find_completed_days()
+def _count_stars(found: YearDayType) -> int:
     return sum([val for days in found.values() for parts in days.values() for val in parts.values()])
 
 
-def _create_completed_text() -> str:
-    found = _find_completed_days()
-
+def _create_completed_text(found: YearDayType) -> str:
     text = ['## Completed ⭐️']
     for year, days in found.items():
         text.append(f'### {year}')
@@ -74,23 +78,14 @@ def _create_completed_text() -> str:
 
 def _find_completed_days() -> YearDayType:
     """
-    Loops through all the year directories, all the day files
+    Looks up all the day files in the registry
     and checks if the file contains functions 'part_one' and 'part_two'
 
     Returns the results as a Dict
     """
     items: YearDayType = {}
 
-    for year_path in get_full_year_paths():
-        year = clean_year(year_path)
-        items[year] = {}
-
-        for day_file in get_full_day_paths(year_path):
-            day = clean_day(day_file)
-            items[year][day] = {}
-            funcs = get_functions_from_day_file(day_file)
-
-            items[year][day]['part_one'] = 'part_one' in funcs
-            items[year][day]['part_two'] = 'part_two' in funcs
+    for entry in load_registry():
+        items.setdefault(entry.year, {})[entry.day] = entry.parts
 
     return items
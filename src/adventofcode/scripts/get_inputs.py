@@ -1,45 +1,215 @@
+import argparse
+import functools
 import os
-
-import requests  # noqa
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
 
 from adventofcode.config import ROOT_DIR
+from adventofcode.util.console import console
+from adventofcode.util.selection import parse_selection
+
+if TYPE_CHECKING:
+    import requests  # noqa
+
+BASE_URL = os.environ.get('AOC_BASE_URL', 'https://adventofcode.com')
+USER_AGENT = 'https://github.com/MushroomMaula/adventofcode'
+INPUTS_DIR = os.path.join(ROOT_DIR, 'inputs')
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
 
 
 def get_input(year: int, day: int):
     session = _read_session()
-    data = _download_input(year, day, session)
+
+    with _create_client(session) as client:
+        data = _download_input(year, day, session, client)
+
     _save_input(data, year, day)
 
 
-def _download_input(year: int, day: int, session: str) -> bytes:
+def fetch_inputs():
+    """
+    Downloads the inputs of multiple days over a single connection pool,
+    skipping the inputs that already exist
+    """
+    args = _parse_args(sys.argv[1:])
+
+    try:
+        session = _read_session()
+    except FileNotFoundError:
+        console.print('[red]Could not read the session cookie: .session not set correctly')
+        sys.exit(2)
+
+    statuses = fetch_all(args.year, sorted(args.days), session, concurrency=args.concurrency, interval=args.interval,
+                         retries=args.retries, force=args.force)
+
+    for day, status in statuses.items():
+        color = 'red' if status.startswith('failed') else 'green' if status == 'downloaded' else 'blue'
+        console.print(f'[blue]{args.year} day {day:02}: [{color}]{status}')
+
+    if any(status.startswith('failed') for status in statuses.values()):
+        sys.exit(1)
+
+
+def fetch_all(year: int, days: Iterable[int], session: str, concurrency: int = 4, interval: float = 1.0,
+              retries: int = 3, backoff: float = 1.0, force: bool = False, base_url: Optional[str] = None,
+              inputs_dir: str = INPUTS_DIR) -> Dict[int, str]:
+    """
+    Downloads the inputs of the days on concurrency threads that share one requests session.
+    Requests are started at least interval seconds apart, transient failures are retried with
+    exponential backoff. Returns the status per day: downloaded, skipped or failed: reason
+    """
+    import requests  # importing requests is slow, it is only imported for a download
+
+    statuses: Dict[int, str] = {}
+    todo = []
+
+    for day in days:
+        if not force and os.path.exists(_input_path(year, day, inputs_dir)):
+            statuses[day] = 'skipped'
+        else:
+            todo.append(day)
+
+    client = _create_client(session, concurrency)
+    limiter = RateLimiter(interval)
+
+    def fetch(day: int) -> str:
+        try:
+            data = _download_input(year, day, session, client, limiter, retries, backoff, base_url)
+        except requests.RequestException as e:
+            return f'failed: {e}'
+
+        try:
+            _save_input(data, year, day, inputs_dir)
+        except OSError as e:
+            return f'failed: {e}'
+
+        return 'downloaded'
+
+    with client, ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+        statuses.update(zip(todo, executor.map(fetch, todo)))
+
+    return dict(sorted(statuses.items()))
+
+
+class RateLimiter:
+    """
+    Makes sure calls to wait return at least interval seconds apart, across threads
+    """
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+
+        if start > now:
+            time.sleep(start - now)
+
+
+def _create_client(session: str, concurrency: int = 1) -> 'requests.Session':
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    client = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(concurrency, 1))
+    client.mount('https://', adapter)
+    client.mount('http://', adapter)
+    client.headers['User-Agent'] = USER_AGENT
+    client.cookies.set('session', session)
+    return client
+
+
+def _download_input(year: int, day: int, session: str, client: Optional['requests.Session'] = None,
+                    limiter: Optional[RateLimiter] = None, retries: int = 0, backoff: float = 1.0,
+                    base_url: Optional[str] = None) -> bytes:
     """
     Downloads the input as text from the advent of code site
     """
-    cookies = {'session': session}
-    url = f'https://adventofcode.com/{year}/day/{day}/input'
-    resp = requests.get(
-        url,
-        cookies=cookies,
-        headers={
-            "User-Agent": "https://github.com/MushroomMaula/adventofcode"
-        })
+    import requests
+
+    url = f'{base_url or BASE_URL}/{year}/day/{day}/input'
+    client = client or _create_client(session)
+
+    for attempt in range(retries):
+        try:
+            resp = _get(client, url, limiter)
+        except (requests.ConnectionError, requests.Timeout):
+            time.sleep(backoff * 2 ** attempt)
+            continue
+
+        if resp.status_code not in RETRY_STATUSES:
+            resp.raise_for_status()
+            return resp.content  # type: ignore
+
+        retry_after = resp.headers.get('Retry-After', '')
+        time.sleep(float(retry_after) if retry_after.isdigit() else backoff * 2 ** attempt)
+
+    # The last attempt is not retried, so its error is raised
+    resp = _get(client, url, limiter)
     resp.raise_for_status()
     return resp.content  # type: ignore
 
 
-def _save_input(data: bytes, year: int, day: int) -> None:
-    inputs_path = os.path.join(ROOT_DIR, 'inputs')
+def _get(client: 'requests.Session', url: str, limiter: Optional[RateLimiter] = None) -> 'requests.Response':
+    if limiter is not None:
+        limiter.wait()
 
-    if not os.path.exists((year_path := os.path.join(inputs_path, str(year)))):
-        os.mkdir(year_path)
+    return client.get(url, timeout=30)
 
-    with open(os.path.join(year_path, f'day_{day:02}.txt'), 'wb') as file:
+
+def _input_path(year: int, day: int, inputs_dir: str = INPUTS_DIR) -> str:
+    return os.path.join(inputs_dir, str(year), f'day_{day:02}.txt')
+
+
+def _save_input(data: bytes, year: int, day: int, inputs_dir: str = INPUTS_DIR) -> None:
+    """
+    Writes the input to a temporary file first, so an interrupted download never leaves a partial input
+    """
+    path = _input_path(year, day, inputs_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+
+    with open(temp_path, 'wb') as file:
         file.write(data)
 
+    os.replace(temp_path, path)
+
 
+@functools.lru_cache(maxsize=None)
 def _read_session():
     target = os.path.join(ROOT_DIR, '../../.session')
     path = os.path.abspath(target)
 
     with open(path) as f:
-        return f.read()
+        return f.read().strip()
+
+
+def _parse_args(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Download the inputs of multiple days')
+    parser.add_argument('--year', type=int, required=True, help='The year of the exercises')
+    parser.add_argument('--days', type=parse_selection, default=set(range(1, 26)),
+                        help='The days to download, for example 1-25 or 1,3,5-7. Default is all days')
+    parser.add_argument('--concurrency', type=int, default=4, help='Amount of concurrent downloads. Default is 4')
+    parser.add_argument('--interval', type=float, default=1.0,
+                        help='Minimum amount of seconds between the start of two requests. Default is 1')
+    parser.add_argument('--retries', type=int, default=3,
+                        help='Amount of retries of transient failures, with exponential backoff. Default is 3')
+    parser.add_argument('--force', action='store_true', help='Download inputs that already exist again')
+    parsed = parser.parse_args(args)
+
+    if parsed.concurrency < 1 or parsed.interval < 0 or parsed.retries < 0:
+        parser.error('--concurrency should be at least 1, --interval and --retries cannot be negative')
+
+    return parsed
+
+
+if __name__ == '__main__':
+    fetch_inputs()
@@ -0,0 +1,33 @@
+import argparse
+import os
+import sys
+from typing import List
+
+from adventofcode.util.console import console
+from adventofcode.util.input_archive import INPUTS_ARCHIVE, INPUTS_DIR, build_archive
+
+
+def pack_inputs():
+    """
+    Packs all input files into a single compressed, indexed archive, which
+    get_input_for_day reads from instead of the separate input files
+    """
+    args = _parse_args(sys.argv[1:])
+    entries = build_archive(args.output, INPUTS_DIR, args.level)
+
+    size = sum(entry.size for entry in entries)
+    packed = os.path.getsize(args.output)
+    console.print(f'Packed {len(entries)} inputs ({size / 1024:.1f} KiB) into {args.output} ({packed / 1024:.1f} KiB)')
+
+
+def _parse_args(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Pack all inputs into a single compressed archive')
+    parser.add_argument('--output', type=str, default=INPUTS_ARCHIVE,
+                        help='Path of the archive. Default is inputs/inputs.pack or AOC_INPUTS_ARCHIVE')
+    parser.add_argument('--level', type=int, default=9, choices=range(0, 10), metavar='{0-9}',
+                        help='zlib compression level. Default is 9')
+    return parser.parse_args(args)
+
+
+if __name__ == '__main__':
+    pack_inputs()
@@ -0,0 +1,194 @@
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from rich.table import Table
+
+from adventofcode.config import ROOT_DIR
+from adventofcode.scripts.perf_history import sparkline
+from adventofcode.util.console import console
+from adventofcode.util.input_helpers import get_input_path
+
+PROBE_SCRIPT = os.path.join(ROOT_DIR, 'scripts', 'perf_probe.py')
+
+
+@dataclass
+class Measurement:
+    revision: str
+    subject: str
+    median: Optional[float] = None
+    error: Optional[str] = None
+
+
+def perf_bisect():
+    args = _parse_args(sys.argv[1:])
+    repo = _git(ROOT_DIR, 'rev-parse', '--show-toplevel')
+    revisions = _git(repo, 'rev-list', '--reverse', '--ancestry-path', f'{args.good}..{args.bad}').split()
+
+    if not revisions:
+        console.print(f'[red]{args.bad} is not a descendant of {args.good}')
+        sys.exit(2)
+
+    input_file = get_input_path(args.year, args.day)
+    measurements: Dict[str, Measurement] = {}
+
+    def measure(revision: str) -> Measurement:
+        if revision not in measurements:
+            measurements[revision] = _measure_revision(repo, revision, args.year, args.day, args.part,
+                                                       input_file, args.repeat)
+            _print_measurement(measurements[revision])
+        return measurements[revision]
+
+    good = measure(_git(repo, 'rev-parse', args.good))
+    bad = measure(revisions[-1])
+
+    if good.median is None or bad.median is None:
+        console.print('[red]the good and bad revisions should both be measurable')
+        sys.exit(2)
+
+    threshold = args.threshold if args.threshold is not None else (good.median + bad.median) / 2
+    console.print(f'Revisions slower than {threshold:.2f} ms are bad')
+
+    if good.median > threshold or bad.median <= threshold:
+        console.print('[red]the good revision should be faster than the threshold and the bad revision slower')
+        sys.exit(2)
+
+    def is_bad(revision: str) -> Optional[bool]:
+        median = measure(revision).median
+        return None if median is None else median > threshold
+
+    first_bad = bisect_revisions(revisions, is_bad)
+    _print_curve([good.revision] + revisions, measurements, threshold)
+
+    if first_bad is None:
+        console.print('[red]could not determine the first slow commit, too many revisions could not be measured')
+        sys.exit(1)
+
+    culprit = measurements[revisions[first_bad]]
+    console.print(f'First slow commit: [bold]{culprit.revision[:10]}[/bold] {culprit.subject}')
+
+
+def bisect_revisions(revisions: List[str], is_bad: Callable[[str], Optional[bool]]) -> Optional[int]:
+    """
+    Finds the index of the first bad revision, assuming the last revision is bad and that
+    every revision after a bad revision is bad as well. is_bad returns None for revisions
+    that cannot be measured, these are skipped like `git bisect skip` does
+    """
+    low, high = 0, len(revisions) - 1  # revisions[high] is known to be bad
+    skipped = set()
+
+    while low < high:
+        candidates = [i for i in range(low, high) if i not in skipped]
+        if not candidates:
+            return None
+
+        # Probe the candidate closest to the middle of the range
+        middle = (low + high) // 2
+        index = min(candidates, key=lambda i: abs(i - middle))
+        verdict = is_bad(revisions[index])
+
+        if verdict is None:
+            skipped.add(index)
+        elif verdict:
+            high = index
+        else:
+            low = index + 1
+
+    return high
+
+
+def _measure_revision(repo: str, revision: str, year: int, day: int, part: int, input_file: str,
+                      repeat: int) -> Measurement:
+    """
+    Checks out the revision in a temporary worktree and times the solution there. A revision
+    that cannot be checked out is returned as a measurement with an error, so it is skipped
+    """
+    worktree = tempfile.mkdtemp(prefix='aoc-bisect-')
+    added = False
+
+    try:
+        subject = _git(repo, 'log', '-1', '--format=%s', revision)
+        _git(repo, 'worktree', 'add', '--detach', worktree, revision)
+        added = True
+
+        env = {**os.environ, 'PYTHONPATH': os.path.join(worktree, 'src')}
+        output = subprocess.run(
+            [sys.executable, PROBE_SCRIPT, str(year), str(day), str(part), input_file, str(repeat)],
+            cwd=worktree, env=env, capture_output=True, text=True,
+        )
+    except subprocess.CalledProcessError as e:
+        return Measurement(revision, '', error=e.stderr.strip() or f'git {e.cmd[1]} failed')
+    finally:
+        if added:
+            _remove_worktree(repo, worktree)
+        shutil.rmtree(worktree, ignore_errors=True)
+
+    try:
+        result = json.loads(output.stdout.strip().splitlines()[-1])
+    except (IndexError, ValueError):
+        return Measurement(revision, subject, error=output.stderr.strip() or 'no output')
+
+    return Measurement(revision, subject, result.get('median'), result.get('error'))
+
+
+def _remove_worktree(repo: str, worktree: str) -> None:
+    try:
+        _git(repo, 'worktree', 'remove', '--force', worktree)
+    except subprocess.CalledProcessError:
+        # The directory is removed anyway, prune forgets the worktree afterwards
+        shutil.rmtree(worktree, ignore_errors=True)
+        subprocess.run(['git', 'worktree', 'prune'], cwd=repo, capture_output=True)
+
+
+def _print_measurement(measurement: Measurement) -> None:
+    if measurement.median is None:
+        console.print(f'  {measurement.revision[:10]} [red]skipped: {measurement.error}')
+    else:
+        console.print(f'  {measurement.revision[:10]} {measurement.median:.2f} ms')
+
+
+def _print_curve(revisions: List[str], measurements: Dict[str, Measurement], threshold: float) -> None:
+    measured = [measurements[revision] for revision in revisions if revision in measurements]
+    timed = [measurement.median for measurement in measured if measurement.median is not None]
+
+    table = Table(title=f'Timing curve {sparkline(timed)}')
+    for column in ('revision', 'median (ms)', 'verdict', 'subject'):
+        table.add_column(column, justify='right' if column == 'median (ms)' else 'left')
+
+    for measurement in measured:
+        if measurement.median is None:
+            table.add_row(measurement.revision[:10], '', '[yellow]skip', measurement.subject)
+        else:
+            verdict = '[red]bad' if measurement.median > threshold else '[green]good'
+            table.add_row(measurement.revision[:10], f'{measurement.median:.2f}', verdict, measurement.subject)
+
+    console.print(table)
+
+
+def _git(repo: str, *args: str) -> str:
+    output = subprocess.run(['git', *args], cwd=repo, capture_output=True, text=True, check=True)
+    return output.stdout.strip()
+
+
+def _parse_args(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Find the commit that made a solution slower')
+    parser.add_argument('year', type=int, help='The year of the exercise')
+    parser.add_argument('day', type=int, help='The day of the exercise')
+    parser.add_argument('part', type=int, choices=[1, 2], help='The part of the exercise')
+    parser.add_argument('--good', required=True, help='A revision in which the solution is fast')
+    parser.add_argument('--bad', default='HEAD', help='A revision in which the solution is slow. Default is HEAD')
+    parser.add_argument('--threshold', type=float,
+                        help='Median time in ms above which a revision is bad. '
+                             'Default is halfway between the good and bad revision')
+    parser.add_argument('--repeat', type=int, default=5, help='Amount of timed runs per revision. Default is 5')
+    return parser.parse_args(args)
+
+
+if __name__ == '__main__':
+    perf_bisect()
@@ -0,0 +1,79 @@
+import argparse
+import sys
+from typing import List
+
+from rich.table import Table
+
+from adventofcode.util.console import console
+from adventofcode.util.history import HISTORY_DB, Trend, load_trends
+
+SPARKS = '▁▂▃▄▅▆▇█'
+
+
+def perf_history():
+    args = _parse_args(sys.argv[1:])
+    trends = load_trends(args.db, args.window, args.threshold / 100, args.year, args.day)
+
+    if not trends:
+        console.print(f'No timings recorded in {args.db}, use run-all --record or bench --record')
+        return
+
+    _print_trends(trends, args.points)
+    regressions = [trend for trend in trends if trend.is_regression]
+
+    for trend in regressions:
+        console.print(f'[red]{_solution_name(trend)} got {trend.change:.0%} slower than its baseline')
+
+    if regressions:
+        sys.exit(1)
+
+
+def sparkline(points: List[float]) -> str:
+    """
+    Renders the points as a line of unicode block characters
+    """
+    low, high = min(points), max(points)
+    if high == low:
+        return SPARKS[0] * len(points)
+
+    return ''.join(SPARKS[round((point - low) / (high - low) * (len(SPARKS) - 1))] for point in points)
+
+
+def _solution_name(trend: Trend) -> str:
+    year, day, part, version = trend.solution
+    name = f'{year} day {day:02} ' + (f'part {part:02}' if part else 'parse')
+    return f'{name} {version}' if version else name
+
+
+def _print_trends(trends: List[Trend], points: int) -> None:
+    table = Table(title='Timing history (ms)')
+    for column in ('solution', 'runs', 'trend', 'baseline', 'latest', 'change'):
+        table.add_column(column, justify='left' if column in ('solution', 'trend') else 'right')
+
+    for trend in trends:
+        baseline = f'{trend.baseline:.2f}' if trend.baseline is not None else ''
+        change = f'{trend.change:+.0%}' if trend.change is not None else ''
+        if trend.is_regression:
+            change = f'[red]{change}'
+
+        table.add_row(_solution_name(trend), str(len(trend.points)), sparkline(trend.points[-points:]), baseline,
+                      f'{trend.latest:.2f}', change)
+
+    console.print(table)
+
+
+def _parse_args(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Show the timing history of the solutions')
+    parser.add_argument('year', type=int, nargs='?', help='Only show solutions of this year')
+    parser.add_argument('day', type=int, nargs='?', help='Only show solutions of this day')
+    parser.add_argument('--db', default=HISTORY_DB, help=f'The history database. Default is {HISTORY_DB}')
+    parser.add_argument('--window', type=int, default=5,
+                        help='Amount of previous runs that make up the baseline. Default is 5')
+    parser.add_argument('--threshold', type=float, default=10,
+                        help='Percentage a solution can be slower than its baseline before it is flagged. Default is 10')
+    parser.add_argument('--points', type=int, default=20, help='Amount of runs shown in the trend. Default is 20')
+    return parser.parse_args(args)
+
+
+if __name__ == '__main__':
+    perf_history()
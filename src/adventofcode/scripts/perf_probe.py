@@ -0,0 +1,59 @@
+"""
+Times a single solution of whatever adventofcode package is first on the PYTHONPATH.
+
+Used by perf-bisect to time solutions in worktrees of older revisions, so it should
+only depend on the standard library and on parts of the package that exist in every revision.
+
+Usage: python perf_probe.py YEAR DAY PART INPUT_FILE REPEAT
+Prints a JSON object with the timings in ms, or with the error that occurred.
+"""
+import io
+import json
+import statistics
+import sys
+import time
+from contextlib import redirect_stdout
+from copy import deepcopy
+from typing import Any, Dict
+
+
+def probe(year: int, day: int, part: int, input_file: str, repeat: int) -> Dict[str, Any]:
+    from adventofcode.util.input_helpers import _get_input
+
+    module = __import__(f'adventofcode.year_{year}.day_{day:02}_{year}', fromlist=['object'])
+    func = getattr(module, ('part_one', 'part_two')[part - 1])
+    parse = getattr(module, 'parse', None)
+    copy_input = parse is None or getattr(module, 'COPY_PARSED_INPUT', False)
+    output = io.StringIO()
+
+    with redirect_stdout(output):
+        data = _get_input(input_file)
+        data = parse(data) if parse is not None else data
+
+        timings = []
+        answer = None
+        for _ in range(repeat + 1):  # the first run is a warmup run
+            run_data = deepcopy(data) if copy_input else data
+            start = time.perf_counter()
+            answer = func(run_data)
+            timings.append((time.perf_counter() - start) * 1000)
+
+    # solution_timer swallows the exceptions of a solution and returns None instead
+    if answer is None:
+        raise ValueError(f'part {part} returned no answer: {output.getvalue().strip()[-200:]}')
+
+    return {'timings': timings[1:], 'median': statistics.median(timings[1:]), 'answer': str(answer)}
+
+
+def main(args):
+    year, day, part, input_file, repeat = args
+    try:
+        result = probe(int(year), int(day), int(part), input_file, int(repeat))
+    except Exception as e:  # any failure means the revision cannot be measured
+        result = {'error': repr(e)}
+
+    print(json.dumps(result))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
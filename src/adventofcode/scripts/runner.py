@@ -1,51 +1,394 @@
+import argparse
+import multiprocessing
+import os
+import signal
+import sys
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from copy import deepcopy
+from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext
+from typing import Any, List, Optional, Sequence, Set, Tuple
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None  # type: ignore
+
 from adventofcode import config
 from adventofcode.util.console import console
-from adventofcode.util.input_helpers import get_input_for_day
-from adventofcode.util.module_helpers import get_full_year_paths, clean_year, get_full_day_paths, year_dir_from_path, \
-    get_full_module_from_day_file, clean_day
+from adventofcode.util.helpers import SolutionResult, collect_results, emit_result, PARSE_PART
+from adventofcode.util.history import HISTORY_DB, record_results
+from adventofcode.util.input_helpers import get_input_for_day, iter_input_for_day
+from adventofcode.util.output import output_format, use_json_lines, write_results
+from adventofcode.util.registry import load_registry
+from adventofcode.util.selection import parse_selection
+
+PARTS = ('part_one', 'part_two')
+
+# The results of a part and the import duration of its module in ms
+PartResults = Tuple[List[SolutionResult], float]
+# The year, day, module name and part of a task, and whether it reports the parse time
+PartTask = Tuple[int, int, str, str, bool]
+
+# The limited runs are started from the threads of a ThreadPoolExecutor, and forking a process
+# with multiple threads can deadlock on locks that the other threads hold while it forks
+_LIMITED_CONTEXT: BaseContext = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+)
 
 
 def run_all() -> None:
     """
     Gathers all year_*.day_* files and executes the
     part_one and part_two functions in those files.
+    Only the selected years, days and part are imported and run.
 
     If input file is not found, or a function is not found, it will be printed to console
     """
+    args = _parse_args(sys.argv[1:])
+
+    if args.track_memory:
+        os.environ['AOC_TRACK_MEMORY'] = '1'  # inherited by the worker processes
+
+    if args.jsonl:
+        use_json_lines(args.jsonl)
+
+    days = _find_days(args.year, args.day)
+    parts = PARTS if args.part is None else (PARTS[args.part - 1],)
+
+    if not days:
+        console.print('[red]no solutions found for the selection')
+        sys.exit(1)
+
     config.RUNNING_ALL = True
 
-    for year_path in get_full_year_paths():
-        year_dir = year_dir_from_path(year_path)
-        year = clean_year(year_dir)
-        console.print(year)
+    if args.jobs > 1 or args.timeout or args.cpu_limit:
+        results, import_duration = _run_parallel(days, parts, args.jobs, args.timeout, args.cpu_limit, args.json)
+    else:
+        results, import_duration = _run_sequential(days, parts, args.json)
+
+    config.RUNNING_ALL = False
+
+    solve_duration = sum(result.duration for result in results if result.status == 'ok')
+    write_results(results, args.json, f'Imported {len(days)} modules in {import_duration:.2f} ms, '
+                                      f'solutions took {solve_duration:.2f} ms')
+
+    if args.record:
+        recorded = record_results(results)
+
+        if not args.json and output_format() != 'jsonl':
+            console.print(f'Recorded {recorded} timings in {HISTORY_DB}')
+
+
+def _parse_args(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Run all solutions')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Amount of worker processes to run the solutions in, 0 uses all cores. Default is 1')
+    parser.add_argument('--record', action='store_true', help='Append the timings to the timing history')
+    parser.add_argument('--year', type=parse_selection,
+                        help='The years to run, for example 2022 or 2021,2022. Default is all years')
+    parser.add_argument('--day', type=parse_selection,
+                        help='The days to run, for example 5, 5-14 or 1,3,5-7. Default is all days')
+    parser.add_argument('--part', type=int, choices=[1, 2], help='The part to run. Default is both')
+    parser.add_argument('--track-memory', action='store_true',
+                        help='Trace the peak memory and allocation sites, this slows the solutions down')
+    parser.add_argument('--timeout', type=float,
+                        help='Stop a part after this many seconds of wall clock time, including its import and parse')
+    parser.add_argument('--cpu-limit', type=int, help='Stop a part after this many seconds of CPU time')
+    parser.add_argument('--json', action='store_true', help='Output the results as JSON')
+    parser.add_argument('--jsonl', nargs='?', const='-', metavar='FILE',
+                        help='Write a JSON object per result to FILE, or to stdout without FILE, instead of printing it')
+    parsed = parser.parse_args(args)
+
+    if parsed.json and parsed.jsonl:
+        parser.error('--json and --jsonl cannot be combined')
+
+    if parsed.jobs < 0:
+        parser.error('--jobs cannot be negative')
+
+    if (parsed.timeout is not None and parsed.timeout <= 0) or (parsed.cpu_limit is not None and parsed.cpu_limit <= 0):
+        parser.error('--timeout and --cpu-limit should be positive')
+
+    if parsed.cpu_limit and resource is None:
+        parser.error('--cpu-limit is not supported on this platform')
+
+    parsed.jobs = parsed.jobs or os.cpu_count() or 1
+    return parsed
+
+
+def _find_days(years: Optional[Set[int]] = None, days: Optional[Set[int]] = None) -> List[Tuple[int, int, str]]:
+    """
+    Returns the year, day and module name of the selected day files, ordered by year and day.
+    The modules are found from the file names, so nothing is imported
+    """
+    return [
+        (entry.year, entry.day, entry.module) for entry in load_registry()
+        if (years is None or entry.year in years) and (days is None or entry.day in days)
+    ]
 
-        for day_file in get_full_day_paths(year_path):
-            day = clean_day(day_file)
-            module_name = get_full_module_from_day_file(day_file)
-            module = __import__(module_name, fromlist=['object'])
+
+def _import_day(module_name: str) -> Tuple[Any, float]:
+    """
+    Imports the day module and returns it with the import duration in ms
+    """
+    start = time.perf_counter()
+    module = __import__(module_name, fromlist=['object'])
+    return module, (time.perf_counter() - start) * 1000
+
+
+def _run_sequential(days: List[Tuple[int, int, str]], parts: Sequence[str] = PARTS,
+                    silent: bool = False) -> PartResults:
+    current_year = None
+    import_duration = 0.0
+    headers = not silent and output_format() != 'jsonl'
+
+    with collect_results(silent) as results:
+        for year, day, module_name in days:
+            if year != current_year and headers:
+                current_year = year
+                console.print(year)
+
+            module, duration = _import_day(module_name)
+            import_duration += duration
 
             try:
-                _run_day(module, year, day)
+                _run_day(module, year, day, parts)
             except FileNotFoundError:
-                console.print(f'[blue]{year} day {day:02}: [red]input file not found')
+                if not silent:
+                    _report_missing_input(year, day, parts)
+            except Exception as e:  # a crashing day should not stop the other days
+                finished = {result.part for result in results if (result.year, result.day) == (year, day)}
+                unfinished = [part for part in parts if PARTS.index(part) + 1 not in finished]
+                results.extend(_report_failure(year, day, unfinished, e, silent))
 
-    config.RUNNING_ALL = False
+    return results, import_duration
 
 
-def _run_day(module: str, year: int, day: int):
+def _run_parallel(days: List[Tuple[int, int, str]], parts: Sequence[str], jobs: int,
+                  timeout: Optional[float] = None, cpu_limit: Optional[int] = None,
+                  silent: bool = False) -> PartResults:
     """
-    Runs all solutions in the given day
+    Runs every part of every day in its own task on a process pool. Results are
+    printed in year/day/part order, as soon as all results before it are available.
+
+    With a timeout or CPU limit every part runs in its own process instead, which is
+    killed when it exceeds its limits. The other parts keep running
     """
-    data = get_input_for_day(year, day)
+    tasks: List[PartTask] = [(year, day, module_name, part, part == parts[0])
+                             for year, day, module_name in days for part in parts]
+    limited = bool(timeout or cpu_limit)
+    executor: Executor = ThreadPoolExecutor(max_workers=jobs) if limited else ProcessPoolExecutor(max_workers=jobs)
+
+    with executor:
+        if limited:
+            futures = [executor.submit(_run_limited, *task, timeout=timeout, cpu_limit=cpu_limit) for task in tasks]
+        else:
+            futures = [executor.submit(_run_part, *task) for task in tasks]
+
+        return _collect_results(tasks, futures, parts, silent)
+
+
+def _collect_results(tasks: List[PartTask], futures: List['Future[PartResults]'], parts: Sequence[str],
+                     silent: bool = False) -> PartResults:
+    """
+    Waits for the tasks in order and prints their results, returns all results and the total import duration
+    """
+    current_year = None
+    missing_inputs: Set[Tuple[int, int]] = set()
+    all_results: List[SolutionResult] = []
+    import_duration = 0.0
+    headers = not silent and output_format() != 'jsonl'
+
+    for task, future in zip(tasks, futures):
+        year = task[0]
+        if year != current_year and headers:
+            current_year = year
+            console.print(year)
+
+        results, duration = _task_results(task, future, parts, missing_inputs, silent)
+
+        for result in results:
+            if not silent:
+                emit_result(result)
+
+        all_results.extend(results)
+        import_duration += duration
+
+    return all_results, import_duration
+
+
+def _task_results(task: PartTask, future: 'Future[PartResults]', parts: Sequence[str],
+                  missing_inputs: Set[Tuple[int, int]], silent: bool) -> PartResults:
+    """
+    Returns the results of the task, or an error result when the part crashed. A missing input
+    is reported once per day, and gives no results
+    """
+    year, day, _, part, _ = task
+
     try:
-        getattr(module, 'part_one')(data)
-    except AttributeError:
-        pass
+        return future.result()
+    except FileNotFoundError:
+        if (year, day) not in missing_inputs and not silent:
+            missing_inputs.add((year, day))
+            _report_missing_input(year, day, parts)
+        return [], 0.0
+    except Exception as e:  # a crashing part should not stop the other parts
+        return _report_failure(year, day, [part], e, silent=True), 0.0
+
+
+def _report_missing_input(year: int, day: int, parts: Sequence[str]) -> None:
+    if output_format() == 'jsonl':
+        for part in parts:
+            emit_result(SolutionResult(year, day, PARTS.index(part) + 1, status='missing input'))
+    else:
+        console.print(f'[blue]{year} day {day:02}: [red]input file not found')
+
+
+def _report_failure(year: int, day: int, parts: Sequence[str], error: Exception,
+                    silent: bool = False) -> List[SolutionResult]:
+    """
+    Returns an error result for every part of the day that did not finish because of the error
+    """
+    failures = [SolutionResult(year, day, PARTS.index(part) + 1, answer=repr(error), status='error') for part in parts]
+
+    for failure in failures:
+        if not silent:
+            emit_result(failure)
+
+    return failures
+
+
+def _run_part(year: int, day: int, module_name: str, part: str,
+              report_parse: bool = True) -> PartResults:
+    """
+    Runs a single part of a day in a worker process and returns the collected results
+    and the import duration in ms
+    """
+    config.RUNNING_ALL = True
+    module, import_duration = _import_day(module_name)
+
+    with collect_results(silent=True) as results:
+        data = load_input(module, year, day)
+
+        if hasattr(module, part):
+            getattr(module, part)(data)
+
+    # Every part parses its own input, only report the parse time once
+    if not report_parse:
+        return [result for result in results if result.part != PARSE_PART], import_duration
+
+    return results, import_duration
+
+
+def _run_limited(year: int, day: int, module_name: str, part: str, report_parse: bool = True,
+                 timeout: Optional[float] = None, cpu_limit: Optional[int] = None) -> PartResults:
+    """
+    Runs a single part of a day in a new process, which is killed when it runs longer than timeout
+    seconds. The process is limited to cpu_limit seconds of CPU time with setrlimit.
+    A part that is stopped gets a 'timeout' or 'cpu limit' result
+    """
+    receiver, sender = _LIMITED_CONTEXT.Pipe(duplex=False)
+    process = _LIMITED_CONTEXT.Process(target=_limited_worker,
+                                       args=(sender, year, day, module_name, part, report_parse, cpu_limit))
+    start = time.perf_counter()
+    process.start()
+    sender.close()
+    timed_out = False
 
     try:
-        getattr(module, 'part_two')(data)
-    except AttributeError:
+        # The watchdog, poll returns early when the process sends its results or dies
+        if receiver.poll(timeout):
+            outcome, value = receiver.recv()
+            process.join()
+
+            if outcome == 'error':
+                raise value
+
+            part_results: PartResults = value
+            return part_results
+    except EOFError:  # the process died without sending its results
         pass
+    finally:
+        receiver.close()
+
+        if process.is_alive():
+            timed_out = True
+            process.kill()
+        process.join()
+
+    part_number = PARTS.index(part) + 1
+    duration = (time.perf_counter() - start) * 1000
+
+    if process.exitcode == -getattr(signal, 'SIGXCPU', -1):
+        return [SolutionResult(year, day, part_number, answer=f'exceeded {cpu_limit} s of CPU time',
+                               duration=duration, status='cpu limit')], 0.0
+
+    if timed_out:
+        return [SolutionResult(year, day, part_number, answer=f'exceeded {timeout} s',
+                               duration=duration, status='timeout')], 0.0
+
+    return [SolutionResult(year, day, part_number, answer=f'process exited with {process.exitcode}',
+                           duration=duration, status='error')], 0.0
+
+
+def _limited_worker(sender: Connection, year: int, day: int, module_name: str, part: str, report_parse: bool,
+                    cpu_limit: Optional[int]) -> None:
+    if cpu_limit:
+        # The soft limit sends SIGXCPU, which stops the process. The hard limit is a safety net
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_limit, cpu_limit + 1))
+
+    try:
+        sender.send(('ok', _run_part(year, day, module_name, part, report_parse)))
+    except Exception as e:
+        sender.send(('error', e))
+    finally:
+        sender.close()
+
+
+def load_input(module: Any, year: int, day: int) -> Any:
+    """
+    Loads the input for a single part of the day. Modules that set STREAM_INPUT get
+    an iterator over the lines, other modules get the (parsed) list of lines
+    """
+    if getattr(module, 'STREAM_INPUT', False):
+        return iter_input_for_day(year, day)
+
+    return parse_input(module, get_input_for_day(year, day))
+
+
+def parse_input(module: Any, input_data: List[str]) -> Any:
+    """
+    Runs the optional parse hook of the day module on the input data.
+    Returns the input data unchanged if the module has no parse hook
+    """
+    parse = getattr(module, 'parse', None)
+
+    if parse is None:
+        return input_data
+
+    return parse(input_data)
+
+
+def _run_day(module: Any, year: int, day: int, parts: Sequence[str] = PARTS, lines: Optional[List[str]] = None):
+    """
+    Runs the given parts of the day, by default all of them. The input is read from the
+    input file, unless its lines are given
+
+    The input is parsed once and shared between the parts. Modules whose parts modify
+    the parsed input set COPY_PARSED_INPUT, every part but the last then gets a copy.
+    Modules that set STREAM_INPUT get a new iterator over the lines for every part
+    """
+    if getattr(module, 'STREAM_INPUT', False):
+        inputs = [iter_input_for_day(year, day) if lines is None else iter(lines) for _ in parts]
+    else:
+        data = parse_input(module, get_input_for_day(year, day) if lines is None else lines)
+        copy_input = getattr(module, 'COPY_PARSED_INPUT', False)
+        inputs = [deepcopy(data) if copy_input and part != parts[-1] else data for part in parts]
+
+    for part, part_data in zip(parts, inputs):
+        if hasattr(module, part):
+            getattr(module, part)(part_data)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,278 @@
+import argparse
+import json
+import math
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+from rich.table import Table
+
+from adventofcode.generators import generate_input
+from adventofcode.scripts.runner import PARTS, parse_input
+from adventofcode.util.benchmark import PowerLawFit, benchmark_part, calculate_stats, fit_power_law
+from adventofcode.util.console import console
+from adventofcode.util.helpers import collect_results
+from adventofcode.util.input_helpers import get_input_for_day
+from adventofcode.util.module_helpers import get_full_module_from_year_day
+from adventofcode.util.profiling import format_bytes
+
+SOURCES = ('generate', 'truncate', 'tile')
+
+CHART_WIDTH = 60
+CHART_HEIGHT = 16
+
+
+def scale_bench():
+    """
+    Runs a part over a geometric series of input sizes, fits a power law through the timings
+    and the peak memory and prints the estimated complexity of the part
+    """
+    args = _parse_args(sys.argv[1:])
+
+    # Every scaled input is parsed only once, caching them would only fill up the cache
+    os.environ['AOC_PARSE_CACHE'] = '0'
+    os.environ['AOC_TRACK_MEMORY'] = '0'
+
+    module = __import__(get_full_module_from_year_day(args.year, args.day), fromlist=['object'])
+    func = getattr(module, PARTS[args.part - 1], None)
+
+    if func is None:
+        console.print(f'[red]{args.year} day {args.day:02} has no {PARTS[args.part - 1]}')
+        sys.exit(1)
+
+    try:
+        inputs = scaled_inputs(args.year, args.day, args.scales, args.source, args.seed)
+    except (ValueError, FileNotFoundError) as e:
+        console.print(f'[red]{e}')
+        sys.exit(1)
+
+    sizes = input_sizes(inputs)
+    measurements: List[Dict[str, Any]] = []
+
+    for scale, lines, size in zip(args.scales, inputs, sizes):
+        measurement = _measure(module, func, lines, args.warmup, args.repeat, args.track_memory)
+        measurements.append({'scale': scale, 'lines': len(lines), 'chars': sum(map(len, lines)), 'n': size,
+                             **measurement})
+
+        if measurement['status'] != 'ok' or measurement['median'] / 1000 > args.budget:
+            # Larger inputs would only take longer
+            break
+
+    report = _build_report(args, measurements)
+
+    if args.json:
+        print(json.dumps(report, indent=2, default=str))
+    else:
+        _print_report(report)
+
+
+def scaled_inputs(year: int, day: int, scales: List[int], source: str, seed: Optional[int] = None) -> List[List[str]]:
+    """
+    Returns the input lines for every scale. The generate source generates an input of each scale,
+    truncate takes the first scale / max(scales) part of the lines of the real input and tile
+    repeats the lines of the real input scale times
+    """
+    if source == 'generate':
+        return [[line.strip() for line in generate_input(year, day, scale, seed).splitlines()] for scale in scales]
+
+    lines = get_input_for_day(year, day)
+
+    if source == 'tile':
+        return [lines * scale for scale in scales]
+
+    if len(lines) < max(scales):
+        raise ValueError(f'the input of {year} day {day:02} has {len(lines)} lines, which is too short to truncate '
+                         f'to {len(scales)} sizes, use another source')
+
+    return [lines[:math.ceil(len(lines) * scale / max(scales))] for scale in scales]
+
+
+def input_sizes(inputs: List[List[str]]) -> List[int]:
+    """
+    Returns the size n of every input, which is its amount of characters. Unlike the amount of
+    lines, this grows with the amount of cells of a grid input instead of with its side, and it
+    also grows for inputs of a single line
+    """
+    return [sum(map(len, lines)) for lines in inputs]
+
+
+def _measure(module: Any, func: Any, lines: List[str], warmup: int, repeat: int, track_memory: bool) -> Dict[str, Any]:
+    measurement: Dict[str, Any] = {'status': 'ok', 'answer': None, 'median': None, 'min': None, 'peak': None}
+
+    with collect_results(silent=True):
+        data = parse_input(module, lines)
+
+    # Tracing the memory slows the part down, so the peak is measured in a separate run
+    results = benchmark_part(module, func, data, warmup, repeat)
+    failed = [result for result in results if result.status != 'ok']
+
+    if not results or failed:
+        measurement['status'] = failed[0].status if failed else 'not timed'
+        return measurement
+
+    stats = calculate_stats([result.duration for result in results])
+    measurement.update(answer=results[0].answer, median=stats.median, min=stats.min)
+
+    if track_memory:
+        os.environ['AOC_TRACK_MEMORY'] = '1'
+        try:
+            traced = benchmark_part(module, func, data, 0, 1)
+        finally:
+            os.environ['AOC_TRACK_MEMORY'] = '0'
+
+        measurement['peak'] = traced[0].memory.peak if traced and traced[0].memory else None
+
+    return measurement
+
+
+def _fit(measurements: List[Dict[str, Any]], key: str) -> Optional[PowerLawFit]:
+    points = [(measurement['n'], measurement[key]) for measurement in measurements
+              if measurement['status'] == 'ok' and measurement[key] is not None]
+
+    try:
+        return fit_power_law([n for n, _ in points], [value for _, value in points])
+    except ValueError:
+        return None
+
+
+def _build_report(args: argparse.Namespace, measurements: List[Dict[str, Any]]) -> Dict[str, Any]:
+    report: Dict[str, Any] = {
+        'year': args.year,
+        'day': args.day,
+        'part': args.part,
+        'source': args.source,
+        'measurements': measurements,
+    }
+
+    for key, name in (('median', 'time'), ('peak', 'memory')):
+        fit = _fit(measurements, key)
+        report[name] = None if fit is None else {'exponent': fit.exponent, 'coefficient': fit.coefficient,
+                                                 'r_squared': fit.r_squared, 'complexity': fit.complexity}
+
+    return report
+
+
+def _print_report(report: Dict[str, Any]) -> None:
+    measurements = report['measurements']
+    track_memory = any(measurement['peak'] is not None for measurement in measurements)
+
+    table = Table(title=f'Scaling of {report["year"]} day {report["day"]:02} part {report["part"]:02} ({report["source"]})')
+    columns = ['scale', 'n (chars)', 'answer', 'min (ms)', 'median (ms)']
+    for column in columns + (['peak memory'] if track_memory else []):
+        table.add_column(column, justify='left' if column == 'answer' else 'right')
+
+    for measurement in measurements:
+        row = [str(measurement['scale']), f'{measurement["n"]:,}']
+
+        if measurement['status'] != 'ok':
+            table.add_row(*row, f'[red]{measurement["status"]}')
+            continue
+
+        memory = [format_bytes(measurement['peak']) if measurement['peak'] is not None else ''] if track_memory else []
+        table.add_row(*row, str(measurement['answer']).strip(), f'{measurement["min"]:.4f}',
+                      f'{measurement["median"]:.4f}', *memory)
+
+    console.print(table)
+
+    for name in ('time', 'memory'):
+        fit = report[name]
+        if fit is not None:
+            console.print(f'Estimated {name} complexity: [bold]{fit["complexity"]}[/bold] '
+                          f'(exponent {fit["exponent"]:.2f}, r² {fit["r_squared"]:.3f})')
+
+    if report['time'] is None:
+        console.print('[yellow]At least two sizes are needed to estimate the complexity')
+        return
+
+    points = [(measurement['n'], measurement['median']) for measurement in measurements if measurement['status'] == 'ok']
+    fit = PowerLawFit(report['time']['exponent'], report['time']['coefficient'], report['time']['r_squared'])
+    console.print(loglog_chart(points, fit), highlight=False)
+
+
+def loglog_chart(points: List[Any], fit: Optional[PowerLawFit] = None,
+                 width: int = CHART_WIDTH, height: int = CHART_HEIGHT) -> str:
+    """
+    Draws the (n, ms) points and the fitted power law on a log-log scale as text.
+    Points are drawn as ●, the fit as ·
+    """
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(max(ms, 1e-6)) for _, ms in points]
+    if fit is not None:
+        ys += [math.log(max(fit(n), 1e-6)) for n, _ in points]
+
+    min_x, max_x = min(xs), max(xs)
+    min_y, max_y = min(ys), max(ys)
+    span_x = max_x - min_x or 1.0
+    span_y = max_y - min_y or 1.0
+
+    def row(y: float) -> int:
+        return height - 1 - round((y - min_y) / span_y * (height - 1))
+
+    grid = [[' '] * width for _ in range(height)]
+
+    if fit is not None:
+        for column in range(width):
+            size = math.exp(min_x + span_x * column / (width - 1))
+            grid[row(math.log(max(fit(size), 1e-6)))][column] = '·'
+
+    for x, (_, ms) in zip(xs, points):
+        grid[row(math.log(max(ms, 1e-6)))][round((x - min_x) / span_x * (width - 1))] = '●'
+
+    top = f'{math.exp(max_y):.4g} ms'
+    bottom = f'{math.exp(min_y):.4g} ms'
+    label_width = max(len(top), len(bottom))
+    lines = []
+
+    for i, cells in enumerate(grid):
+        label = top if i == 0 else bottom if i == height - 1 else ''
+        lines.append(f'{label:>{label_width}} │{"".join(cells)}')
+
+    left = f'n={math.exp(min_x):,.0f}'
+    right = f'n={math.exp(max_x):,.0f}'
+    lines.append(f'{"":>{label_width}} └{"─" * width}')
+    lines.append(f'{"":>{label_width}}  {left}{right:>{width - len(left)}}')
+
+    return '\n'.join(lines)
+
+
+def _parse_scales(value: str) -> List[int]:
+    try:
+        scales = sorted({int(scale) for scale in value.split(',')})
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'invalid scales {value!r}, expected a list like 1,2,4,8')
+
+    if scales[0] < 1:
+        raise argparse.ArgumentTypeError('the scales should be at least 1')
+
+    return scales
+
+
+def _parse_args(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Estimate how a solution scales with the size of its input')
+    parser.add_argument('year', type=int, help='The year of the exercise')
+    parser.add_argument('day', type=int, help='The day of the exercise')
+    parser.add_argument('part', type=int, choices=[1, 2], help='The part to measure')
+    parser.add_argument('--scales', type=_parse_scales, default=[1, 2, 4, 8],
+                        help='Comma separated sizes of the inputs, relative to the smallest one. Default is 1,2,4,8')
+    parser.add_argument('--source', choices=SOURCES, default='generate',
+                        help='Where the inputs come from: generated inputs, the truncated real input or the real input '
+                             'repeated. Truncating and tiling only give valid inputs for inputs of independent lines. '
+                             'Default is generate')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the generated inputs. Default is 0')
+    parser.add_argument('--warmup', type=int, default=0, help='Amount of untimed warmup runs per size. Default is 0')
+    parser.add_argument('--repeat', type=int, default=3, help='Amount of timed runs per size. Default is 3')
+    parser.add_argument('--budget', type=float, default=60,
+                        help='Skip the larger sizes once a run takes longer than this many seconds. Default is 60')
+    parser.add_argument('--no-memory', dest='track_memory', action='store_false',
+                        help='Do not measure the peak memory, which takes an extra traced run per size')
+    parser.add_argument('--json', action='store_true', help='Output the measurements and the fits as JSON')
+    parsed = parser.parse_args(args)
+
+    if parsed.warmup < 0 or parsed.repeat < 1:
+        parser.error('--warmup cannot be negative and --repeat should be at least 1')
+
+    return parsed
+
+
+if __name__ == '__main__':
+    scale_bench()
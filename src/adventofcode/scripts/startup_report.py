@@ -0,0 +1,235 @@
+import argparse
+import json
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from importlib import metadata
+from typing import Any, Dict, List, Optional, Tuple
+
+from rich.table import Table
+
+from adventofcode.scripts.runner import _find_days
+from adventofcode.util.console import console
+
+PACKAGE = 'adventofcode'
+
+
+@dataclass
+class ImportTime:
+    """
+    A module in the output of python -X importtime, the times are in µs
+    """
+    name: str
+    self_us: int
+    cumulative_us: int
+    children: List['ImportTime'] = field(default_factory=list)
+
+
+def startup_report():
+    """
+    Measures the import time of every entry point and day module in a new interpreter with
+    python -X importtime, ranks them and the imports that cost the most. Exits with status 1
+    when a module takes longer than the budget to import
+    """
+    args = _parse_args(sys.argv[1:])
+    targets = find_targets(args.scripts_only)
+    reports = [_measure_target(name, module, args.repeat) for name, module in targets]
+    reports.sort(key=_by_ms, reverse=True)
+    offenders = rank_offenders(reports)[:args.top]
+    over_budget = [report for report in reports if report['ms'] is None or report['ms'] > args.budget]
+
+    if args.json:
+        print(json.dumps({'budget': args.budget, 'targets': reports, 'offenders': offenders}, indent=2))
+    else:
+        _print_report(reports, offenders, args.budget)
+
+    if over_budget:
+        sys.exit(1)
+
+
+def find_targets(scripts_only: bool = False) -> List[Tuple[str, str]]:
+    """
+    Returns the name and module of every console script of the package and, unless scripts_only
+    is set, of every day module
+    """
+    try:
+        entry_points = metadata.distribution(PACKAGE).entry_points
+    except metadata.PackageNotFoundError:
+        entry_points = []
+
+    targets = sorted((entry_point.name, entry_point.value.partition(':')[0]) for entry_point in entry_points
+                     if entry_point.group == 'console_scripts')
+
+    if not scripts_only:
+        targets += [(f'{year} day {day:02}', module_name) for year, day, module_name in _find_days()]
+
+    return targets
+
+
+def measure_import(module: str) -> str:
+    """
+    Imports the module in a new interpreter and returns the output of -X importtime.
+    Raises ImportError when the module cannot be imported
+    """
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                             capture_output=True, text=True)
+
+    if process.returncode:
+        error = process.stderr.strip().splitlines()
+        raise ImportError(f'{module} cannot be imported: {error[-1] if error else process.returncode}')
+
+    return process.stderr
+
+
+def parse_importtime(output: str) -> List[ImportTime]:
+    """
+    Returns the tree of imports in the output of -X importtime. A module is printed after its
+    imports, with its nesting as indentation, so the children of a module are the modules one
+    level deeper that were printed before it
+    """
+    pending: Dict[int, List[ImportTime]] = {}
+
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        if not self_us.strip().isdigit():
+            continue  # the header
+
+        depth = (len(name) - len(name.lstrip())) // 2
+        node = ImportTime(name.strip(), int(self_us), int(cumulative_us), pending.pop(depth + 1, []))
+        pending.setdefault(depth, []).append(node)
+
+    return pending.get(0, [])
+
+
+def find_import(nodes: List[ImportTime], name: str) -> Optional[ImportTime]:
+    for node in nodes:
+        if node.name == name:
+            return node
+
+        found = find_import(node.children, name)
+        if found is not None:
+            return found
+
+    return None
+
+
+def external_imports(node: ImportTime) -> List[Tuple[str, ImportTime]]:
+    """
+    Returns the modules outside of the package that the modules of the package import directly,
+    together with the module that imports them. These are the imports that can be made lazy
+    """
+    imports: List[Tuple[str, ImportTime]] = []
+
+    for child in node.children:
+        if _in_package(child.name):
+            imports.extend(external_imports(child))
+        else:
+            imports.append((node.name, child))
+
+    return imports
+
+
+def rank_offenders(reports: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Ranks the external imports of all targets by the longest time they took to import
+    """
+    offenders: Dict[str, Dict[str, Any]] = {}
+
+    for report in reports:
+        for dependency in report['imports']:
+            offender = offenders.setdefault(dependency['name'], {'name': dependency['name'], 'ms': 0.0,
+                                                                 'imported_by': [], 'targets': 0})
+            offender['ms'] = max(offender['ms'], dependency['ms'])
+            offender['targets'] += 1
+            if dependency['imported_by'] not in offender['imported_by']:
+                offender['imported_by'].append(dependency['imported_by'])
+
+    return sorted(offenders.values(), key=_by_ms, reverse=True)
+
+
+def _by_ms(entry: Dict[str, Any]) -> float:
+    """
+    Sort key of the reports, offenders and imports, targets that failed to import sort as the slowest
+    """
+    return float(entry['ms']) if entry['ms'] is not None else float('inf')
+
+
+def _in_package(name: str) -> bool:
+    return name == PACKAGE or name.startswith(f'{PACKAGE}.')
+
+
+def _measure_target(name: str, module: str, repeat: int) -> Dict[str, Any]:
+    report: Dict[str, Any] = {'name': name, 'module': module, 'ms': None, 'error': None, 'imports': []}
+    fastest: Optional[ImportTime] = None
+
+    # The fastest import is the least disturbed by other load on the machine
+    for _ in range(repeat):
+        try:
+            node = find_import(parse_importtime(measure_import(module)), module)
+        except ImportError as e:
+            report['error'] = str(e)
+            return report
+
+        if node is not None and (fastest is None or node.cumulative_us < fastest.cumulative_us):
+            fastest = node
+
+    if fastest is None:
+        report['error'] = f'{module} is not in the import times'
+        return report
+
+    report['ms'] = fastest.cumulative_us / 1000
+    report['imports'] = sorted(({'name': child.name, 'imported_by': importer, 'ms': child.cumulative_us / 1000}
+                                for importer, child in external_imports(fastest)),
+                               key=_by_ms, reverse=True)
+    return report
+
+
+def _print_report(reports: List[Dict[str, Any]], offenders: List[Dict[str, Any]], budget: float) -> None:
+    table = Table(title=f'Import time (budget {budget:.0f} ms)')
+    for column in ('target', 'module', 'ms', 'slowest import'):
+        table.add_column(column, justify='right' if column == 'ms' else 'left')
+
+    for report in reports:
+        if report['ms'] is None:
+            table.add_row(report['name'], report['module'], '', f'[red]{report["error"]}')
+            continue
+
+        slowest = report['imports'][0] if report['imports'] else None
+        slowest_import = f'{slowest["name"]} ({slowest["ms"]:.1f} ms, by {slowest["imported_by"]})' if slowest else ''
+        ms = f'[red]{report["ms"]:.1f}' if report['ms'] > budget else f'{report["ms"]:.1f}'
+        table.add_row(report['name'], report['module'], ms, slowest_import)
+
+    console.print(table)
+
+    table = Table(title='Slowest imports from outside the package')
+    for column in ('import', 'ms', 'targets', 'imported by'):
+        table.add_column(column, justify='right' if column in ('ms', 'targets') else 'left')
+
+    for offender in offenders:
+        table.add_row(offender['name'], f'{offender["ms"]:.1f}', str(offender['targets']), ', '.join(offender['imported_by']))
+
+    console.print(table)
+
+
+def _parse_args(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Report the import time of the scripts and the day modules')
+    parser.add_argument('--budget', type=float, default=150,
+                        help='Maximum import time of a module in ms, exceeding it exits with status 1. Default is 150')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Amount of times every module is imported, the fastest import is reported. Default is 3')
+    parser.add_argument('--top', type=int, default=10, help='Amount of slowest imports to list. Default is 10')
+    parser.add_argument('--scripts-only', action='store_true', help='Only report the console scripts')
+    parser.add_argument('--json', action='store_true', help='Output the report as JSON')
+    parsed = parser.parse_args(args)
+
+    if parsed.repeat < 1 or parsed.top < 0:
+        parser.error('--repeat should be at least 1 and --top cannot be negative')
+
+    return parsed
+
+
+if __name__ == '__main__':
+    startup_report()
@@ -0,0 +1,169 @@
+import math
+import random
+import statistics
+from copy import deepcopy
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from adventofcode.util.helpers import SolutionResult, collect_results, PARSE_PART
+
+
+@dataclass
+class BenchmarkStats:
+    """
+    Statistics of the timings of a solution, all durations are in ms
+    """
+    runs: int
+    min: float
+    max: float
+    mean: float
+    median: float
+    p95: float
+    stdev: float
+
+    @property
+    def ops_per_sec(self) -> float:
+        return 1000 / self.median if self.median else math.inf
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), 'ops_per_sec': self.ops_per_sec}
+
+
+@dataclass
+class PowerLawFit:
+    """
+    A fit of value = coefficient * size ** exponent, r_squared is the goodness of the fit on the log-log scale
+    """
+    exponent: float
+    coefficient: float
+    r_squared: float
+
+    def __call__(self, size: float) -> float:
+        return self.coefficient * size ** self.exponent
+
+    @property
+    def complexity(self) -> str:
+        return complexity_label(self.exponent)
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """
+    Returns the pct percentile of the values, interpolating linearly between the closest ranks
+    """
+    if not values:
+        raise ValueError('cannot calculate the percentile of an empty sequence')
+
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def calculate_stats(timings: Sequence[float]) -> BenchmarkStats:
+    """
+    Calculates the benchmark statistics of the timings
+    """
+    if not timings:
+        raise ValueError('cannot calculate statistics without timings')
+
+    return BenchmarkStats(
+        runs=len(timings),
+        min=min(timings),
+        max=max(timings),
+        mean=statistics.fmean(timings),
+        median=statistics.median(timings),
+        p95=percentile(timings, 95),
+        stdev=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+    )
+
+
+def bootstrap_interval(statistic: Callable[..., float], *samples: Sequence[float], confidence: float = 0.95,
+                       resamples: int = 2000, seed: int = 0) -> Tuple[float, float]:
+    """
+    Returns the bootstrap confidence interval of the statistic of the samples. Every resample
+    draws each sample with replacement, the statistic gets one resampled sequence per sample
+    """
+    if not all(samples):
+        raise ValueError('cannot bootstrap an empty sample')
+
+    rng = random.Random(seed)
+    estimates = [statistic(*(rng.choices(sample, k=len(sample)) for sample in samples)) for _ in range(resamples)]
+    tail = (1 - confidence) / 2 * 100
+
+    return percentile(estimates, tail), percentile(estimates, 100 - tail)
+
+
+def fit_power_law(sizes: Sequence[float], values: Sequence[float]) -> PowerLawFit:
+    """
+    Fits value = coefficient * size ** exponent with a least squares fit of a line through
+    the log-log points. Needs at least two different positive sizes, values below a
+    nanosecond are clamped, so constant time parts fit an exponent of about 0
+    """
+    points = [(math.log(size), math.log(max(value, 1e-6))) for size, value in zip(sizes, values) if size > 0]
+    if len({x for x, _ in points}) < 2:
+        raise ValueError('a power law needs at least two different sizes to fit')
+
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    syy = sum((y - mean_y) ** 2 for _, y in points)
+
+    exponent = sxy / sxx
+    r_squared = sxy * sxy / (sxx * syy) if syy else 1.0
+    return PowerLawFit(exponent, math.exp(mean_y - exponent * mean_x), r_squared)
+
+
+def complexity_label(exponent: float) -> str:
+    """
+    Returns the big O notation of the exponent, rounded to the nearest half
+    """
+    rounded = round(exponent * 2) / 2
+    if rounded <= 0:
+        return 'O(1)'
+    if rounded == 1:
+        return 'O(n)'
+    if rounded.is_integer() and rounded < 10:
+        return f'O(n{"⁰¹²³⁴⁵⁶⁷⁸⁹"[int(rounded)]})'
+    return f'O(n^{rounded:g})'
+
+
+def fresh_input(module: Any, data: Any) -> Any:
+    """
+    Returns input data that can safely be handed to a single run of a part.
+
+    Raw input lines are copied because some parts modify them, parsed input is
+    only copied when the module sets COPY_PARSED_INPUT. Modules that set STREAM_INPUT
+    get an iterator over the lines
+    """
+    if getattr(module, 'STREAM_INPUT', False):
+        return iter(data)
+
+    if getattr(module, 'parse', None) is None:
+        return list(data)
+
+    if getattr(module, 'COPY_PARSED_INPUT', False):
+        return deepcopy(data)
+
+    return data
+
+
+def benchmark_part(module: Any, func: Callable[..., Any], data: Any, warmup: int = 1, repeat: int = 10) -> List[SolutionResult]:
+    """
+    Runs a timed solution warmup + repeat times without printing and returns the
+    results of the repeated runs. The timings are the ones measured by the solution timer
+    """
+    results: List[SolutionResult] = []
+
+    for i in range(warmup + repeat):
+        run_data = fresh_input(module, data)
+
+        with collect_results(silent=True) as collected:
+            func(run_data)
+
+        if i >= warmup:
+            results.extend(result for result in collected if result.part != PARSE_PART)
+
+    return results
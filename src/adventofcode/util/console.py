@@ -1,3 +1,21 @@
-from rich.console import Console
+from typing import Any, Optional
 
-console = Console(color_system='truecolor')
+
+class LazyConsole:
+    """
+    Stands in for a rich Console, which is only created when it is first used. Importing this
+    module does not import rich, so output that never reaches the console does not pay for it
+    """
+    def __init__(self, **options: Any):
+        self._options = options
+        self._console: Optional[Any] = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console(**self._options)
+
+        return getattr(self._console, name)
+
+
+console = LazyConsole(color_system='truecolor')
@@ -0,0 +1,70 @@
+import json
+import os
+import socket
+from typing import Any, Dict, Optional, Protocol
+
+from adventofcode.config import CACHE_DIR
+
+# Only the standard library and the config are imported, so aoc-run starts fast
+DAEMON_SOCKET = os.environ.get('AOC_DAEMON_SOCKET', os.path.join(CACHE_DIR, 'daemon.sock'))
+
+
+class DaemonNotRunning(ConnectionError):
+    """
+    Raised when there is no daemon listening on the socket
+    """
+
+
+class MessageWriter(Protocol):
+    """
+    The binary file a message is written to, a socket file or the wfile of a request handler
+    """
+    def write(self, __data: bytes) -> Any: ...
+
+    def flush(self) -> Any: ...
+
+
+class MessageReader(Protocol):
+    """
+    The binary file a message is read from, a socket file or the rfile of a request handler
+    """
+    def readline(self) -> bytes: ...
+
+
+def write_message(file: MessageWriter, message: Dict[str, Any]) -> None:
+    """
+    Writes a message as a single JSON line
+    """
+    file.write(json.dumps(message, default=str).encode() + b'\n')
+    file.flush()
+
+
+def read_message(file: MessageReader) -> Optional[Dict[str, Any]]:
+    """
+    Reads a single JSON line message, returns None when the other side closed the connection
+    """
+    line = file.readline()
+    return json.loads(line) if line else None
+
+
+def send_request(message: Dict[str, Any], path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Sends a request to the daemon and returns its response. Raises DaemonNotRunning
+    when no daemon listens on the socket
+    """
+    path = path or DAEMON_SOCKET
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            raise DaemonNotRunning(f'no daemon is listening on {path}, start it with aoc-daemon')
+
+        with sock.makefile('rwb') as file:
+            write_message(file, message)
+            response = read_message(file)
+
+    if response is None:
+        raise ConnectionError('the daemon closed the connection without a response')
+
+    return response
@@ -1,12 +1,125 @@
-import cProfile
+import functools
+import hashlib
+import linecache
 import os
-import pstats
+import pickle
 import time
-from typing import Callable, Literal, Dict, Any
-
-from adventofcode.config import RUNNING_ALL
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Literal, Dict, Any, Iterator, List, NamedTuple, Optional, Tuple, TypeVar, \
+    Union, cast, overload
+
+from adventofcode import config
+from adventofcode.config import CACHE_DIR
 from adventofcode.util.console import console
 from adventofcode.util.exceptions import SolutionNotFoundException
+from adventofcode.util.output import output_format, write_result
+from adventofcode.util.module_helpers import source_hash
+
+if TYPE_CHECKING:
+    import sqlite3  # noqa
+    from adventofcode.util.profiling import LineStats, MemoryStats, MemoryTracker  # noqa
+
+
+PARSE_PART = 0  # part number used for the results of a day's parse hook
+MEMOIZE_MAXSIZE = 100_000  # default amount of results a memoized function keeps
+MEMOIZE_DB = os.environ.get('AOC_MEMOIZE_DB', os.path.join(CACHE_DIR, 'memoize.db'))
+PERSISTENT_MAX_ENTRIES = 100_000  # per namespace
+PERSISTENT_MAX_SIZE = 64 * 1024 * 1024  # bytes per namespace
+
+MEMOIZE_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS memoized (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS memoized_last_used ON memoized (namespace, last_used);
+'''
+
+
+@dataclass
+class SolutionResult:
+    """
+    The outcome of a single solution run, as recorded by the solution timer
+    """
+    year: int
+    day: int
+    part: int
+    version: str = ''
+    answer: Any = None
+    duration: float = 0.0  # in ms
+    status: str = 'ok'
+    memory: Optional['MemoryStats'] = None  # only set when memory is tracked
+
+
+_collector: Optional[List[SolutionResult]] = None
+_collector_silent = False
+
+
+@contextmanager
+def collect_results(silent: bool = False) -> Iterator[List[SolutionResult]]:
+    """
+    Collects the results of all timed solutions that run inside this context.
+    When silent is set, the results are not printed to the console.
+    """
+    global _collector, _collector_silent
+    previous = _collector, _collector_silent
+    _collector, _collector_silent = [], silent
+
+    try:
+        yield _collector
+    finally:
+        _collector, _collector_silent = previous
+
+
+def print_result(result: SolutionResult) -> None:
+    """
+    Prints a solution result to the console
+    """
+    if result.part == PARSE_PART:
+        console.print(f'{_get_parse_prefix(result.year, result.day)}parsed in {result.duration:.2f} ms')
+        return
+
+    prefix = _get_prefix(result.year, result.day, result.part, result.version)
+
+    if result.status == 'ok' and result.memory is not None:
+        from adventofcode.util.profiling import format_bytes
+
+        memory = result.memory
+        console.print(f'{prefix}{result.answer} in {result.duration:.2f} ms, '
+                      f'peak {format_bytes(memory.peak)}, {memory.blocks:+} blocks')
+
+        for site, size, blocks in memory.top:
+            console.print(f'[dim]    {format_bytes(size)} in {blocks} blocks at {site}', highlight=False)
+    elif result.status == 'ok':
+        console.print(f'{prefix}{result.answer} in {result.duration:.2f} ms')
+    elif result.status == 'not found':
+        console.print(f'{prefix}[red]solution not found')
+    else:
+        console.print(f'{prefix}[red]{result.status}: {result.answer}')
+
+
+def emit_result(result: SolutionResult) -> None:
+    """
+    Outputs a solution result in the output format, printed to the console or as a JSON line
+    """
+    if output_format() == 'jsonl':
+        write_result(result)
+    else:
+        print_result(result)
+
+
+def _record_result(result: SolutionResult) -> None:
+    if _collector is not None:
+        _collector.append(result)
+
+    if not _collector_silent:
+        emit_result(result)
 
 
 def _get_year_from_segment(segment: str) -> int:
@@ -34,7 +147,7 @@ def _get_prefix(year: int, day: int, part: int, version: str) -> str:
     if version:
         version = f' [yellow]{version}[/yellow]'
 
-    if RUNNING_ALL:
+    if config.RUNNING_ALL:
         prefix = f'[blue]  - day {day:02} part {part:02}[/blue]{version}: '
     else:
         prefix = f'[blue]{year} day {day:02} part {part:02}[/blue]{version}: '
@@ -42,24 +155,45 @@ def _get_prefix(year: int, day: int, part: int, version: str) -> str:
     return prefix
 
 
-def solution_timer(year: int, day: int, part: int, version: str = ''):  # noqa: C901, type: ignore
-    prefix = _get_prefix(year, day, part, version)
+def _get_parse_prefix(year: int, day: int) -> str:
+    if config.RUNNING_ALL:
+        return f'[blue]  - day {day:02} parse[/blue]: '
+
+    return f'[blue]{year} day {day:02} parse[/blue]: '
+
+
+def solution_timer(year: int, day: int, part: int, version: str = '',
+                   track_memory: Optional[bool] = None):  # type: ignore
+    """
+    Times the solution and prints its answer. With track_memory set, or when track_memory is
+    not given and AOC_TRACK_MEMORY=1, the peak memory, the net allocated blocks and the top
+    allocation sites are traced with tracemalloc as well. Tracing slows the solution down,
+    so the time is not comparable to untraced runs
+    """
+    _get_prefix(year, day, part, version)  # validates the arguments
 
     def decorator(func: Callable):  # type: ignore
         def wrapper(*args, **kwargs):
+            cache_infos = _memoized_cache_infos()
+
             try:
-                start = time.perf_counter()
-                solution = func(*args, **kwargs)
+                tracker = _memory_tracker(func, track_memory)
+
+                with tracker or nullcontext():
+                    start = time.perf_counter()
+                    solution = func(*args, **kwargs)
+                    diff = (time.perf_counter() - start) * 1000
 
                 if solution is None:
                     raise SolutionNotFoundException(year, day, part)
 
-                diff = (time.perf_counter() - start) * 1000
-                console.print(f'{prefix}{solution} in {diff:.2f} ms')
-            except (ValueError, ArithmeticError, TypeError):
-                console.print_exception()
+                memory = tracker.stats if tracker else None
+                _record_result(SolutionResult(year, day, part, version, solution, diff, memory=memory))
+                _print_cache_usage(cache_infos)
+            except (ValueError, ArithmeticError, TypeError) as e:
+                _record_error(SolutionResult(year, day, part, version, repr(e), status='error'))
             except SolutionNotFoundException:
-                console.print(f'{prefix}[red]solution not found')
+                _record_result(SolutionResult(year, day, part, version, status='not found'))
             else:
                 return solution
 
@@ -68,42 +202,469 @@ def solution_timer(year: int, day: int, part: int, version: str = ''):  # noqa:
     return decorator
 
 
+def _memory_tracker(func: Callable[..., Any], track_memory: Optional[bool]) -> Optional['MemoryTracker']:
+    """
+    Returns a tracker for the solution when its memory is tracked, see solution_timer
+    """
+    track = track_memory if track_memory is not None else os.environ.get('AOC_TRACK_MEMORY', '0') == '1'
+    if not track:
+        return None
+
+    from adventofcode.util.profiling import MemoryTracker
+    return MemoryTracker(func)
+
+
+def _record_error(error: SolutionResult) -> None:
+    """
+    Records a solution that raised, the traceback is only printed for the console output
+    """
+    if not _collector_silent and output_format() == 'jsonl':
+        write_result(error)
+    elif not _collector_silent:
+        console.print_exception()
+
+    if _collector is not None:
+        _collector.append(error)
+
+
+def parse_timer(year: int, day: int):  # type: ignore
+    """
+    Times the parse hook of a day, so parse time is reported separately from the parts
+    """
+    def decorator(func: Callable):  # type: ignore
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            parsed = func(*args, **kwargs)
+            diff = (time.perf_counter() - start) * 1000
+            _record_result(SolutionResult(year, day, PARSE_PART, duration=diff))
+            return parsed
+
+        return wrapper
+
+    return decorator
+
+
 def solution_profiler(year: int, day: int, part: int, version: str = '', stats_amount: int = 10,
-                      sort: Literal['time', 'cumulative'] = 'time'):  # noqa: C901, type: ignore
+                      sort: Literal['time', 'cumulative'] = 'time',
+                      mode: Literal['deterministic', 'sampling'] = 'deterministic', flamegraph: bool = False,
+                      interval: float = 0.001):  # noqa: C901, type: ignore
+    """
+    Profiles the solution and prints the functions it spent the most time in. The result of
+    the solution is returned, so the profiler can stay on inside run-all.
+
+    The deterministic mode uses cProfile, the sampling mode samples the stack every interval
+    seconds from a background thread, which distorts hot loops a lot less. With flamegraph set,
+    the collapsed stacks and an SVG flamegraph are written to .aoc_profiles (or AOC_PROFILE_DIR)
+    """
     prefix = _get_prefix(year, day, part, version)
 
+    if sort not in ('time', 'cumulative'):
+        raise ValueError('only "time" and "cumulative" are supported')
+
+    if mode not in ('deterministic', 'sampling'):
+        raise ValueError('only "deterministic" and "sampling" modes are supported')
+
     def decorator(func: Callable):  # type: ignore
         def wrapper(*args, **kwargs):
-            with cProfile.Profile() as profiler:
-                func(*args, **kwargs)
+            from adventofcode.util.profiling import PROFILE_DIR, StackSampler, collapse_pstats, render_flamegraph, \
+                write_collapsed
 
-            stats = pstats.Stats(profiler)
+            if mode == 'sampling':
+                with StackSampler(interval) as sampler:
+                    result = func(*args, **kwargs)
 
-            if sort == 'time':
-                stats.sort_stats(pstats.SortKey.TIME)
-            elif sort == 'cumulative':
-                stats.sort_stats(pstats.SortKey.CUMULATIVE)
+                stacks, unit = dict(sampler.stacks), 'samples'
+                console.print(f'{prefix} profiling, {sampler.samples} samples')
+                _print_top_frames(stacks, stats_amount)
             else:
-                raise ValueError('only "time" and "cumulative" are supported')
+                import cProfile
+                import pstats
+
+                with cProfile.Profile() as profiler:
+                    result = func(*args, **kwargs)
 
-            stats.sort_stats(pstats.SortKey.TIME)
-            console.print(f'{prefix} profiling')
-            stats.print_stats(stats_amount)
+                stats = pstats.Stats(profiler)
+                stats.sort_stats(pstats.SortKey.TIME if sort == 'time' else pstats.SortKey.CUMULATIVE)
+                console.print(f'{prefix} profiling')
+                stats.print_stats(stats_amount)
+                stacks, unit = (collapse_pstats(stats) if flamegraph else {}), 'µs'
+
+            if flamegraph:
+                name = f'{year}_day_{day:02}_part_{part:02}' + (f'_{version}' if version else '')
+                path = os.path.join(PROFILE_DIR, name)
+                os.makedirs(PROFILE_DIR, exist_ok=True)
+                write_collapsed(stacks, f'{path}.folded')
+
+                with open(f'{path}.svg', 'w') as f:
+                    f.write(render_flamegraph(stacks, f'{year} day {day:02} part {part:02} {version}'.strip(), unit))
+
+                console.print(f'{prefix} flamegraph written to {path}.svg')
+
+            return result
 
         return wrapper
 
     return decorator
 
 
-def memoize(func: Callable):  # type: ignore
-    cache: Dict[Any, Any] = dict()
+def _print_top_frames(stacks: Dict[str, int], amount: int) -> None:
+    """
+    Prints the frames that were on top of the stack in the most samples
+    """
+    leaves: Dict[str, int] = {}
+    for stack, count in stacks.items():
+        leaf = stack.rsplit(';', 1)[-1]
+        leaves[leaf] = leaves.get(leaf, 0) + count
+
+    total = sum(leaves.values()) or 1
+    for leaf, count in sorted(leaves.items(), key=lambda item: item[1], reverse=True)[:amount]:
+        console.print(f'{count:>8} {count / total:>6.1%}  {leaf}', highlight=False, markup=False)
+
+
+def solution_line_profiler(year: int, day: int, part: int, version: str = '',
+                           hot_threshold: float = 10.0):  # type: ignore
+    """
+    Records the hits and time per line of the solution and of the functions it calls in the same
+    module, and prints the annotated source of those functions. The time of a line includes the
+    time of the functions it calls. Lines that take more than hot_threshold percent of the time
+    are highlighted. Place it below the solution timer, so it profiles the solution itself
+    """
+    prefix = _get_prefix(year, day, part, version)
+
+    def decorator(func: Callable):  # type: ignore
+        def wrapper(*args, **kwargs):
+            from adventofcode.util.profiling import LineProfiler
+
+            with LineProfiler(func) as profiler:
+                start = time.perf_counter()
+                result = func(*args, **kwargs)
+                total = time.perf_counter() - start
+
+            console.print(f'{prefix} line profile ({"sys.monitoring" if profiler.use_monitoring else "sys.settrace"})')
+            _print_line_stats(profiler.lines, total, hot_threshold)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def _print_line_stats(lines: 'LineStats', total: float, hot_threshold: float) -> None:
+    """
+    Prints the source of every profiled function, annotated with its line hits and times
+    """
+    from rich.table import Table
+    from rich.text import Text
+
+    for code, stats in sorted(lines.items(), key=lambda item: item[0].co_firstlineno):
+        if not any(hits for hits, _ in stats.values()):
+            continue
+
+        source = linecache.getlines(code.co_filename)
+        last_line = max(stats)
+        table = Table(title=f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})',
+                      title_justify='left')
+        for column in ('line', 'hits', 'time (ms)', 'per hit (µs)', '% time'):
+            table.add_column(column, justify='right')
+        table.add_column('source')
+
+        for line in range(code.co_firstlineno, last_line + 1):
+            text = Text(source[line - 1].rstrip() if line <= len(source) else '')
+            hits, duration = stats.get(line, (0, 0.0))
+
+            if not hits:
+                table.add_row(str(line), '', '', '', '', text)
+                continue
+
+            percentage = duration / total * 100 if total else 0.0
+            table.add_row(str(line), str(hits), f'{duration * 1000:.3f}', f'{duration / hits * 1e6:.2f}',
+                          f'{percentage:.1f}', text, style='bold red' if percentage >= hot_threshold else None)
+
+        console.print(table)
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+_memoized: 'weakref.WeakSet[Callable[..., Any]]' = weakref.WeakSet()
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+class _LRUCache:
+    """
+    The results of a memoized function and its statistics. When more than maxsize
+    results are stored, the least recently used result is evicted
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.results: 'OrderedDict[Any, Any]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def lookup(self, key: Any) -> Tuple[bool, Any]:
+        if key not in self.results:
+            self.misses += 1
+            return False, None
+
+        self.hits += 1
+        self.results.move_to_end(key)
+        return True, self.results[key]
+
+    def store(self, key: Any, result: Any) -> None:
+        self.results[key] = result
+
+        if len(self.results) > self.maxsize:
+            self.results.popitem(last=False)
+            self.evictions += 1
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self.results))
+
+    def clear(self) -> None:
+        self.results.clear()
+        self.hits = self.misses = self.evictions = 0
+
+
+@overload
+def memoize(func: F, *, maxsize: int = ...) -> F: ...
+
+
+@overload
+def memoize(*, maxsize: int = ...) -> Callable[[F], F]: ...
+
+
+def memoize(func: Optional[F] = None, *, maxsize: int = MEMOIZE_MAXSIZE) -> Union[F, Callable[[F], F]]:
+    """
+    Caches the results of a function, keyed on its positional and keyword arguments.
+    Lists, dicts and sets in the arguments are converted to hashable keys. When more than
+    maxsize results are cached, the least recently used result is evicted.
+
+    Can be used as @memoize or @memoize(maxsize=...). The memoized function has
+    cache_info() and cache_clear() like functools.lru_cache
+    """
+    if maxsize < 1:
+        raise ValueError('maxsize should be at least 1')
+
+    def decorator(func: F) -> F:
+        cache = _LRUCache(maxsize)
+
+        @functools.wraps(func)
+        def memoized_func(*args: Any, **kwargs: Any) -> Any:
+            key = _make_key(args, kwargs)
+            found, result = cache.lookup(key)
+
+            if not found:
+                result = func(*args, **kwargs)
+                cache.store(key, result)
+
+            return result
+
+        memoized_func.cache_info = cache.info  # type: ignore
+        memoized_func.cache_clear = cache.clear  # type: ignore
+        _memoized.add(memoized_func)
+        return cast(F, memoized_func)
+
+    if func is not None:
+        return decorator(func)
+
+    return decorator
+
+
+_KWARGS_MARK = object()
+
+
+def _make_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+    key = tuple(_canonicalize(arg) for arg in args)
+
+    if kwargs:
+        key += (_KWARGS_MARK,) + tuple(sorted((name, _canonicalize(value)) for name, value in kwargs.items()))
+
+    return key
+
+
+def _canonicalize(value: Any) -> Any:
+    """
+    Converts unhashable containers into hashable values. The type is part of the result,
+    so a list and a tuple with the same items are different keys
+    """
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_canonicalize(item) for item in value)
+
+    if isinstance(value, dict):
+        return dict, frozenset((_canonicalize(k), _canonicalize(v)) for k, v in value.items())
+
+    if isinstance(value, (set, frozenset)):
+        return frozenset, frozenset(_canonicalize(item) for item in value)
+
+    return value
+
+
+def persistent_memoize(namespace: str, max_entries: int = PERSISTENT_MAX_ENTRIES,
+                       max_size: int = PERSISTENT_MAX_SIZE, maxsize: int = MEMOIZE_MAXSIZE):  # type: ignore
+    """
+    Like memoize, but results are also stored in a SQLite database (.aoc_cache/memoize.db, or
+    the path in AOC_MEMOIZE_DB), so they are reused by later runs. Entries are keyed on the
+    source of the module the function is defined in and on the arguments, so changing the
+    module invalidates them. When a namespace has more than max_entries entries or more than
+    max_size bytes, its least recently used entries are evicted.
+    Set AOC_MEMOIZE_CACHE=0 to disable the database, the in-memory cache is always used
+    """
+    def decorator(func: Callable):  # type: ignore
+        prefix = f'{func.__module__}.{func.__qualname__}\0{source_hash(func)}\0'
+        # Counting the namespace on every store is slow for large namespaces, so the caps are checked at an interval
+        evict_interval = max(1, min(100, max_entries // 10))
+        stores = 0
+
+        @functools.wraps(func)
+        def persistent_func(*args, **kwargs):
+            nonlocal stores
+
+            if os.environ.get('AOC_MEMOIZE_CACHE', '1') == '0':
+                return func(*args, **kwargs)
+
+            key = hashlib.sha256((prefix + _stable_repr((args, kwargs))).encode()).hexdigest()
+            db = _memoize_db()
+            found, result = _load_persistent(db, namespace, key)
+
+            if found:
+                return result
+
+            result = func(*args, **kwargs)
+
+            if _store_persistent(db, namespace, key, result):
+                stores += 1
+                if stores % evict_interval == 0:
+                    _evict_persistent(db, namespace, max_entries, max_size)
+                db.commit()
+
+            return result
+
+        return memoize(persistent_func, maxsize=maxsize)
+
+    return decorator
+
+
+_memoize_connection: Optional[Tuple[int, str, 'sqlite3.Connection']] = None
+
+
+def _memoize_db() -> 'sqlite3.Connection':
+    """
+    Returns the connection to the memoize database, every process opens its own connection
+    """
+    global _memoize_connection
+
+    if _memoize_connection is None or _memoize_connection[:2] != (os.getpid(), MEMOIZE_DB):
+        import sqlite3
+
+        os.makedirs(os.path.dirname(MEMOIZE_DB), exist_ok=True)
+        connection = sqlite3.connect(MEMOIZE_DB, timeout=30)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')  # it is only a cache, losing the last entries is fine
+        connection.executescript(MEMOIZE_SCHEMA)
+        _memoize_connection = os.getpid(), MEMOIZE_DB, connection
+
+    return _memoize_connection[2]
+
+
+def _load_persistent(db: 'sqlite3.Connection', namespace: str, key: str) -> Tuple[bool, Any]:
+    """
+    Returns whether the entry was found and its result, and marks a found entry as recently used
+    """
+    row = db.execute('SELECT value FROM memoized WHERE namespace = ? AND key = ?', (namespace, key)).fetchone()
+
+    if row is None:
+        return False, None
+
+    try:
+        result = pickle.loads(row[0])
+    except Exception:  # an incompatible entry is a cache miss
+        return False, None
+
+    db.execute('UPDATE memoized SET last_used = ? WHERE namespace = ? AND key = ?', (time.time(), namespace, key))
+    db.commit()
+    return True, result
+
+
+def _store_persistent(db: 'sqlite3.Connection', namespace: str, key: str, result: Any) -> bool:
+    """
+    Stores the result without committing it, returns False when the result cannot be pickled
+    """
+    try:
+        value = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError, RecursionError):
+        return False  # results that cannot be pickled are only cached in memory
+
+    db.execute('INSERT OR REPLACE INTO memoized VALUES (?, ?, ?, ?, ?)', (namespace, key, value, len(value), time.time()))
+    return True
+
+
+def _evict_persistent(db: 'sqlite3.Connection', namespace: str, max_entries: int, max_size: int) -> None:
+    count, size = db.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM memoized WHERE namespace = ?',
+                             (namespace,)).fetchone()
+    rows = db.execute('SELECT key, size FROM memoized WHERE namespace = ? ORDER BY last_used', (namespace,))
+    evict = []
+
+    for key, entry_size in rows:
+        if count <= max_entries and size <= max_size:
+            break
+
+        evict.append((namespace, key))
+        count -= 1
+        size -= entry_size
+
+    db.executemany('DELETE FROM memoized WHERE namespace = ? AND key = ?', evict)
+
+
+def _stable_repr(value: Any) -> str:
+    """
+    A representation of the arguments that is the same in every process. Sets and dicts
+    are sorted, because their iteration order depends on the hash seed of the process
+    """
+    if isinstance(value, (list, tuple)):
+        return f'{type(value).__name__}({",".join(_stable_repr(item) for item in value)})'
+
+    if isinstance(value, dict):
+        items = sorted(f'{_stable_repr(k)}:{_stable_repr(v)}' for k, v in value.items())
+        return f'dict({",".join(items)})'
+
+    if isinstance(value, (set, frozenset)):
+        return f'set({",".join(sorted(_stable_repr(item) for item in value))})'
+
+    return repr(value)
+
+
+def _memoized_cache_infos() -> Dict[Callable[..., Any], CacheInfo]:
+    return {func: func.cache_info() for func in _memoized}  # type: ignore
+
+
+def _print_cache_usage(before: Dict[Callable[..., Any], CacheInfo]) -> None:
+    """
+    Prints the hits, misses and evictions of the memoized functions that were called since before
+    """
+    if _collector_silent or output_format() == 'jsonl':
+        return
 
-    def memoized_func(*args):
-        if args in cache:
-            return cache[args]
+    for func, previous in before.items():
+        info: CacheInfo = func.cache_info()  # type: ignore
+        hits, misses = info.hits - previous.hits, info.misses - previous.misses
 
-        result = func(*args)
-        cache[args] = result
-        return result
+        if not hits and not misses:
+            continue
 
-    return memoized_func
+        evictions = info.evictions - previous.evictions
+        rate = hits / (hits + misses) * 100
+        console.print(f'[dim]    memoize {func.__qualname__}: {hits} hits, {misses} misses ({rate:.0f}% hit rate), '
+                      f'{evictions} evictions, {info.currsize}/{info.maxsize} cached')
@@ -0,0 +1,165 @@
+import hashlib
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from adventofcode.config import ROOT_DIR
+from adventofcode.util.helpers import SolutionResult
+from adventofcode.util.input_helpers import get_input_path
+
+HISTORY_DB = os.environ.get('AOC_HISTORY_DB', os.path.abspath(os.path.join(ROOT_DIR, '../../.perf_history.db')))
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS timings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    recorded_at REAL NOT NULL,
+    year INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    part INTEGER NOT NULL,
+    version TEXT NOT NULL,
+    git_commit TEXT,
+    python_version TEXT NOT NULL,
+    input_hash TEXT,
+    duration REAL NOT NULL,
+    peak_memory INTEGER
+);
+CREATE INDEX IF NOT EXISTS timings_solution ON timings (year, day, part, version, recorded_at);
+'''
+
+SolutionId = Tuple[int, int, int, str]
+
+
+@dataclass
+class Trend:
+    """
+    The timing history of a single solution. Every point is the median duration of one run
+    """
+    solution: SolutionId
+    points: List[float]
+    baseline: Optional[float]
+    threshold: float
+
+    @property
+    def latest(self) -> float:
+        return self.points[-1]
+
+    @property
+    def change(self) -> Optional[float]:
+        """
+        Relative change of the latest point compared to the baseline
+        """
+        if not self.baseline:
+            return None
+
+        return (self.latest - self.baseline) / self.baseline
+
+    @property
+    def is_regression(self) -> bool:
+        change = self.change
+        return change is not None and change > self.threshold
+
+
+def connect(db_path: str = HISTORY_DB) -> sqlite3.Connection:
+    connection = sqlite3.connect(db_path)
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def get_git_commit() -> Optional[str]:
+    """
+    Returns the commit hash of the checked out revision, or None when it is not a git checkout
+    """
+    try:
+        output = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=ROOT_DIR, capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return output.stdout.strip()
+
+
+def get_input_hash(year: int, day: int) -> Optional[str]:
+    try:
+        with open(get_input_path(year, day), 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def record_results(results: Iterable[SolutionResult], db_path: str = HISTORY_DB) -> int:
+    """
+    Appends the successful results to the history database as a single run. The peak memory
+    of a result is only known when its memory was tracked, otherwise it is stored as NULL.
+    Returns the amount of recorded results
+    """
+    run_id = uuid.uuid4().hex
+    recorded_at = time.time()
+    commit = get_git_commit()
+    python_version = platform.python_version()
+    input_hashes: Dict[Tuple[int, int], Optional[str]] = {}
+
+    rows = []
+    for result in results:
+        if result.status != 'ok':
+            continue
+
+        if (result.year, result.day) not in input_hashes:
+            input_hashes[(result.year, result.day)] = get_input_hash(result.year, result.day)
+
+        rows.append((
+            run_id, recorded_at, result.year, result.day, result.part, result.version, commit, python_version,
+            input_hashes[(result.year, result.day)], result.duration, result.memory.peak if result.memory else None,
+        ))
+
+    with connect(db_path) as connection:
+        connection.executemany(
+            'INSERT INTO timings (run_id, recorded_at, year, day, part, version, git_commit, python_version, '
+            'input_hash, duration, peak_memory) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            rows,
+        )
+    connection.close()
+
+    return len(rows)
+
+
+def load_trends(db_path: str = HISTORY_DB, window: int = 5, threshold: float = 0.1,
+                year: Optional[int] = None, day: Optional[int] = None) -> List[Trend]:
+    """
+    Loads the timing history per solution. The baseline of a solution is the median of
+    the `window` runs before the latest run
+    """
+    query = 'SELECT year, day, part, version, run_id, duration FROM timings'
+    conditions, params = [], []
+    if year is not None:
+        conditions.append('year = ?')
+        params.append(year)
+    if day is not None:
+        conditions.append('day = ?')
+        params.append(day)
+    if conditions:
+        query += ' WHERE ' + ' AND '.join(conditions)
+    query += ' ORDER BY recorded_at, id'
+
+    connection = connect(db_path)
+    rows = connection.execute(query, params).fetchall()
+    connection.close()
+
+    # Group the durations per solution and per run, keeping the order of the runs
+    runs: Dict[SolutionId, Dict[str, List[float]]] = {}
+    for solution_year, solution_day, part, version, run_id, duration in rows:
+        runs.setdefault((solution_year, solution_day, part, version), {}).setdefault(run_id, []).append(duration)
+
+    trends = []
+    for solution in sorted(runs):
+        points = [statistics.median(durations) for durations in runs[solution].values()]
+        previous = points[:-1][-window:]
+        baseline = statistics.median(previous) if previous else None
+        trends.append(Trend(solution, points, baseline, threshold))
+
+    return trends
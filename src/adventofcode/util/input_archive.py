@@ -0,0 +1,200 @@
+import mmap
+import os
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from adventofcode.config import ROOT_DIR
+
+INPUTS_DIR = os.path.join(ROOT_DIR, 'inputs')
+INPUTS_ARCHIVE = os.environ.get('AOC_INPUTS_ARCHIVE', os.path.join(INPUTS_DIR, 'inputs.pack'))
+
+MAGIC = b'AOCPACK1'
+HEADER = struct.Struct('<8sI')  # magic, amount of entries
+ENTRY = struct.Struct('<HBxQIII')  # year, day, offset, compressed size, size, crc32 of the input
+
+
+@dataclass
+class ArchiveEntry:
+    year: int
+    day: int
+    offset: int
+    compressed_size: int
+    size: int
+    crc32: int
+
+
+class InputArchive:
+    """
+    A single file that holds all inputs as separately zlib compressed blocks, preceded by an index
+    of the blocks. Reading an input only decompresses its own block, which is checked against the
+    crc32 of the input. The archive is memory mapped, so it is opened once for all inputs
+    """
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            self._map: Union[mmap.mmap, bytes] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+
+        magic, count = HEADER.unpack_from(self._map, 0) if len(self._map) >= HEADER.size else (b'', 0)
+        if magic != MAGIC:
+            raise ValueError(f'{path} is not an input archive')
+
+        self.entries: Dict[Tuple[int, int], ArchiveEntry] = {}
+        for i in range(count):
+            entry = ArchiveEntry(*ENTRY.unpack_from(self._map, HEADER.size + i * ENTRY.size))
+            self.entries[(entry.year, entry.day)] = entry
+
+    def __contains__(self, key: Tuple[int, int]) -> bool:
+        return key in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return iter(sorted(self.entries))
+
+    def read(self, year: int, day: int) -> bytes:
+        """
+        Returns the input of the year/day. Raises KeyError when it is not in the archive
+        and ValueError when its block cannot be decompressed or its checksum does not match
+        """
+        entry = self.entries[(year, day)]
+        data: Optional[bytes]
+
+        try:
+            data = zlib.decompress(self._map[entry.offset:entry.offset + entry.compressed_size])
+        except zlib.error:
+            data = None
+
+        if data is None or len(data) != entry.size or zlib.crc32(data) != entry.crc32:
+            raise ValueError(f'the input of {year} day {day:02} in the archive is corrupt')
+
+        return data
+
+    def close(self) -> None:
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+
+
+def build_archive(path: str = INPUTS_ARCHIVE, inputs_dir: str = INPUTS_DIR, level: int = 9) -> List[ArchiveEntry]:
+    """
+    Packs all inputs/<year>/day_XX.txt files into an archive at path and returns its entries
+    """
+    inputs: List[Tuple[int, int, bytes]] = []
+
+    for year_dir in sorted(os.listdir(inputs_dir)):
+        year_path = os.path.join(inputs_dir, year_dir)
+        if not year_dir.isdigit() or not os.path.isdir(year_path):
+            continue
+
+        for file_name in sorted(os.listdir(year_path)):
+            day = _day_of_file(file_name)
+            if day is not None:
+                with open(os.path.join(year_path, file_name), 'rb') as f:
+                    inputs.append((int(year_dir), day, f.read()))
+
+    entries: List[ArchiveEntry] = []
+    blocks: List[bytes] = []
+    offset = HEADER.size + len(inputs) * ENTRY.size
+
+    for year, day, data in inputs:
+        block = zlib.compress(data, level)
+        entries.append(ArchiveEntry(year, day, offset, len(block), len(data), zlib.crc32(data)))
+        blocks.append(block)
+        offset += len(block)
+
+    # Written to a temporary file first, so readers never see a partial archive
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(entries)))
+        for entry in entries:
+            f.write(ENTRY.pack(entry.year, entry.day, entry.offset, entry.compressed_size, entry.size, entry.crc32))
+        for block in blocks:
+            f.write(block)
+
+    os.replace(temp_path, path)
+    return entries
+
+
+def find_stale_entries(archive: InputArchive, archive_mtime: int, inputs_dir: Optional[str] = None) -> Set[Tuple[int, int]]:
+    """
+    Returns the days whose input file changed after the archive was built. fetch-inputs replaces
+    an input file with a rename, which updates the modification time of its year directory, so
+    only the files in year directories that changed after the archive was built are checked
+    """
+    inputs_dir = inputs_dir or INPUTS_DIR
+    stale: Set[Tuple[int, int]] = set()
+
+    for year in sorted({year for year, _ in archive}):
+        year_dir = os.path.join(inputs_dir, str(year))
+        try:
+            if os.stat(year_dir).st_mtime_ns <= archive_mtime:
+                continue
+            files = os.scandir(year_dir)
+        except FileNotFoundError:
+            continue  # the archive can be shipped without the input files
+
+        with files:
+            for file in files:
+                day = _day_of_file(file.name)
+                if day is None or (year, day) not in archive:
+                    continue
+
+                stat = file.stat()
+                if stat.st_mtime_ns > archive_mtime or stat.st_size != archive.entries[(year, day)].size:
+                    stale.add((year, day))
+
+    return stale
+
+
+def _day_of_file(file_name: str) -> Optional[int]:
+    if file_name.startswith('day_') and file_name.endswith('.txt') and file_name[4:-4].isdigit():
+        return int(file_name[4:-4])
+
+    return None
+
+
+# The archive of this process with the days whose input file is newer, or None when there is no archive
+_archive: Optional[Tuple[str, Optional[InputArchive], Set[Tuple[int, int]]]] = None
+
+
+def read_archived_input(year: int, day: int, path: Optional[str] = None) -> Optional[bytes]:
+    """
+    Returns the input of the year/day from the input archive, or None when there is no archive,
+    the archive does not contain the input or the input file changed after the archive was built.
+    The archive is opened and checked once per process, call close_archive to open it again
+    """
+    global _archive
+    path = path or INPUTS_ARCHIVE
+
+    if _archive is None or _archive[0] != path:
+        close_archive()
+        _archive = _open_archive(path)
+
+    _, archive, stale = _archive
+    if archive is None or (year, day) not in archive or (year, day) in stale:
+        return None
+
+    return archive.read(year, day)
+
+
+def _open_archive(path: str) -> Tuple[str, Optional[InputArchive], Set[Tuple[int, int]]]:
+    try:
+        archive_mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return path, None, set()
+
+    archive = InputArchive(path)
+    return path, archive, find_stale_entries(archive, archive_mtime)
+
+
+def close_archive() -> None:
+    """
+    Closes the archive of this process, so the next read opens it again, e.g. after it was rebuilt
+    """
+    global _archive
+
+    if _archive is not None and _archive[1] is not None:
+        _archive[1].close()
+    _archive = None
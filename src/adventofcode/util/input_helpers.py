@@ -1,30 +1,207 @@
+import hashlib
+import io
+import mmap
 import os
-from typing import List
+from array import array
+from typing import IO, Iterable, Iterator, List, Optional
 
 from adventofcode.config import ROOT_DIR
+from adventofcode.util.input_archive import read_archived_input
+
+
+def get_input_path(year: int, day: int) -> str:
+    """
+    Get the path of the input file for the year/day
+    """
+    return os.path.join(ROOT_DIR, 'inputs', str(year), f'day_{day:02}.txt')
+
+
+class InputLines(List[str]):
+    """
+    The lines of an input, with the sha256 of the input as digest. The parse cache keys
+    on the digest, so it does not have to hash the lines again
+    """
+
+    def __init__(self, lines: Iterable[str] = (), digest: Optional[str] = None):
+        super().__init__(lines)
+        self.digest = digest
+
+    def copy(self) -> 'InputLines':
+        return InputLines(self, self.digest)
 
 
 def get_input_for_day(year: int, day: int) -> List[str]:
     """
-    Get the input for the year/day as list of strings
+    Get the input for the year/day as list of strings. The input is read from
+    the input archive when it contains the day, otherwise from the input file
     """
-    input_file = os.path.join(ROOT_DIR, 'inputs', str(year), f'day_{day:02}.txt')
-    return _get_input(input_file)
+    data = read_archived_input(year, day)
+    if data is not None:
+        return InputLines((line.strip() for line in _decode(data)), _digest(data))
+
+    return _get_input(get_input_path(year, day))
 
 
 def get_input_for_day_as_str(year: int, day: int) -> str:
-    input_file = os.path.join(ROOT_DIR, 'inputs', str(year), f'day_{day:02}.txt')
-    return _read_file(input_file)
+    archived = _read_archived(year, day)
+    if archived is not None:
+        return archived.getvalue().rstrip('\n')
+
+    return _read_file(get_input_path(year, day))
+
+
+def iter_input_for_day(year: int, day: int, chunk_size: int = io.DEFAULT_BUFFER_SIZE) -> Iterator[str]:
+    """
+    Get the input for the year/day as an iterator of stripped lines. The file is read lazily
+    in chunks of chunk_size bytes, so memory use does not depend on the size of the input.
+    Raises FileNotFoundError right away when the input does not exist
+    """
+    archived = _read_archived(year, day)
+    file = archived if archived is not None else open(get_input_path(year, day), buffering=chunk_size)
+    return _iter_lines(file)
+
+
+def _read_archived(year: int, day: int) -> Optional[io.StringIO]:
+    """
+    Returns the input of the year/day from the input archive as text, with
+    the same newline translation as reading the input file
+    """
+    data = read_archived_input(year, day)
+    return _decode(data) if data is not None else None
+
+
+def _decode(data: bytes) -> io.StringIO:
+    return io.StringIO(data.decode(), newline=None)
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _iter_lines(file: IO[str]) -> Iterator[str]:
+    with file:
+        for line in file:
+            yield line.strip()
+
+
+def get_input_for_day_mmap(year: int, day: int) -> 'MappedInput':
+    """
+    Get the input for the year/day as a read-only memory map, which gives access
+    to the lines as memoryview slices without copying the file into memory.
+    Always maps the input file, the input archive is not used
+    """
+    return MappedInput(get_input_path(year, day))
+
+
+class MappedInput:
+    """
+    Read-only memory mapped input file with a line offset index.
+
+    Lines are returned as memoryview slices of the map, without the line terminator, so
+    no copy is made until the caller converts a line with bytes() or str(line, 'ascii').
+    The slices are only valid while the input is open, so release them before closing.
+    """
+
+    def __init__(self, file_name: str):
+        with open(file_name, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            # An empty file cannot be memory mapped
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+
+        self._view = memoryview(self._map if self._map is not None else b'')
+        self._offsets: Optional['array[int]'] = None
+
+    @property
+    def view(self) -> memoryview:
+        """
+        The content of the whole file
+        """
+        return self._view
+
+    def _line_offsets(self) -> 'array[int]':
+        """
+        Builds the index with the start offset of every line on first use
+        """
+        if self._offsets is None:
+            offsets = array('Q')
+            size = len(self._view)
+            start = 0
+
+            while start < size:
+                offsets.append(start)
+                end = self._map.find(b'\n', start) if self._map is not None else -1
+                start = size if end == -1 else end + 1
+
+            self._offsets = offsets
+
+        return self._offsets
+
+    def _line_end(self, index: int) -> int:
+        offsets = self._line_offsets()
+        size = len(self._view)
+
+        if index + 1 < len(offsets):
+            newline = offsets[index + 1] - 1
+        else:
+            newline = size - 1 if self._view[size - 1] == 0x0a else size
+
+        return self._strip_terminator(offsets[index], newline)
+
+    def _strip_terminator(self, start: int, newline: int) -> int:
+        """
+        Returns the end of the line from start to newline, the position of its \n or the end of
+        the file, without the \r of a \r\n terminator. Only a single terminator is removed
+        """
+        if newline > start and self._view[newline - 1] == 0x0d:
+            return newline - 1
+
+        return newline
+
+    def __len__(self) -> int:
+        return len(self._line_offsets())
+
+    def __getitem__(self, index: int) -> memoryview:
+        offsets = self._line_offsets()
+        if index < 0:
+            index += len(offsets)
+        if not 0 <= index < len(offsets):
+            raise IndexError('line index out of range')
+
+        return self._view[offsets[index]:self._line_end(index)]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        # Scans the map directly instead of going through the index, which is a lot faster
+        view = self._view
+        size = len(view)
+        start = 0
+
+        while start < size:
+            end = self._map.find(b'\n', start)  # type: ignore
+            next_start = size if end == -1 else end + 1
+
+            yield view[start:self._strip_terminator(start, size if end == -1 else end)]
+            start = next_start
+
+    def close(self) -> None:
+        self._view.release()
+        if self._map is not None:
+            self._map.close()
+
+    def __enter__(self) -> 'MappedInput':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
 
 def _read_lines(file_name) -> List[str]:
     """
-    Reads file to list of string
+    Reads file to list of string, with the sha256 of the file as digest
     """
-    with open(file_name) as file:
-        lines = file.readlines()
+    with open(file_name, 'rb') as file:
+        data = file.read()
 
-    return lines
+    return InputLines(_decode(data).readlines(), _digest(data))
 
 
 def _get_input(file_name) -> List[str]:
@@ -32,7 +209,7 @@ def _get_input(file_name) -> List[str]:
     Strips new lines from input file and returns it as list of string
     """
     lines = _read_lines(file_name)
-    return [line.strip() for line in lines]
+    return InputLines((line.strip() for line in lines), getattr(lines, 'digest', None))
 
 
 def _read_file(file_name) -> str:
@@ -1,6 +1,8 @@
 import ast
+import hashlib
+import inspect
 import os
-from typing import List
+from typing import Any, Callable, List
 
 from adventofcode.config import ROOT_DIR
 
@@ -21,6 +23,19 @@ def get_full_day_paths(year_path: str) -> List[str]:
     return sorted(paths)
 
 
+def source_hash(func: Callable[..., Any]) -> str:
+    """
+    Returns the sha256 of the source file of the module the function is defined in, which
+    cache keys include so changing the module invalidates the cached results
+    """
+    try:
+        with open(inspect.getsourcefile(func) or '', 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except (OSError, TypeError):
+        # Without a source file every process gets its own key, which disables the cache
+        return f'{os.getpid()}-{id(func)}'
+
+
 def get_functions_from_day_file(day: str):
     """
     Uses ast to retrieve all top level functions in the provided day file
@@ -67,3 +82,11 @@ def get_full_module_from_day_file(day_file: str) -> str:
     segments = ['adventofcode'] + segments[-2:]
     module = '.'.join(segments).replace('.py', '')
     return module
+
+
+def get_full_module_from_year_day(year: int, day: int) -> str:
+    """
+    Returns the full module for the given year and day
+    Example: adventofcode.year_2020.day_01_2020
+    """
+    return f'adventofcode.year_{year}.day_{day:02}_{year}'
@@ -0,0 +1,123 @@
+import atexit
+import json
+import os
+import sys
+from dataclasses import asdict
+from typing import Any, Dict, IO, Optional, Sequence
+
+from adventofcode.util.console import console
+
+OUTPUT_FORMATS = ('rich', 'jsonl')
+BUFFER_SIZE = 64 * 1024
+
+
+def output_format() -> str:
+    """
+    Returns the format the results are written in, set with AOC_OUTPUT. rich prints them
+    to the console, jsonl writes a JSON object per result to stdout or AOC_OUTPUT_FILE
+    """
+    value = os.environ.get('AOC_OUTPUT', 'rich')
+    return value if value in OUTPUT_FORMATS else 'rich'
+
+
+def use_json_lines(path: str) -> None:
+    """
+    Writes the results as JSON lines to path, or to stdout when path is '-'. The
+    format is set in the environment, so worker processes inherit it
+    """
+    os.environ['AOC_OUTPUT'] = 'jsonl'
+    os.environ['AOC_OUTPUT_FILE'] = path
+
+
+def write_results(results: Sequence[Any], as_json: bool, summary: str) -> None:
+    """
+    Finishes the output of a run. With as_json all results are printed as one JSON document,
+    in the jsonl format the buffered lines are flushed, otherwise the summary is printed
+    """
+    if as_json:
+        print(json.dumps([asdict(result) for result in results], indent=2, default=str))
+    elif output_format() == 'jsonl':
+        flush_results()
+    else:
+        console.print(summary)
+
+
+def result_record(result: Any) -> Dict[str, Any]:
+    """
+    Returns the JSON lines record of a solution result, the duration is in ns
+    """
+    record = {
+        'year': result.year,
+        'day': result.day,
+        'part': result.part,
+        'version': result.version,
+        'answer': result.answer,
+        'ns': round(result.duration * 1_000_000),
+        'status': result.status,
+    }
+
+    if result.memory is not None:
+        record['peak'] = result.memory.peak
+
+    return record
+
+
+class JsonLinesWriter:
+    """
+    Writes one JSON object per line to a file, or to stdout when no path is given.
+    Files are written through a large buffer, which is flushed at exit
+    """
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._file: Optional[IO[str]] = open(path, 'a', buffering=BUFFER_SIZE) if path else None
+
+    @property
+    def stream(self) -> IO[str]:
+        # stdout is looked up on every write, so redirecting it is respected
+        return self._file or sys.stdout
+
+    def write(self, record: Dict[str, Any]) -> None:
+        self.stream.write(json.dumps(record, default=str) + '\n')
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+_writer: Optional[JsonLinesWriter] = None
+
+
+def get_writer() -> JsonLinesWriter:
+    """
+    Returns the writer of AOC_OUTPUT_FILE, or of stdout when it is not set or '-'
+    """
+    global _writer
+    value = os.environ.get('AOC_OUTPUT_FILE', '-')
+    path = None if value == '-' else value
+
+    if _writer is None or _writer.path != path:
+        if _writer is not None:
+            _writer.close()
+        _writer = JsonLinesWriter(path)
+
+    return _writer
+
+
+def write_result(result: Any) -> None:
+    """
+    Writes the solution result as a JSON line
+    """
+    get_writer().write(result_record(result))
+
+
+@atexit.register
+def flush_results() -> None:
+    """
+    Flushes the results that are still buffered
+    """
+    if _writer is not None:
+        _writer.flush()
@@ -0,0 +1,156 @@
+import hashlib
+import os
+import pickle
+import sys
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+from adventofcode.config import CACHE_DIR
+from adventofcode.util.module_helpers import source_hash
+
+PARSE_CACHE_DIR = os.path.join(CACHE_DIR, 'parsed')
+
+MAX_CACHE_SIZE = 256 * 1024 * 1024  # bytes
+MAX_CACHE_AGE = 7 * 24 * 60 * 60  # seconds
+
+
+def cached_parse(max_size: int = MAX_CACHE_SIZE, max_age: float = MAX_CACHE_AGE):  # type: ignore
+    """
+    Caches the result of a parse function on disk. The cache is keyed on the sha256 of the
+    input file and on the source of the module the parse function is defined in, so changing either
+    the input or the parser invalidates the entry. Inputs that do not come from the input loader
+    are keyed on their lines instead.
+
+    Results are stored with pickle, numpy arrays as .npy files. Entries older than max_age seconds
+    are evicted, and the least recently used entries are evicted when the cache exceeds max_size bytes.
+    Set AOC_PARSE_CACHE=0 to disable the cache.
+    """
+    def decorator(func: Callable):  # type: ignore
+        func_hash = source_hash(func)
+
+        def wrapper(input_data: List[str]):
+            if os.environ.get('AOC_PARSE_CACHE', '1') == '0':
+                return func(input_data)
+
+            key = _cache_key(func, func_hash, input_data)
+            found, parsed = _load(key)
+
+            if found:
+                return parsed
+
+            parsed = func(input_data)
+            _store(key, parsed)
+            evict(max_size, max_age)
+            return parsed
+
+        return wrapper
+
+    return decorator
+
+
+def evict(max_size: int = MAX_CACHE_SIZE, max_age: float = MAX_CACHE_AGE, cache_dir: Optional[str] = None) -> int:
+    """
+    Removes entries that are older than max_age seconds, then removes the least recently
+    used entries until the cache is at most max_size bytes. Returns the amount of removed entries
+    """
+    cache_dir = cache_dir or PARSE_CACHE_DIR
+
+    if not os.path.isdir(cache_dir):
+        return 0
+
+    entries: List[Tuple[float, int, str]] = []
+    for name in os.listdir(cache_dir):
+        if name.endswith('.tmp'):
+            continue  # an entry another process is still writing
+
+        path = os.path.join(cache_dir, name)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue  # removed by another process in the meantime
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    now = time.time()
+    removed = 0
+    total_size = sum(size for _, size, _ in entries)
+
+    # Oldest entries first, so expired entries are removed before the size limit is checked
+    for mtime, size, path in sorted(entries):
+        if now - mtime <= max_age and total_size <= max_size:
+            break
+
+        _remove(path)
+        total_size -= size
+        removed += 1
+
+    return removed
+
+
+def _cache_key(func: Callable, source_hash: str, input_data: List[str]) -> str:  # type: ignore
+    digest = hashlib.sha256()
+    digest.update(f'{func.__module__}.{func.__qualname__}\0{source_hash}\0'.encode())
+    # The input loader hashes the file once when it is read, other inputs are hashed here
+    input_digest: Optional[str] = getattr(input_data, 'digest', None)
+    if input_digest is not None:
+        digest.update(f'file\0{input_digest}'.encode())
+    else:
+        digest.update(b'lines\0')
+        digest.update('\n'.join(input_data).encode())
+    return digest.hexdigest()
+
+
+def _load(key: str) -> Tuple[bool, Any]:
+    for extension in ('.pickle', '.npy'):
+        path = os.path.join(PARSE_CACHE_DIR, key + extension)
+
+        if not os.path.exists(path):
+            continue
+
+        try:
+            if extension == '.npy':
+                import numpy as np
+                parsed = np.load(path, allow_pickle=False)
+            else:
+                with open(path, 'rb') as f:
+                    parsed = pickle.load(f)
+        except Exception:  # a corrupt or incompatible entry is a cache miss
+            _remove(path)
+            return False, None
+
+        try:
+            os.utime(path)  # mark the entry as recently used
+        except FileNotFoundError:
+            pass  # evicted by another process after it was loaded
+        return True, parsed
+
+    return False, None
+
+
+def _store(key: str, parsed: Any) -> None:
+    os.makedirs(PARSE_CACHE_DIR, exist_ok=True)
+    numpy: Optional[Any] = sys.modules.get('numpy')
+    is_array = numpy is not None and isinstance(parsed, numpy.ndarray) and parsed.dtype != object
+    path = os.path.join(PARSE_CACHE_DIR, key + ('.npy' if is_array else '.pickle'))
+    temp_path = f'{path}.{os.getpid()}.tmp'
+
+    try:
+        with open(temp_path, 'wb') as f:
+            if is_array:
+                numpy.save(f, parsed)  # type: ignore
+            else:
+                pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError, RecursionError):
+        _remove(temp_path)  # not every parsed structure can be pickled, those are just not cached
+        return
+
+    try:
+        os.replace(temp_path, path)
+    except OSError:
+        _remove(temp_path)  # the entry is just not cached, the next run tries again
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
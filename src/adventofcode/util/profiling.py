@@ -0,0 +1,512 @@
+import fnmatch
+import html
+import inspect
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import zlib
+from dataclasses import dataclass, field
+from types import CodeType, FrameType
+from typing import TYPE_CHECKING, Any, Callable, Counter, Dict, List, Optional, Set, Tuple
+
+from adventofcode.config import ROOT_DIR
+
+if TYPE_CHECKING:
+    import pstats
+
+PROFILE_DIR = os.environ.get('AOC_PROFILE_DIR', os.path.abspath(os.path.join(ROOT_DIR, '../../.aoc_profiles')))
+
+Stacks = Dict[str, int]  # collapsed stack ('outer;inner;leaf') -> count
+PstatsKey = Tuple[str, int, str]
+LineStats = Dict[CodeType, Dict[int, List[float]]]  # code -> line -> [hits, time in s]
+
+MAX_DEPTH = 256
+TOP_ALLOCATIONS = 3
+
+
+def frame_name(filename: str, line: int, name: str) -> str:
+    """
+    The name of a frame in a collapsed stack, e.g. 'simulate (day_14_2022.py:42)'
+    """
+    if filename == '~':  # built-in functions
+        return name.replace(';', ',')
+
+    return f'{name} ({os.path.basename(filename)}:{line})'.replace(';', ',')
+
+
+def collapse_pstats(stats: 'pstats.Stats', unit: float = 1e-6) -> Stacks:
+    """
+    Converts cProfile statistics into collapsed stacks, counted in units of seconds (µs by default).
+
+    cProfile only records caller/callee pairs, not complete stacks. The time of a function is
+    divided over its callers in proportion to the time spent on each call edge, like flameprof
+    does. Recursive calls are folded into the outermost call
+    """
+    raw: Dict[PstatsKey, Any] = stats.stats  # type: ignore
+    walker = _PstatsWalker(raw, unit)
+
+    for func, (_, _, _, _, callers) in raw.items():
+        # The profiler's own __exit__ and disable calls are recorded as roots as well
+        if not callers and not func[0].endswith('cProfile.py') and '_lsprof.Profiler' not in func[2]:
+            walker.visit(func, (), (func,), 1.0)
+
+    return dict(walker.stacks)
+
+
+class _PstatsWalker:
+    """
+    Walks the call graph of cProfile statistics from a root function and counts the
+    time of every stack it passes, see collapse_pstats
+    """
+    def __init__(self, raw: Dict[PstatsKey, Any], unit: float):
+        self.raw = raw
+        self.unit = unit
+        self.stacks: Counter[str] = Counter()
+        self.callees: Dict[PstatsKey, List[PstatsKey]] = {func: [] for func in raw}
+
+        for func, (_, _, _, _, callers) in raw.items():
+            for caller in callers:
+                self.callees.setdefault(caller, []).append(func)
+
+    def visit(self, func: PstatsKey, stack: Tuple[str, ...], seen: Tuple[PstatsKey, ...], fraction: float) -> None:
+        _, _, self_time, total_time, _ = self.raw[func]
+        stack = stack + (frame_name(*func),)
+        self_count = round(self_time * fraction / self.unit)
+
+        if self_count:
+            self.stacks[';'.join(stack)] += self_count
+
+        if len(stack) >= MAX_DEPTH:
+            return
+
+        for callee in self.callees.get(func, []):
+            callee_total = self.raw[callee][3]
+            edge_total = self.raw[callee][4][func][3]
+
+            if callee in seen or not callee_total or not edge_total:
+                continue
+
+            self.visit(callee, stack, seen + (callee,), fraction * edge_total / callee_total)
+
+
+class StackSampler:
+    """
+    Samples the stack of the current thread from a background thread every interval seconds.
+    Only the frames below the frame that started the sampler are recorded.
+
+    The sampler only runs when the profiled code releases the GIL, which happens at least
+    every sys.getswitchinterval() seconds, so the overhead does not depend on how hot a loop is
+    """
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._thread_id = threading.get_ident()
+        self._root: Optional[FrameType] = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+
+    def __enter__(self) -> 'StackSampler':
+        self._root = sys._getframe(1)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._root = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            names = []
+
+            while frame is not None and frame is not self._root:
+                code = frame.f_code
+                names.append(frame_name(code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+
+            # Samples taken while the root frame is not on the stack are not part of the profile
+            if frame is self._root and names:
+                self.stacks[';'.join(reversed(names))] += 1
+                self.samples += 1
+
+
+class LineProfiler:
+    """
+    Records the hits and the time per line of all functions in the module of the profiled
+    function. The time of a line includes the time of the functions it calls.
+
+    Uses sys.monitoring on Python 3.12+, which only instruments the functions of the module,
+    and sys.settrace on older versions
+    """
+    def __init__(self, func: Callable):  # type: ignore
+        self.filename = func.__code__.co_filename
+        self.codes = _module_codes(func)
+        self.lines: LineStats = {}
+        self.use_monitoring = hasattr(sys, 'monitoring')
+        self._tool_id: Optional[int] = None
+        self._stack: List[List[Any]] = []  # [code, line, time] of the running profiled frames
+        self._frames: Dict[FrameType, List[Any]] = {}
+        self._previous_trace: Optional[Callable] = None  # type: ignore
+
+    def __enter__(self) -> 'LineProfiler':
+        if self.use_monitoring:
+            self._start_monitoring()
+        else:
+            self._previous_trace = sys.gettrace()
+            sys.settrace(self._trace)
+
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self.use_monitoring:
+            self._stop_monitoring()
+        else:
+            sys.settrace(self._previous_trace)  # type: ignore
+
+    def _record(self, code: CodeType, line: Optional[int], elapsed: float, hit: bool = False) -> None:
+        if line is None:
+            return
+
+        stats = self.lines.setdefault(code, {}).setdefault(line, [0, 0.0])
+        stats[0] += hit
+        stats[1] += elapsed
+
+    # sys.monitoring, Python 3.12+
+
+    def _start_monitoring(self) -> None:
+        monitoring = sys.monitoring  # type: ignore
+        events = monitoring.events
+        self._tool_id = _use_tool_id('solution_line_profiler')
+        callbacks = {
+            events.PY_START: self._on_start,
+            events.PY_RESUME: self._on_start,
+            events.PY_RETURN: self._on_return,
+            events.PY_YIELD: self._on_return,
+            events.PY_UNWIND: self._on_unwind,
+            events.LINE: self._on_line,
+        }
+        for event, callback in callbacks.items():
+            monitoring.register_callback(self._tool_id, event, callback)
+
+        local_events = events.PY_START | events.PY_RESUME | events.PY_RETURN | events.PY_YIELD | events.LINE
+        for code in self.codes:
+            monitoring.set_local_events(self._tool_id, code, local_events)
+
+        # Unwinding cannot be monitored per code object
+        monitoring.set_events(self._tool_id, events.PY_UNWIND)
+
+    def _stop_monitoring(self) -> None:
+        monitoring = sys.monitoring  # type: ignore
+        monitoring.set_events(self._tool_id, 0)
+
+        for code in self.codes:
+            monitoring.set_local_events(self._tool_id, code, 0)
+
+        for event in (monitoring.events.PY_START, monitoring.events.PY_RESUME, monitoring.events.PY_RETURN,
+                      monitoring.events.PY_YIELD, monitoring.events.PY_UNWIND, monitoring.events.LINE):
+            monitoring.register_callback(self._tool_id, event, None)
+
+        monitoring.free_tool_id(self._tool_id)
+        self._tool_id = None
+        self._stack.clear()
+
+    def _on_start(self, code: CodeType, offset: int) -> None:
+        self._stack.append([code, None, time.perf_counter()])
+
+    def _on_line(self, code: CodeType, line: int) -> None:
+        now = time.perf_counter()
+
+        if self._stack:
+            frame = self._stack[-1]
+            self._record(frame[0], frame[1], now - frame[2])
+            self._record(code, line, 0.0, hit=True)
+            frame[0], frame[1], frame[2] = code, line, now
+
+    def _on_return(self, code: CodeType, offset: int, value: Any) -> None:
+        if self._stack:
+            frame = self._stack.pop()
+            self._record(frame[0], frame[1], time.perf_counter() - frame[2])
+
+    def _on_unwind(self, code: CodeType, offset: int, exception: BaseException) -> None:
+        if code in self.codes:
+            self._on_return(code, offset, None)
+
+    # sys.settrace, older Python versions
+
+    def _trace(self, frame: FrameType, event: str, arg: Any) -> Optional[Callable]:  # type: ignore
+        if event != 'call' or frame.f_code.co_filename != self.filename:
+            return None
+
+        self.codes.add(frame.f_code)
+        self._frames[frame] = [frame.f_code, None, time.perf_counter()]
+        return self._trace_frame
+
+    def _trace_frame(self, frame: FrameType, event: str, arg: Any) -> Optional[Callable]:  # type: ignore
+        now = time.perf_counter()
+        state = self._frames.get(frame)
+
+        if state is None:  # a generator that is resumed
+            state = self._frames[frame] = [frame.f_code, None, now]
+
+        self._record(state[0], state[1], now - state[2])
+
+        if event == 'line':
+            self._record(state[0], frame.f_lineno, 0.0, hit=True)
+            state[1], state[2] = frame.f_lineno, time.perf_counter()
+        elif event == 'return':
+            del self._frames[frame]
+        else:
+            state[2] = time.perf_counter()
+
+        return self._trace_frame
+
+
+def _module_codes(func: Callable) -> Set[CodeType]:  # type: ignore
+    """
+    Returns the code objects of all functions, methods and nested functions in the module of func
+    """
+    module = inspect.getmodule(func)
+    filename = func.__code__.co_filename
+    candidates: List[Any] = [func]
+
+    if module is not None:
+        for value in vars(module).values():
+            candidates.append(value)
+            if inspect.isclass(value):
+                candidates.extend(vars(value).values())
+
+    codes: Set[CodeType] = set()
+
+    for candidate in candidates:
+        candidate = inspect.unwrap(candidate) if callable(candidate) else candidate
+        code = getattr(candidate, '__code__', None)
+        todo = [code] if isinstance(code, CodeType) and code.co_filename == filename else []
+
+        while todo:
+            code = todo.pop()
+            if code not in codes:
+                codes.add(code)
+                todo.extend(const for const in code.co_consts if isinstance(const, CodeType))
+
+    return codes
+
+
+@dataclass
+class MemoryStats:
+    """
+    Memory use of a single solution run, as traced by tracemalloc
+    """
+    peak: int  # bytes allocated at the peak, on top of what was allocated before the run
+    blocks: int  # blocks that are still allocated after the run
+    top: List[Tuple[str, int, int]] = field(default_factory=list)  # (file:line, bytes, blocks) live at the return
+
+
+class MemoryTracker:
+    """
+    Traces the memory allocated by a call of func with tracemalloc. The top allocation sites are
+    taken when func returns, while its local variables are still alive. That uses sys.monitoring
+    on Python 3.12+ and sys.setprofile on older versions, which slows down calls a lot more. When
+    another profiler is active on older versions, the sites are taken after the return instead
+    """
+    def __init__(self, func: Callable, top: int = TOP_ALLOCATIONS):  # type: ignore
+        self.code = getattr(inspect.unwrap(func), '__code__', None)
+        self.top = top
+        self.stats: Optional[MemoryStats] = None
+        self._started = False
+        self._caller: Optional[FrameType] = None
+        self._tool_id: Optional[int] = None
+        self._depth = 0
+        self._at_return: Optional[tracemalloc.Snapshot] = None
+
+    def __enter__(self) -> 'MemoryTracker':
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start()
+
+        self._before = _snapshot()
+        self._base, self._peak_before = tracemalloc.get_traced_memory()
+        if hasattr(tracemalloc, 'reset_peak'):  # Python 3.9+
+            tracemalloc.reset_peak()
+            self._peak_before = 0
+
+        if self.code is None:
+            pass
+        elif hasattr(sys, 'monitoring') and any(sys.monitoring.get_tool(i) is None for i in range(6)):  # type: ignore
+            self._start_monitoring()
+        elif sys.getprofile() is None:
+            self._caller = sys._getframe(1)
+            sys.setprofile(self._profile)
+
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._tool_id is not None:
+            self._stop_monitoring()
+        elif self._caller is not None:
+            sys.setprofile(None)
+            self._caller = None
+
+        current, peak = tracemalloc.get_traced_memory()
+        # Without reset_peak the peak can be one from before the run, which only tells that the
+        # run allocated no more than that, so the memory still allocated is the best estimate
+        peak = (peak if peak > self._peak_before else current) - self._base
+        after = _snapshot()
+
+        if self._started:
+            tracemalloc.stop()
+
+        blocks = sum(stat.count_diff for stat in after.compare_to(self._before, 'filename'))
+        live = (self._at_return or after).compare_to(self._before, 'lineno')
+        top = [
+            (f'{_short_path(stat.traceback[0].filename)}:{stat.traceback[0].lineno}', stat.size_diff, stat.count_diff)
+            for stat in sorted(live, key=lambda stat: stat.size_diff, reverse=True)[:self.top] if stat.size_diff > 0
+        ]
+        self.stats = MemoryStats(peak=max(peak, 0), blocks=blocks, top=top)
+
+    def _profile(self, frame: FrameType, event: str, arg: Any) -> None:
+        if event == 'return' and frame.f_code is self.code and frame.f_back is self._caller:
+            self._at_return = _snapshot()
+
+    def _start_monitoring(self) -> None:
+        monitoring = sys.monitoring  # type: ignore
+        self._tool_id = _use_tool_id('solution_timer memory')
+        monitoring.register_callback(self._tool_id, monitoring.events.PY_START, self._on_start)
+        monitoring.register_callback(self._tool_id, monitoring.events.PY_RETURN, self._on_return)
+        monitoring.set_local_events(self._tool_id, self.code,
+                                    monitoring.events.PY_START | monitoring.events.PY_RETURN)
+
+    def _stop_monitoring(self) -> None:
+        monitoring = sys.monitoring  # type: ignore
+        monitoring.set_local_events(self._tool_id, self.code, 0)
+        monitoring.register_callback(self._tool_id, monitoring.events.PY_START, None)
+        monitoring.register_callback(self._tool_id, monitoring.events.PY_RETURN, None)
+        monitoring.free_tool_id(self._tool_id)
+        self._tool_id = None
+
+    def _on_start(self, code: CodeType, offset: int) -> None:
+        self._depth += 1
+
+    def _on_return(self, code: CodeType, offset: int, value: Any) -> None:
+        # Only the outermost call, a recursive solution returns many times
+        self._depth -= 1
+        if self._depth == 0:
+            self._at_return = _snapshot()
+
+
+def _use_tool_id(name: str) -> int:
+    """
+    Claims a free sys.monitoring tool id
+    """
+    monitoring = sys.monitoring  # type: ignore
+    free = [tool_id for tool_id in range(6) if monitoring.get_tool(tool_id) is None]
+
+    if not free:
+        raise RuntimeError('all sys.monitoring tool ids are in use')
+
+    monitoring.use_tool_id(free[-1], name)
+    return free[-1]
+
+
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, os.path.join(os.path.dirname(__file__), 'helpers.py')),  # the solution timer
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+    tracemalloc.Filter(False, '<frozen abc>'),
+)
+
+# The filters compile their patterns on first use, which would count as memory of the first traced run
+for _filter in _SNAPSHOT_FILTERS:
+    fnmatch.fnmatch('', _filter.filename_pattern)
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+
+def _short_path(path: str) -> str:
+    return os.path.join(*path.split(os.sep)[-2:])
+
+
+def format_bytes(size: float) -> str:
+    for unit in ('B', 'KiB', 'MiB'):
+        if abs(size) < 1024:
+            return f'{size:.1f} {unit}' if unit != 'B' else f'{size:.0f} B'
+        size /= 1024
+
+    return f'{size:.1f} GiB'
+
+
+def write_collapsed(stacks: Stacks, path: str) -> None:
+    """
+    Writes the stacks in the collapsed stack format used by Brendan Gregg's flamegraph.pl
+    """
+    with open(path, 'w') as f:
+        for stack, count in sorted(stacks.items()):
+            f.write(f'{stack} {count}\n')
+
+
+def render_flamegraph(stacks: Stacks, title: str, unit: str = 'samples', width: int = 1200) -> str:
+    """
+    Renders the stacks as a self-contained SVG flamegraph, hover a frame to see its name and count
+    """
+    tree: Dict[str, Any] = {'children': {}, 'count': 0}
+
+    for stack, count in stacks.items():
+        node = tree
+        node['count'] += count
+
+        for name in stack.split(';'):
+            node = node['children'].setdefault(name, {'children': {}, 'count': 0})
+            node['count'] += count
+
+    frame_height = 16
+    rectangles: List[str] = []
+    depth = _layout(tree, 0, 0.0, width / max(tree['count'], 1), frame_height, unit, rectangles)
+    height = (depth + 1) * frame_height + 40
+
+    return '\n'.join([
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" font-family="monospace" '
+        f'font-size="11">',
+        '<rect width="100%" height="100%" fill="#f8f8f8"/>',
+        f'<text x="{width / 2}" y="20" text-anchor="middle" font-size="14">{html.escape(title)}</text>',
+        f'<g transform="translate(0, {height - frame_height})">',
+        *rectangles,
+        '</g>',
+        '</svg>',
+    ])
+
+
+def _layout(node: Dict[str, Any], depth: int, x: float, scale: float, frame_height: int, unit: str,
+            rectangles: List[str]) -> int:
+    """
+    Adds the rectangles of the children of the node, root frames at the bottom. Returns the maximum depth
+    """
+    max_depth = depth
+
+    for name, child in sorted(node['children'].items()):
+        width = child['count'] * scale
+
+        if width >= 0.5:  # narrower frames would not be visible
+            # The color only depends on the name, so a function has the same color everywhere
+            hue = zlib.crc32(name.encode()) % 60
+            label = html.escape(name)
+            characters = int(width / 7)
+            text = label if len(name) <= characters else html.escape(name[:max(characters - 2, 0)]) + '..'
+            y = -depth * frame_height
+            rectangles.append(
+                f'<g><title>{label} ({child["count"]} {unit})</title>'
+                f'<rect x="{x:.2f}" y="{y}" width="{width:.2f}" height="{frame_height - 1}" '
+                f'fill="hsl({hue}, 90%, 60%)"/>'
+                + (f'<text x="{x + 3:.2f}" y="{y + frame_height - 4}">{text}</text>' if characters > 2 else '')
+                + '</g>'
+            )
+            max_depth = max(max_depth, _layout(child, depth + 1, x, scale, frame_height, unit, rectangles))
+
+        x += width
+
+    return max_depth
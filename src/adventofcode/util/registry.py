@@ -0,0 +1,154 @@
+import ast
+import hashlib
+import json
+import os
+from dataclasses import dataclass, asdict, field
+from typing import Any, Dict, List, Optional
+
+from adventofcode.config import CACHE_DIR
+from adventofcode.util.module_helpers import get_full_year_paths, get_full_day_paths, clean_year, clean_day, \
+    get_full_module_from_day_file
+
+REGISTRY_FILE = os.path.join(CACHE_DIR, 'registry.json')
+REGISTRY_VERSION = 1
+
+
+@dataclass
+class DayEntry:
+    """
+    A day file in the registry. versions maps the solution functions to the
+    part and version given to their solution_timer decorator
+    """
+    year: int
+    day: int
+    module: str
+    path: str
+    mtime: int
+    size: int
+    hash: str
+    functions: List[str] = field(default_factory=list)
+    versions: Dict[str, List[Any]] = field(default_factory=dict)
+
+    @property
+    def parts(self) -> Dict[str, bool]:
+        return {part: part in self.functions for part in ('part_one', 'part_two')}
+
+
+def part_versions(entry: DayEntry, part: int) -> Dict[str, str]:
+    """
+    Returns the versions of the part of the day, mapping the version to the name of its solution
+    function. Versions are functions with a solution_timer for the same part, the unversioned
+    solution is named after its function and comes first
+    """
+    versions = [(version or function, function) for function, (timer_part, version) in entry.versions.items()
+                if timer_part == part]
+    return dict(sorted(versions, key=lambda item: item[0] != item[1]))
+
+
+def load_registry(registry_file: Optional[str] = None) -> List[DayEntry]:
+    """
+    Returns all day files ordered by year and day. The registry is stored on disk and
+    only the day files whose modification time or size changed are parsed again
+    """
+    registry_file = registry_file or REGISTRY_FILE
+    cached = _read_registry(registry_file)
+    entries: List[DayEntry] = []
+    changed = False
+
+    for year_path in get_full_year_paths():
+        year = clean_year(year_path)
+
+        for day_file in get_full_day_paths(year_path):
+            if not day_file.endswith('.py'):
+                continue
+
+            stat = os.stat(day_file)
+            entry = cached.pop(day_file, None)
+
+            if entry is None or (entry.mtime, entry.size) != (stat.st_mtime_ns, stat.st_size):
+                entry = _scan_day_file(year, day_file, stat, entry)
+                changed = True
+
+            entries.append(entry)
+
+    # Entries that are left over belong to day files that have been removed
+    if changed or cached:
+        _write_registry(registry_file, entries)
+
+    return sorted(entries, key=lambda entry: (entry.year, entry.day))
+
+
+def _scan_day_file(year: int, day_file: str, stat: os.stat_result, previous: Optional[DayEntry]) -> DayEntry:
+    with open(day_file, 'rb') as f:
+        source = f.read()
+
+    digest = hashlib.sha256(source).hexdigest()
+
+    if previous is not None and previous.hash == digest:
+        # Only touched, the content is the same
+        previous.mtime, previous.size = stat.st_mtime_ns, stat.st_size
+        return previous
+
+    parsed = ast.parse(source, filename=day_file)
+    functions = [node for node in parsed.body if isinstance(node, ast.FunctionDef)]
+
+    return DayEntry(
+        year=year,
+        day=clean_day(day_file),
+        module=get_full_module_from_day_file(day_file),
+        path=day_file,
+        mtime=stat.st_mtime_ns,
+        size=stat.st_size,
+        hash=digest,
+        functions=[func.name for func in functions],
+        versions={func.name: version for func in functions if (version := _timer_version(func)) is not None},
+    )
+
+
+def _timer_version(func: ast.FunctionDef) -> Optional[List[Any]]:
+    """
+    Returns the [part, version] of the solution_timer decorator of the function, if it has one
+    """
+    for decorator in func.decorator_list:
+        if not isinstance(decorator, ast.Call) or getattr(decorator.func, 'id', None) != 'solution_timer':
+            continue
+
+        try:
+            args = [ast.literal_eval(arg) for arg in decorator.args]
+            keywords = {keyword.arg: ast.literal_eval(keyword.value) for keyword in decorator.keywords}
+        except ValueError:
+            return None
+
+        part = args[2] if len(args) > 2 else keywords.get('part')
+        version = args[3] if len(args) > 3 else keywords.get('version', '')
+        return [part, version]
+
+    return None
+
+
+def _read_registry(registry_file: str) -> Dict[str, DayEntry]:
+    try:
+        with open(registry_file) as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(stored, dict) or stored.get('version') != REGISTRY_VERSION:
+        return {}
+
+    try:
+        return {entry['path']: DayEntry(**entry) for entry in stored['days']}
+    except (KeyError, TypeError):  # an incompatible registry is rebuilt
+        return {}
+
+
+def _write_registry(registry_file: str, entries: List[DayEntry]) -> None:
+    temp_file = f'{registry_file}.{os.getpid()}.tmp'
+
+    try:
+        os.makedirs(os.path.dirname(registry_file), exist_ok=True)
+        with open(temp_file, 'w') as f:
+            json.dump({'version': REGISTRY_VERSION, 'days': [asdict(entry) for entry in entries]}, f)
+        os.replace(temp_file, registry_file)
+    except OSError:
+        pass  # the registry is only a cache, a read-only tree just rescans every time
@@ -0,0 +1,21 @@
+import argparse
+from typing import Set
+
+
+def parse_selection(value: str) -> Set[int]:
+    """
+    Parses a comma separated list of numbers and inclusive ranges, e.g. '1,3,5-7'
+    """
+    selection: Set[int] = set()
+
+    try:
+        for item in value.split(','):
+            start, separator, end = item.partition('-')
+            selection.update(range(int(start), int(end if separator else start) + 1))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'invalid selection: {value!r}')
+
+    if not selection:
+        raise argparse.ArgumentTypeError(f'empty selection: {value!r}')
+
+    return selection
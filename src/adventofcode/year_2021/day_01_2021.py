@@ -1,22 +1,37 @@
-from typing import List, cast
+from collections import deque
+from typing import Deque, Iterable, Iterator, Optional
 
 from adventofcode.util.exceptions import SolutionNotFoundException
 from adventofcode.util.helpers import solution_timer
-from adventofcode.util.input_helpers import get_input_for_day
+from adventofcode.util.input_helpers import iter_input_for_day
 
+STREAM_INPUT = True
 
-def sonar_sweep(values: List[int]) -> int:
+
+def sonar_sweep(values: Iterable[int]) -> int:
     increasing = 0
-    for previous, current in zip(values[:-1], values[1:]):
-        if previous < current:
+    previous: Optional[int] = None
+    for current in values:
+        if previous is not None and previous < current:
             increasing += 1
+        previous = current
     return increasing
 
 
+def sliding_windows(values: Iterable[int], size: int = 3) -> Iterator[int]:
+    """
+    Yields the sums of all windows of the given size, keeping only one window in memory
+    """
+    window: Deque[int] = deque(maxlen=size)
+    for value in values:
+        window.append(value)
+        if len(window) == size:
+            yield sum(window)
+
+
 @solution_timer(2021, 1, 1)
-def part_one(input_data: List[str]):
-    sonar_values = cast(List[int], list(map(int, input_data)))
-    answer = sonar_sweep(sonar_values)
+def part_one(input_data: Iterable[str]):
+    answer = sonar_sweep(map(int, input_data))
 
     if not answer:
         raise SolutionNotFoundException(2021, 1, 1)
@@ -25,14 +40,8 @@ def part_one(input_data: List[str]):
 
 
 @solution_timer(2021, 1, 2)
-def part_two(input_data: List[str]):
-    sonar_values = cast(List[int], list(map(int, input_data)))
-
-    windows = []
-    for window in zip(sonar_values[:-1], sonar_values[1:], sonar_values[2:]):
-        windows.append(sum(window))
-
-    answer = sonar_sweep(windows)
+def part_two(input_data: Iterable[str]):
+    answer = sonar_sweep(sliding_windows(map(int, input_data)))
 
     if not answer:
         raise SolutionNotFoundException(2021, 1, 2)
@@ -41,6 +50,5 @@ def part_two(input_data: List[str]):
 
 
 if __name__ == '__main__':
-    data = get_input_for_day(2021, 1)
-    part_one(data)
-    part_two(data)
+    part_one(iter_input_for_day(2021, 1))
+    part_two(iter_input_for_day(2021, 1))
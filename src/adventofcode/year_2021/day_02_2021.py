@@ -1,12 +1,14 @@
-from typing import List
+from typing import Iterable
 
 from adventofcode.util.exceptions import SolutionNotFoundException
 from adventofcode.util.helpers import solution_timer
-from adventofcode.util.input_helpers import get_input_for_day
+from adventofcode.util.input_helpers import iter_input_for_day
+
+STREAM_INPUT = True
 
 
 @solution_timer(2021, 2, 1)
-def part_one(input_data: List[str]):
+def part_one(input_data: Iterable[str]):
     depth = 0
     horizontal_pos = 0
     for line in input_data:
@@ -26,7 +28,7 @@ def part_one(input_data: List[str]):
 
 
 @solution_timer(2021, 2, 2)
-def part_two(input_data: List[str]):
+def part_two(input_data: Iterable[str]):
     depth = 0
     horizontal_pos = 0
     aim = 0
@@ -48,6 +50,5 @@ def part_two(input_data: List[str]):
 
 
 if __name__ == '__main__':
-    data = get_input_for_day(2021, 2)
-    part_one(data)
-    part_two(data)
+    part_one(iter_input_for_day(2021, 2))
+    part_two(iter_input_for_day(2021, 2))
@@ -1,8 +1,7 @@
-from decimal import ROUND_HALF_UP, Decimal
 from typing import List
 
 from adventofcode.util.exceptions import SolutionNotFoundException
-from adventofcode.util.helpers import solution_timer
+from adventofcode.util.helpers import memoize, solution_timer
 from adventofcode.util.input_helpers import get_input_for_day
 
 
@@ -23,20 +22,21 @@ def simulate(swarm: List[int], days=80):
     return swarm
 
 
-def simulate_single(fish: int, days=80, is_child=False):
-
-    if days < fish:
-        return 0  # even tough we dont reproduce we are still a fish!
-
-    my_children = Decimal((days - fish) / 6).to_integral_value(rounding=ROUND_HALF_UP)
-    result = my_children  # 1 for the initial fish
-    for i in range(int(my_children)):
-        result += simulate_single(8, days-(fish+i*6), is_child=True)
+@memoize
+def simulate_single(fish: int, days: int = 80) -> int:
+    """
+    Returns the amount of fish that descend from a fish with the given timer within days
+    """
+    result = 0
+    # The fish gives birth on day fish + 1 and every 7 days after that
+    for birth in range(fish + 1, days + 1, 7):
+        result += 1 + simulate_single(8, days - birth)
 
     return result
 
 
 def fast_simulation(fish: List[int], days=80):
+    simulate_single.cache_clear()  # type: ignore  # every run starts without results of previous runs
     result = len(fish)
     for f in fish:
         result += simulate_single(f, days)
@@ -55,6 +55,17 @@ def part_one(input_data: List[str]):
     return answer
 
 
+@solution_timer(2021, 6, 1, 'recursive')
+def part_one_recursive(input_data: List[str]):
+    fish = parse_inputs(input_data)
+
+    answer = fast_simulation(fish)
+    if not answer:
+        raise SolutionNotFoundException(2021, 6, 1)
+
+    return answer
+
+
 @solution_timer(2021, 6, 2)
 def part_two(input_data: List[str]):
     fish = parse_inputs(input_data)
@@ -1,8 +1,6 @@
 import math
 from typing import List, Tuple
 
-import numpy as np
-
 from adventofcode.util.exceptions import SolutionNotFoundException
 from adventofcode.util.helpers import solution_timer
 from adventofcode.util.input_helpers import get_input_for_day
@@ -6,8 +6,9 @@ from pprint import pprint
 from typing import List, Tuple, TypeVar, Iterator, Set, Dict
 
 from adventofcode.util.exceptions import SolutionNotFoundException
-from adventofcode.util.helpers import solution_timer
+from adventofcode.util.helpers import solution_timer, parse_timer
 from adventofcode.util.input_helpers import get_input_for_day
+from adventofcode.util.parse_cache import cached_parse
 
 
 T = TypeVar("T")
@@ -105,10 +106,14 @@ def find_basins(heightmap: List[List[Point]]):
     return basins
 
 
+@parse_timer(2021, 9)
+@cached_parse()
+def parse(input_data: List[str]) -> List[List[Point]]:
+    return create_heightmap(parse_input(input_data))
+
+
 @solution_timer(2021, 9, 1)
-def part_one(input_data: List[str]):
-    values = parse_input(input_data)
-    heightmap = create_heightmap(values)
+def part_one(heightmap: List[List[Point]]):
     minima = find_minima(heightmap)
     risk_levels = [m.value + 1 for m in minima]
     answer = sum(risk_levels)
@@ -120,9 +125,7 @@ def part_one(input_data: List[str]):
 
 
 @solution_timer(2021, 9, 2)
-def part_two(input_data: List[str]):
-    values = parse_input(input_data)
-    heightmap = create_heightmap(values)
+def part_two(heightmap: List[List[Point]]):
     basins = find_basins(heightmap)
     sizes = sorted((len(basin) for basin in basins.values()), reverse=True)
     # Multiply the number of items of the three largest basins
@@ -136,6 +139,6 @@ def part_two(input_data: List[str]):
 
 
 if __name__ == '__main__':
-    data = get_input_for_day(2021, 9)
+    data = parse(get_input_for_day(2021, 9))
     part_one(data)
     part_two(data)
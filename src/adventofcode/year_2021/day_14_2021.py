@@ -84,8 +84,6 @@ def calculate_answer(polymerization: str):
 @solution_timer(2021, 14, 1)
 def part_one(input_data: List[str]):
     template, rules = parse_instructions(input_data)
-    # result = polymerize(template, rules, steps=10)
-
     answer = polymerize_fast(template, rules, steps=10)
     if not answer:
         raise SolutionNotFoundException(2021, 14, 1)
@@ -93,6 +91,16 @@ def part_one(input_data: List[str]):
     return answer
 
 
+@solution_timer(2021, 14, 1, 'deque')
+def part_one_deque(input_data: List[str]):
+    template, rules = parse_instructions(input_data)
+    answer = calculate_answer(polymerize(template, rules, steps=10))
+    if not answer:
+        raise SolutionNotFoundException(2021, 14, 1)
+
+    return answer
+
+
 @solution_timer(2021, 14, 2)
 def part_two(input_data: List[str]):
     template, rules = parse_instructions(input_data)
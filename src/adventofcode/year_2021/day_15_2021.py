@@ -1,16 +1,16 @@
 import heapq
 from collections import namedtuple
-from typing import List, Tuple
-import numpy as np
+from typing import List, Tuple, Sequence, Union
 
 from adventofcode.util.exceptions import SolutionNotFoundException
-from adventofcode.util.helpers import solution_timer
+from adventofcode.util.helpers import solution_timer, parse_timer
 from adventofcode.util.input_helpers import get_input_for_day
+from adventofcode.util.parse_cache import cached_parse
 
 Node = namedtuple('Node', ['x', 'y', 'risk'])
 
 
-def parse_map(input_data: List[str]) -> List[List[Node]]:
+def parse_map(input_data: Sequence[Sequence[Union[str, int]]]) -> List[List[Node]]:
     graph = []
     for y, line in enumerate(input_data):
         row = []
@@ -21,6 +21,8 @@ def parse_map(input_data: List[str]) -> List[List[Node]]:
 
 
 def enlarge(graph: List[List[Node]]) -> List[List[Node]]:
+    # Only part two enlarges the map, importing numpy takes longer than parsing the map
+    import numpy as np
 
     risks = np.array([[x.risk for x in row] for row in graph])
     # Create just one column then we will repeat this later
@@ -70,9 +72,14 @@ def find_path(graph: List[List[Node]]):
     return visited_nodes[last] - start.risk
 
 
+@parse_timer(2021, 15)
+@cached_parse()
+def parse(input_data: List[str]) -> List[List[Node]]:
+    return parse_map(input_data)
+
+
 @solution_timer(2021, 15, 1)
-def part_one(input_data: List[str]):
-    graph = parse_map(input_data)
+def part_one(graph: List[List[Node]]):
     answer = find_path(graph)
 
     if not answer:
@@ -82,8 +89,7 @@ def part_one(input_data: List[str]):
 
 
 @solution_timer(2021, 15, 2)
-def part_two(input_data: List[str]):
-    graph = parse_map(input_data)
+def part_two(graph: List[List[Node]]):
     graph = enlarge(graph)
     answer = find_path(graph)
 
@@ -94,6 +100,6 @@ def part_two(input_data: List[str]):
 
 
 if __name__ == '__main__':
-    data = get_input_for_day(2021, 15)
+    data = parse(get_input_for_day(2021, 15))
     part_one(data)
     part_two(data)
@@ -1,30 +1,29 @@
-import math
-from typing import List
+import heapq
+from typing import Iterable, Iterator
 
 from adventofcode.util.exceptions import SolutionNotFoundException
 from adventofcode.util.helpers import solution_timer
-from adventofcode.util.input_helpers import get_input_for_day
+from adventofcode.util.input_helpers import iter_input_for_day
 
+STREAM_INPUT = True
 
-def total_per_elf(input_data) -> List[int]:
-    totals = []
+
+def total_per_elf(input_data: Iterable[str]) -> Iterator[int]:
     total = 0
     for line in input_data:
         if line == "":
-            totals.append(total)
+            yield total
             total = 0
         else:
             assert line.isdigit()
             total += int(line)
 
     # File does not end with an empty line
-    totals.append(total)
-
-    return totals
+    yield total
 
 
 @solution_timer(2022, 1, 1)
-def part_one(input_data: List[str]):
+def part_one(input_data: Iterable[str]):
     answer = max(total_per_elf(input_data))
     if not answer:
         raise SolutionNotFoundException(2022, 1, 1)
@@ -33,9 +32,8 @@ def part_one(input_data: List[str]):
 
 
 @solution_timer(2022, 1, 2)
-def part_two(input_data: List[str]):
-    calories = sorted(total_per_elf(input_data), reverse=True)
-    answer = sum(calories[:3])
+def part_two(input_data: Iterable[str]):
+    answer = sum(heapq.nlargest(3, total_per_elf(input_data)))
 
     if not answer:
         raise SolutionNotFoundException(2022, 1, 2)
@@ -44,6 +42,5 @@ def part_two(input_data: List[str]):
 
 
 if __name__ == '__main__':
-    data = get_input_for_day(2022, 1)
-    part_one(data)
-    part_two(data)
+    part_one(iter_input_for_day(2022, 1))
+    part_two(iter_input_for_day(2022, 1))
@@ -1,9 +1,11 @@
 import enum
-from typing import List
+from typing import Iterable
 
 from adventofcode.util.exceptions import SolutionNotFoundException
 from adventofcode.util.helpers import solution_timer
-from adventofcode.util.input_helpers import get_input_for_day
+from adventofcode.util.input_helpers import iter_input_for_day
+
+STREAM_INPUT = True
 
 
 class Result(enum.IntEnum):
@@ -79,7 +81,7 @@ def to_result(symbol: str) -> Result:
 
 
 @solution_timer(2022, 2, 1)
-def part_one(input_data: List[str]):
+def part_one(input_data: Iterable[str]):
     answer = 0
 
     for line in input_data:
@@ -96,7 +98,7 @@ def part_one(input_data: List[str]):
 
 
 @solution_timer(2022, 2, 2)
-def part_two(input_data: List[str]):
+def part_two(input_data: Iterable[str]):
     answer = 0
 
     for line in input_data:
@@ -113,6 +115,5 @@ def part_two(input_data: List[str]):
 
 
 if __name__ == '__main__':
-    data = get_input_for_day(2022, 2)
-    part_one(data)
-    part_two(data)
+    part_one(iter_input_for_day(2022, 2))
+    part_two(iter_input_for_day(2022, 2))
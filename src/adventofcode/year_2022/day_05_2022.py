@@ -12,7 +12,8 @@ STACK_PATTERN = re.compile(r"(\w)")
 COMMAND_PATTERN = re.compile(r"(\d+)")
 
 
-def parse(input_data: List[str]):
+# Not a parse hook: the input loader strips the leading whitespace that positions the crates
+def parse_crates(input_data: List[str]):
 
     stacks: List[deque] = []
     moves: List[Tuple[int, int, int]] = []
@@ -67,7 +68,7 @@ def simulate_9001(stacks: List[deque], moves: List[Tuple[int, int, int]]):
 @solution_timer(2022, 5, 1)
 def part_one(input_data: List[str]):
     answer = ""
-    stacks, moves = parse(input_data)
+    stacks, moves = parse_crates(input_data)
     simulate_single(stacks, moves)
     for stack in stacks:
         answer += stack[-1]
@@ -81,7 +82,7 @@ def part_one(input_data: List[str]):
 @solution_timer(2022, 5, 2)
 def part_two(input_data: List[str]):
     answer = ""
-    stacks, moves = parse(input_data)
+    stacks, moves = parse_crates(input_data)
     simulate_9001(stacks, moves)
     for stack in stacks:
         answer += stack[-1]
@@ -2,8 +2,9 @@ import math
 from typing import List, Optional, Union, Set, Tuple, Callable, Dict, Generator
 
 from adventofcode.util.exceptions import SolutionNotFoundException
-from adventofcode.util.helpers import solution_timer
+from adventofcode.util.helpers import solution_timer, parse_timer
 from adventofcode.util.input_helpers import get_input_for_day
+from adventofcode.util.parse_cache import cached_parse
 
 
 class File:
@@ -118,7 +119,7 @@ def read_output(lines: List[str], stop: Callable[[str], bool]) -> Tuple[int, Lis
     return i, results
 
 
-def build_fs(results: List[str]):
+def build_fs(results: List[str]) -> FileSystem:
 
     fs = FileSystem()
     assert results[0] == "$ cd /"
@@ -175,6 +176,14 @@ def find_smallest_dir_with_enough_space(fs: FileSystem, space_needed: int):
     return smallest
 
 
+@parse_timer(2022, 7)
+@cached_parse()
+def parse(input_data: List[str]) -> FileSystem:
+    fs = build_fs(input_data)
+    fs.change_dir("/")
+    return fs
+
+
 @solution_timer(2022, 7, 1)
 def part_one(fs: FileSystem):
     answer = find_free_space(fs, 100000)
@@ -196,7 +205,6 @@ def part_two(fs: FileSystem):
 
 
 if __name__ == '__main__':
-    data = get_input_for_day(2022, 7)
-    file_system = build_fs(data)
+    file_system = parse(get_input_for_day(2022, 7))
     part_one(file_system)
     part_two(file_system)
@@ -4,7 +4,7 @@ from itertools import accumulate
 from typing import List
 
 from adventofcode.util.exceptions import SolutionNotFoundException
-from adventofcode.util.helpers import solution_timer
+from adventofcode.util.helpers import solution_timer, parse_timer
 from adventofcode.util.input_helpers import get_input_for_day
 
 
@@ -75,6 +75,11 @@ def scenic_score(row, col, trees):
     return score
 
 
+@parse_timer(2022, 8)
+def parse(input_data: List[str]) -> List[List[int]]:
+    return [[int(t) for t in line] for line in input_data]
+
+
 @solution_timer(2022, 8, 1)
 def part_one(input_data: List[List[int]]):
     answer = visible_trees(input_data)
@@ -99,7 +104,6 @@ def part_two(input_data: List[List[int]]):
 
 
 if __name__ == '__main__':
-    data = get_input_for_day(2022, 8)
-    data = [[int(t) for t in line] for line in data]
+    data = parse(get_input_for_day(2022, 8))
     part_one(data)
     part_two(data)
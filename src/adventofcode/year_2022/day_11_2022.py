@@ -1,14 +1,16 @@
 import functools
 import operator
 import re
+from copy import deepcopy
 from typing import List
 
 from adventofcode.util.exceptions import SolutionNotFoundException
-from adventofcode.util.helpers import solution_timer
+from adventofcode.util.helpers import solution_timer, parse_timer
 from adventofcode.util.input_helpers import get_input_for_day
 
 
 INT_PATTERN = re.compile(r"\d+")
+COPY_PARSED_INPUT = True  # The monkeys are modified while playing
 
 
 class Monkey:
@@ -68,6 +70,11 @@ def parse_monkeys(input_data: List[List[str]]) -> List[Monkey]:
     return monkeys
 
 
+@parse_timer(2022, 11)
+def parse(input_data: List[str]) -> List[Monkey]:
+    return parse_monkeys([input_data[i:i+6] for i in range(0, len(input_data), 7)])
+
+
 def play(monkeys: List[Monkey], rounds=1, gets_bored=True):
 
     lcm = functools.reduce(operator.mul, [m.div_by for m in monkeys])
@@ -113,7 +120,6 @@ def part_two(monkeys: List[Monkey]):
 
 
 if __name__ == '__main__':
-    data = get_input_for_day(2022, 11)
-    data = [data[i:i+6] for i in range(0, len(data), 7)]
-    part_one(parse_monkeys(data))
-    part_two(parse_monkeys(data))
+    data = parse(get_input_for_day(2022, 11))
+    part_one(deepcopy(data))
+    part_two(data)
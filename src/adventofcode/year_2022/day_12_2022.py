@@ -1,13 +1,17 @@
 import math
 import string
 from collections import defaultdict
-from typing import List
+from typing import List, Tuple, Dict, Set
 
 from adventofcode.util.exceptions import SolutionNotFoundException
-from adventofcode.util.helpers import solution_timer
+from adventofcode.util.helpers import solution_timer, parse_timer
 from adventofcode.util.input_helpers import get_input_for_day
+from adventofcode.util.parse_cache import cached_parse
 
 
+Position = Tuple[int, int]
+HeightMap = Tuple[Position, Position, Dict[Position, Set[Position]], List[Position]]
+
 HEIGHT = {char: i for i, char in enumerate(string.ascii_lowercase)}
 HEIGHT.update({"S": HEIGHT['a'], 'E': HEIGHT['z']})
 
@@ -64,9 +68,17 @@ def shortest_path(start, end, graph, weight=1):
     return math.inf  # No path found
 
 
-@solution_timer(2022, 12, 1)
-def part_one(input_data: List[str]):
+@parse_timer(2022, 12)
+@cached_parse()
+def parse(input_data: List[str]) -> HeightMap:
     start, end, graph = make_map(input_data)
+    lowest = [(i, j) for i, j in graph if input_data[i][j] == 'a']
+    return start, end, graph, lowest
+
+
+@solution_timer(2022, 12, 1)
+def part_one(height_map: HeightMap):
+    start, end, graph, _ = height_map
     answer = shortest_path(start, end, graph)
 
     if not answer:
@@ -76,12 +88,11 @@ def part_one(input_data: List[str]):
 
 
 @solution_timer(2022, 12, 2)
-def part_two(input_data: List[str]):
-    start, end, graph = make_map(input_data)
+def part_two(height_map: HeightMap):
+    start, end, graph, lowest = height_map
     answer = shortest_path(start, end, graph)
-    for i, j in graph:
-        if input_data[i][j] == 'a':
-            answer = min(answer, shortest_path((i, j), end, graph))
+    for position in lowest:
+        answer = min(answer, shortest_path(position, end, graph))
 
     if not answer:
         raise SolutionNotFoundException(2022, 12, 2)
@@ -90,6 +101,6 @@ def part_two(input_data: List[str]):
 
 
 if __name__ == '__main__':
-    data = get_input_for_day(2022, 12)
+    data = parse(get_input_for_day(2022, 12))
     part_one(data)
     part_two(data)
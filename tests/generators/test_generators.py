@@ -0,0 +1,58 @@
+import importlib
+from copy import deepcopy
+
+import pytest
+
+from adventofcode.generators import generate_input, available_generators
+from adventofcode.util.registry import load_registry
+
+GENERATORS = available_generators()
+
+
+def _solve_part_one(year: int, day: int, data: str):
+    module = importlib.import_module(f'adventofcode.year_{year}.day_{day:02}_{year}')
+    # Stripped like get_input_for_day does, except the crate drawing of 2022 day 5, which depends on the whitespace
+    lines = data.splitlines(True) if (year, day) == (2022, 5) else [line.strip() for line in data.splitlines()]
+
+    if getattr(module, 'STREAM_INPUT', False):
+        lines = iter(lines)
+    elif getattr(module, 'parse', None) is not None:
+        lines = module.parse(lines)
+
+    part_one = getattr(module, 'part_one', None) or getattr(module, 'part_one_and_two')
+    return part_one(deepcopy(lines))
+
+
+def test_available_generators(tmp_path):
+    solved = {(entry.year, entry.day) for entry in load_registry(str(tmp_path / 'registry.json'))}
+    assert set(GENERATORS) == solved
+
+
+def test_generate_input_missing_generator():
+    with pytest.raises(ValueError, match='no input generator for 2015 day 01'):
+        generate_input(2015, 1)
+
+
+def test_generate_input_invalid_scale():
+    with pytest.raises(ValueError, match='scale'):
+        generate_input(2021, 1, scale=0)
+
+
+@pytest.mark.parametrize('year, day', GENERATORS)
+def test_generate_input_seed(year, day):
+    data = generate_input(year, day, seed=1)
+
+    assert data == generate_input(year, day, seed=1)
+    assert data != generate_input(year, day, seed=2)
+    assert data.endswith('\n') and not data.endswith('\n\n')
+
+
+@pytest.mark.parametrize('year, day', [(2021, 1), (2021, 9), (2021, 16), (2022, 3), (2022, 7), (2022, 13)])
+def test_generate_input_scale(year, day):
+    assert len(generate_input(year, day, scale=4, seed=1)) > 3 * len(generate_input(year, day, scale=1, seed=1))
+
+
+@pytest.mark.parametrize('year, day', GENERATORS)
+def test_generated_input_is_solvable(year, day, monkeypatch, capsys):
+    monkeypatch.setenv('AOC_PARSE_CACHE', '0')
+    assert _solve_part_one(year, day, generate_input(year, day, seed=1))
@@ -0,0 +1,89 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from adventofcode.scripts import compare as compare_script
+from adventofcode.scripts.compare import compare, run_versions, _parse_args
+from adventofcode.util.helpers import solution_timer
+
+
+def test_parse_args():
+    args = _parse_args(['2021', '14', '1', '--versions', 'part_one,deque', '--baseline', 'deque'])
+    assert (args.year, args.day, args.part, args.versions, args.baseline) == (2021, 14, 1, ['part_one', 'deque'], 'deque')
+
+    with pytest.raises(SystemExit):
+        _parse_args(['2021', '14', '1', '--confidence', '1'])
+
+
+def test_run_versions():
+    calls = []
+
+    @solution_timer(2020, 1, 1)
+    def part_one(input_data):
+        calls.append('a')
+        return len(input_data)
+
+    @solution_timer(2020, 1, 1, 'b')
+    def part_one_b(input_data):
+        calls.append('b')
+        return len(input_data)
+
+    results = run_versions(SimpleNamespace(), {'a': part_one, 'b': part_one_b}, ['1', '2'], warmup=1, repeat=2)
+
+    # The order of the versions rotates every round
+    assert calls == ['a', 'b', 'b', 'a', 'a', 'b']
+    assert [len(runs) for runs in results.values()] == [2, 2]
+    assert {result.answer for runs in results.values() for result in runs} == {2}
+    assert results['b'][0].version == 'b'
+
+
+def test_compare_json(mocker, capsys):
+    mocker.patch.object(compare_script.sys, 'argv', ['compare', '2021', '14', '1', '--warmup', '0', '--repeat', '3', '--json'])
+
+    compare()
+    report = json.loads(capsys.readouterr().out)
+
+    assert report['agree']
+    assert report['baseline'] == 'part_one'
+    assert [version['version'] for version in report['versions']] == ['part_one', 'deque']
+    assert [version['function'] for version in report['versions']] == ['part_one', 'part_one_deque']
+    assert report['versions'][0]['speedup'] == 1.0 and report['versions'][0]['speedup_interval'] is None
+
+    low, high = report['versions'][1]['speedup_interval']
+    assert low <= report['versions'][1]['speedup'] <= high
+
+
+def test_compare_recursive_version(mocker, capsys):
+    mocker.patch.object(compare_script.sys, 'argv', ['compare', '2021', '6', '1', '--warmup', '0', '--repeat', '1', '--json'])
+
+    compare()
+    report = json.loads(capsys.readouterr().out)
+
+    assert report['agree']
+    assert [version['version'] for version in report['versions']] == ['part_one', 'recursive']
+
+
+def test_compare_disagreement(mocker, capsys):
+    mocker.patch.object(compare_script.sys, 'argv', ['compare', '2021', '6', '1', '--warmup', '0', '--repeat', '1', '--json'])
+    mocker.patch('adventofcode.year_2021.day_06_2021.fast_simulation', return_value=1)
+
+    with pytest.raises(SystemExit) as e:
+        compare()
+
+    assert e.value.code == 1
+    report = json.loads(capsys.readouterr().out)
+    assert not report['agree']
+    assert len({version['answer'] for version in report['versions']}) == 2
+
+
+@pytest.mark.parametrize('argv', [
+    ['2021', '1', '1'],
+    ['2021', '14', '1', '--versions', 'missing'],
+    ['2021', '14', '1', '--baseline', 'missing'],
+])
+def test_compare_invalid_selection(mocker, argv):
+    mocker.patch.object(compare_script.sys, 'argv', ['compare', *argv])
+
+    with pytest.raises(SystemExit):
+        compare()
@@ -0,0 +1,134 @@
+import io
+import json
+import subprocess
+import sys
+import threading
+from multiprocessing.pool import ThreadPool
+
+import pytest
+
+from adventofcode.scripts import aoc_run as aoc_run_script
+from adventofcode.scripts import daemon
+from adventofcode.scripts.aoc_run import aoc_run
+from adventofcode.scripts.daemon import DaemonServer, _load_input, _load_module, _run_request
+from adventofcode.util import helpers, parse_cache, registry
+from adventofcode.util.daemon import DaemonNotRunning, read_message, send_request, write_message
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    # The daemon runs real solutions, their caches should not end up in the .aoc_cache of the repo
+    path = tmp_path / 'cache'
+    monkeypatch.setattr(parse_cache, 'PARSE_CACHE_DIR', str(path / 'parsed'))
+    monkeypatch.setattr(registry, 'REGISTRY_FILE', str(path / 'registry.json'))
+    monkeypatch.setattr(helpers, 'MEMOIZE_DB', str(path / 'memoize.db'))
+    return path
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setenv('AOC_PARSE_CACHE', '0')
+    path = str(tmp_path / 'daemon.sock')
+
+    # The requests run on threads instead of warm worker processes
+    with ThreadPool(1) as pool, DaemonServer(path, pool, 1) as server:
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        yield path
+        server.shutdown()
+        thread.join()
+
+
+def test_messages():
+    file = io.BytesIO()
+    write_message(file, {'op': 'run', 'parts': [1, 2]})
+    write_message(file, {'op': 'stop'})
+    file.seek(0)
+
+    assert {'op': 'run', 'parts': [1, 2]} == read_message(file)
+    assert {'op': 'stop'} == read_message(file)
+    assert read_message(file) is None
+
+
+def test_client_imports():
+    code = 'import sys, adventofcode.scripts.aoc_run; print(sorted(name for name in sys.modules if name.startswith("adventofcode")))'
+    modules = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout.strip()
+
+    assert "'adventofcode.util.daemon'" in modules
+    assert 'parse_cache' not in modules and 'helpers' not in modules
+
+
+def test_send_request_without_daemon(tmp_path):
+    with pytest.raises(DaemonNotRunning):
+        send_request({'op': 'status'}, str(tmp_path / 'daemon.sock'))
+
+
+def test_load_module_reloads_changed_module(mocker, monkeypatch):
+    monkeypatch.setattr(daemon, '_modules', {})
+    module = _load_module(2021, 1)
+    reload = mocker.spy(daemon.importlib, 'reload')
+
+    assert module is _load_module(2021, 1)
+    assert not reload.called
+
+    # The file looks changed when its modification time differs from the one at the import
+    daemon._modules[(2021, 1)] = module, 0
+    assert module is _load_module(2021, 1)
+    assert reload.called
+    assert daemon._modules[(2021, 1)][1] != 0
+
+
+def test_load_input_reads_changed_input(mocker, monkeypatch):
+    monkeypatch.setattr(daemon, '_inputs', {})
+    version = mocker.patch.object(daemon, '_input_version', return_value=1)
+    read = mocker.patch.object(daemon, 'get_input_for_day', side_effect=[['1'], ['2']])
+
+    assert ['1'] == _load_input(2020, 1)
+    assert ['1'] == _load_input(2020, 1)
+    version.return_value = 2
+    assert ['2'] == _load_input(2020, 1)
+    assert 2 == read.call_count
+
+
+def test_run_request(monkeypatch):
+    monkeypatch.setenv('AOC_PARSE_CACHE', '0')
+    results = _run_request(2021, 1, [2])
+
+    assert [(result['part'], result['status']) for result in results] == [(2, 'ok')]
+
+    with pytest.raises(LookupError, match='no solution for 2015 day 01'):
+        _run_request(2015, 1, [1])
+
+
+def test_server(server):
+    response = send_request({'op': 'run', 'year': 2021, 'day': 1, 'parts': [1, 2]}, server)
+    assert 'ok' == response['status']
+    assert [result['part'] for result in response['results']] == [1, 2]
+
+    assert 'error' == send_request({'op': 'run', 'year': 2015, 'day': 1}, server)['status']
+    assert 'error' == send_request({'op': 'unknown'}, server)['status']
+
+    status = send_request({'op': 'status'}, server)
+    assert (2, 1) == (status['requests'], status['workers'])
+
+
+def test_aoc_run(server, mocker, capsys):
+    mocker.patch.object(aoc_run_script.sys, 'argv', ['aoc-run', '2021', '1', '2', '--json', '--socket', server])
+
+    aoc_run()
+    results = json.loads(capsys.readouterr().out)
+    assert [(result['year'], result['day'], result['part']) for result in results] == [(2021, 1, 2)]
+
+
+def test_aoc_run_prints_results(server, mocker, suppress_console):
+    mocker.patch.object(aoc_run_script.sys, 'argv', ['aoc-run', '2021', '1', '--socket', server])
+
+    aoc_run()
+    assert 2 == suppress_console.print.call_count
+
+
+def test_aoc_run_errors(server, mocker):
+    mocker.patch.object(aoc_run_script.sys, 'argv', ['aoc-run', '2015', '1', '--socket', server])
+
+    with pytest.raises(SystemExit):
+        aoc_run()
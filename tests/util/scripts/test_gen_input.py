@@ -0,0 +1,35 @@
+import pytest
+
+from adventofcode.generators import generate_input
+from adventofcode.scripts import gen_input as gen_input_script
+from adventofcode.scripts.gen_input import gen_input, _parse_args
+
+
+def test_parse_args():
+    args = _parse_args(['2022', '8', '--scale', '16', '--seed', '3'])
+    assert (args.year, args.day, args.scale, args.seed, args.output) == (2022, 8, 16, 3, None)
+
+    with pytest.raises(SystemExit):
+        _parse_args(['2022', '8', '--scale', '0'])
+
+
+def test_gen_input_output(tmp_path, mocker):
+    output = tmp_path / 'inputs' / 'day_08.txt'
+    mocker.patch.object(gen_input_script.sys, 'argv', ['gen-input', '2022', '8', '--seed', '3', '--output', str(output)])
+
+    gen_input()
+    assert output.read_text() == generate_input(2022, 8, seed=3)
+
+
+def test_gen_input_stdout(mocker, capsys):
+    mocker.patch.object(gen_input_script.sys, 'argv', ['gen-input', '2021', '17', '--seed', '3'])
+
+    gen_input()
+    assert capsys.readouterr().out == generate_input(2021, 17, seed=3)
+
+
+def test_gen_input_missing_generator(mocker):
+    mocker.patch.object(gen_input_script.sys, 'argv', ['gen-input', '2015', '1'])
+
+    with pytest.raises(SystemExit):
+        gen_input()
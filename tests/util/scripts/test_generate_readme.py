@@ -0,0 +1,40 @@
+import os
+
+import pytest
+import pytest_mock
+
+from adventofcode.scripts.generate_readme import generate_readme
+
+README = """# Advent of Code
+![](https://img.shields.io/badge/stars%20⭐-0-yellow&message=0)
+<!-- start completed section -->
+<!-- end completed section -->
+"""
+
+
+@pytest.fixture
+def readme_file(tmp_path, mocker: pytest_mock.MockerFixture):
+    readme_file = tmp_path / 'README.md'
+    readme_file.write_text(README)
+    mocker.patch('adventofcode.scripts.generate_readme.ROOT_DIR', str(tmp_path / 'src' / 'adventofcode'))
+    mocker.patch('adventofcode.scripts.generate_readme._find_completed_days',
+                 return_value={2021: {1: {'part_one': True, 'part_two': True}, 2: {'part_one': True, 'part_two': False}}})
+    return readme_file
+
+
+def test_generate_readme(readme_file):
+    generate_readme()
+
+    readme = readme_file.read_text()
+    assert '&message=3' in readme
+    assert '- day 01: part one ⭐️, part two ⭐️' in readme
+    assert '- day 02: part one ⭐️, part two –' in readme
+
+
+def test_generate_readme_unchanged(readme_file):
+    generate_readme()
+    os.utime(readme_file, ns=(1, 1))
+
+    # Nothing changed, so the README is not written again
+    generate_readme()
+    assert os.stat(readme_file).st_mtime_ns == 1
@@ -0,0 +1,120 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import pytest_mock
+
+from adventofcode.scripts import get_inputs
+from adventofcode.scripts.get_inputs import fetch_all, RateLimiter
+
+
+class InputHandler(BaseHTTPRequestHandler):
+    """
+    Stands in for the advent of code site. Day 3 fails once with a 503, day 4 does not exist
+    """
+    requests = []  # type: ignore
+    failed = set()  # type: ignore
+
+    def do_GET(self):
+        InputHandler.requests.append((self.path, self.headers.get('Cookie'), self.client_address[1]))
+        year, _, day, _ = self.path.strip('/').split('/')
+
+        if self.headers.get('Cookie') != 'session=c0ffee':
+            self.send_response(400)
+        elif day == '3' and day not in InputHandler.failed:
+            InputHandler.failed.add(day)
+            self.send_response(503)
+        elif day == '4':
+            self.send_response(404)
+        else:
+            body = f'input {year} {day}\n'.encode()
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def server():
+    InputHandler.requests = []
+    InputHandler.failed = set()
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), InputHandler)
+    InputHandler.protocol_version = 'HTTP/1.1'  # keep-alive, so connections can be reused
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_address[1]}'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_fetch_all(server, tmp_path):
+    (tmp_path / '2021').mkdir()
+    (tmp_path / '2021' / 'day_05.txt').write_text('existing')
+
+    statuses = fetch_all(2021, [1, 2, 3, 4, 5], 'c0ffee', concurrency=2, interval=0, backoff=0.01,
+                         base_url=server, inputs_dir=str(tmp_path))
+
+    assert ['downloaded', 'downloaded', 'downloaded'] == [statuses[day] for day in (1, 2, 3)]
+    assert statuses[4].startswith('failed: 404')
+    assert 'skipped' == statuses[5]
+
+    assert 'input 2021 1\n' == (tmp_path / '2021' / 'day_01.txt').read_text()
+    assert 'existing' == (tmp_path / '2021' / 'day_05.txt').read_text()
+    assert not (tmp_path / '2021' / 'day_04.txt').exists()
+    assert [] == list((tmp_path / '2021').glob('*.tmp'))
+
+    # day 3 is retried, existing inputs are not requested
+    paths = [path for path, _, _ in InputHandler.requests]
+    assert 2 == paths.count('/2021/day/3/input')
+    assert '/2021/day/5/input' not in paths
+    assert {'session=c0ffee'} == {cookie for _, cookie, _ in InputHandler.requests}
+
+    # the pooled connections are reused, so there are fewer connections than requests
+    assert len({port for _, _, port in InputHandler.requests}) < len(InputHandler.requests)
+
+
+def test_fetch_all_force(server, tmp_path):
+    (tmp_path / '2021').mkdir()
+    (tmp_path / '2021' / 'day_01.txt').write_text('existing')
+
+    statuses = fetch_all(2021, [1], 'c0ffee', interval=0, force=True, base_url=server, inputs_dir=str(tmp_path))
+    assert {1: 'downloaded'} == statuses
+    assert 'input 2021 1\n' == (tmp_path / '2021' / 'day_01.txt').read_text()
+
+
+def test_fetch_all_reports_failures_per_day(server, tmp_path, mocker: pytest_mock.MockerFixture):
+    save_input = get_inputs._save_input
+
+    def disk_full(data, year, day, inputs_dir):
+        if day == 2:
+            raise OSError(28, 'No space left on device')
+        save_input(data, year, day, inputs_dir)
+
+    mocker.patch('adventofcode.scripts.get_inputs._save_input', side_effect=disk_full)
+
+    # Without retries the 503 of day 3 is raised by the first attempt
+    statuses = fetch_all(2021, [1, 2, 3], 'c0ffee', interval=0, retries=0, base_url=server, inputs_dir=str(tmp_path))
+    assert 'downloaded' == statuses[1]
+    assert 'failed: [Errno 28] No space left on device' == statuses[2]
+    assert statuses[3].startswith('failed: 503')
+
+
+def test_rate_limiter():
+    limiter = RateLimiter(0.05)
+    start = time.monotonic()
+
+    threads = [threading.Thread(target=limiter.wait) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert time.monotonic() - start >= 0.15
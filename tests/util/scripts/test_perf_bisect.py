@@ -0,0 +1,124 @@
+import os
+import subprocess
+
+import pytest
+
+from adventofcode.scripts import perf_bisect
+from adventofcode.scripts.perf_bisect import _measure_revision, bisect_revisions
+
+PACKAGE_FILES = {
+    'src/adventofcode/__init__.py': '',
+    'src/adventofcode/util/__init__.py': '',
+    'src/adventofcode/util/input_helpers.py': 'def _get_input(path):\n    return open(path).read().splitlines()\n',
+    'src/adventofcode/year_2020/__init__.py': '',
+}
+
+
+@pytest.mark.parametrize('first_bad', range(8))
+def test_bisect_revisions(first_bad):
+    revisions = [str(i) for i in range(8)]
+    probed = []
+
+    def is_bad(revision):
+        probed.append(revision)
+        return int(revision) >= first_bad
+
+    assert first_bad == bisect_revisions(revisions, is_bad)
+    assert len(probed) <= 3
+
+
+def test_bisect_revisions_skips_unmeasurable():
+    revisions = [str(i) for i in range(8)]
+
+    def is_bad(revision):
+        if revision == '5':
+            return None
+        return int(revision) >= 4
+
+    assert 4 == bisect_revisions(revisions, is_bad)
+
+
+def test_bisect_revisions_ambiguous():
+    revisions = [str(i) for i in range(8)]
+
+    def is_bad(revision):
+        if revision in ('3', '4'):
+            return None
+        return int(revision) >= 4
+
+    assert bisect_revisions(revisions, is_bad) is None
+
+
+def test_bisect_revisions_all_skipped():
+    assert bisect_revisions(['0', '1', '2'], lambda revision: None) is None
+
+
+def _commit(repo, day_source):
+    for name, content in {**PACKAGE_FILES, 'src/adventofcode/year_2020/day_01_2020.py': day_source}.items():
+        os.makedirs(os.path.dirname(os.path.join(repo, name)), exist_ok=True)
+        with open(os.path.join(repo, name), 'w') as f:
+            f.write(content)
+
+    subprocess.run(['git', 'add', '.'], cwd=repo, check=True)
+    subprocess.run(['git', '-c', 'user.name=test', '-c', 'user.email=test@example.com', 'commit', '-q', '-m', 'day 1'],
+                   cwd=repo, check=True)
+    return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=repo, capture_output=True, text=True).stdout.strip()
+
+
+def _make_dir(directory, prefix):
+    path = directory / f'{prefix}{len(os.listdir(directory))}'
+    path.mkdir()
+    return str(path)
+
+
+@pytest.fixture
+def repo(tmp_path, mocker):
+    path = str(tmp_path / 'repo')
+    os.makedirs(path)
+    subprocess.run(['git', 'init', '-q'], cwd=path, check=True)
+
+    # Keep the worktrees in tmp_path, so the test can check that they are removed
+    worktrees = tmp_path / 'worktrees'
+    worktrees.mkdir()
+    mocker.patch.object(perf_bisect.tempfile, 'mkdtemp', side_effect=lambda prefix: _make_dir(worktrees, prefix))
+
+    with open(tmp_path / 'input.txt', 'w') as f:
+        f.write('1\n2\n')
+
+    return path
+
+
+def _measure(repo, revision):
+    input_file = os.path.join(os.path.dirname(repo), 'input.txt')
+    return _measure_revision(repo, revision, 2020, 1, 1, input_file, 2)
+
+
+def test_measure_revision(repo):
+    revision = _commit(repo, 'def part_one(input_data):\n    return len(input_data)\n')
+
+    measurement = _measure(repo, revision)
+
+    assert measurement.error is None
+    assert measurement.median is not None
+    assert measurement.subject == 'day 1'
+    assert [] == os.listdir(os.path.join(os.path.dirname(repo), 'worktrees'))
+
+
+def test_measure_revision_unknown_revision(repo):
+    _commit(repo, 'def part_one(input_data):\n    return len(input_data)\n')
+
+    measurement = _measure(repo, 'does-not-exist')
+
+    assert measurement.median is None
+    assert measurement.error
+    assert [] == os.listdir(os.path.join(os.path.dirname(repo), 'worktrees'))
+
+
+def test_measure_revision_without_answer(repo):
+    # solution_timer returns None when the solution raises
+    revision = _commit(repo, 'def part_one(input_data):\n    return None\n')
+
+    measurement = _measure(repo, revision)
+
+    assert measurement.median is None
+    assert 'no answer' in measurement.error
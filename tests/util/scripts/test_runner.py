@@ -0,0 +1,189 @@
+import json
+import multiprocessing
+import signal
+import time
+from concurrent.futures import Future
+from types import SimpleNamespace
+
+import pytest
+import pytest_mock
+
+from adventofcode.scripts import runner
+from adventofcode.scripts.runner import PARTS, parse_input, _find_days, _run_day, _run_limited, \
+    _parse_args, _report_missing_input, _run_sequential, _collect_results
+from adventofcode.util import output
+from adventofcode.util.helpers import SolutionResult
+
+
+def test_parse_input_without_hook():
+    module = SimpleNamespace()
+    assert ['c0ffee'] == parse_input(module, ['c0ffee'])
+
+
+def test_parse_input_with_hook():
+    module = SimpleNamespace(parse=lambda data: [len(line) for line in data])
+    assert [6, 4] == parse_input(module, ['c0ffee', 'cafe'])
+
+
+def test__run_day_shares_parsed_input(mocker: pytest_mock.MockerFixture):
+    mocker.patch('adventofcode.scripts.runner.get_input_for_day', return_value=['1', '2'])
+    received = []
+    module = SimpleNamespace(
+        parse=lambda data: [int(line) for line in data],
+        part_one=received.append,
+        part_two=received.append,
+    )
+
+    _run_day(module, 2020, 1)
+    assert [[1, 2], [1, 2]] == received
+    assert received[0] is received[1]
+
+
+def test__run_day_copies_parsed_input(mocker: pytest_mock.MockerFixture):
+    mocker.patch('adventofcode.scripts.runner.get_input_for_day', return_value=['1', '2'])
+    received = []
+    module = SimpleNamespace(
+        COPY_PARSED_INPUT=True,
+        parse=lambda data: [int(line) for line in data],
+        part_one=lambda data: received.append(data.pop()),
+        part_two=lambda data: received.append(data.pop()),
+    )
+
+    _run_day(module, 2020, 1)
+    assert [2, 2] == received
+
+
+def test__run_day_streams_input(mocker: pytest_mock.MockerFixture):
+    mock_get_input = mocker.patch('adventofcode.scripts.runner.get_input_for_day')
+    mocker.patch('adventofcode.scripts.runner.iter_input_for_day', side_effect=lambda year, day: iter(['1', '2']))
+    received = []
+    module = SimpleNamespace(
+        STREAM_INPUT=True,
+        part_one=lambda data: received.append(sum(map(int, data))),
+        part_two=lambda data: received.append(sum(map(int, data))),
+    )
+
+    _run_day(module, 2020, 1)
+    assert [3, 3] == received
+    mock_get_input.assert_not_called()
+
+
+def test__find_days(mocker: pytest_mock.MockerFixture):
+    entries = [SimpleNamespace(year=year, day=day, module=f'year_{year}.day_{day:02}')
+               for year in (2021, 2022) for day in (1, 2, 3)]
+    mocker.patch('adventofcode.scripts.runner.load_registry', return_value=entries)
+
+    assert 6 == len(_find_days())
+    assert [(2022, 2, 'year_2022.day_02'), (2022, 3, 'year_2022.day_03')] == _find_days({2022}, {2, 3})
+
+
+def test__run_day_selected_parts(mocker: pytest_mock.MockerFixture):
+    mocker.patch('adventofcode.scripts.runner.get_input_for_day', return_value=['1', '2'])
+    received = []
+    module = SimpleNamespace(
+        COPY_PARSED_INPUT=True,
+        parse=lambda data: [int(line) for line in data],
+        part_one=lambda data: received.append(('one', data.pop())),
+        part_two=lambda data: received.append(('two', data.pop())),
+    )
+
+    _run_day(module, 2020, 1, ('part_two',))
+    assert [('two', 2)] == received
+
+
+def test__run_sequential_continues_after_failure(mocker: pytest_mock.MockerFixture):
+    mocker.patch('adventofcode.scripts.runner.get_input_for_day', return_value=['1', '2'])
+    broken = SimpleNamespace(part_one=lambda data: [].pop())
+    working = SimpleNamespace(part_one=lambda data: data)
+    run = mocker.patch('adventofcode.scripts.runner._run_day', wraps=_run_day)
+    mocker.patch('adventofcode.scripts.runner._import_day', side_effect=[(broken, 0.0), (working, 0.0)])
+
+    results, _ = _run_sequential([(2020, 1, 'day_01'), (2020, 2, 'day_02')], silent=True)
+    assert [(1, 1, 'error'), (1, 2, 'error')] == [(result.day, result.part, result.status) for result in results]
+    assert 2 == run.call_count
+
+
+def test__collect_results_continues_after_failure():
+    failed: Future = Future()
+    failed.set_exception(IndexError('pop from an empty deque'))
+    finished: Future = Future()
+    finished.set_result(([SolutionResult(2020, 2, 1, answer=3)], 1.0))
+    tasks = [(2020, 1, 'day_01', 'part_one', True), (2020, 2, 'day_02', 'part_one', True)]
+
+    results, duration = _collect_results(tasks, [failed, finished], ('part_one',), silent=True)
+    assert [(1, 'error'), (2, 'ok')] == [(result.day, result.status) for result in results]
+    assert "IndexError('pop from an empty deque')" == results[0].answer
+    assert 1.0 == duration
+
+
+@pytest.fixture
+def fork_context(monkeypatch):
+    # The parts are patched in this process, so the limited runs should fork to see the patches
+    monkeypatch.setattr(runner, '_LIMITED_CONTEXT', multiprocessing.get_context('fork'))
+
+
+def test__run_limited_does_not_fork():
+    assert runner._LIMITED_CONTEXT.get_start_method() in ('forkserver', 'spawn')
+
+    results, _ = _run_limited(2021, 1, 'adventofcode.year_2021.day_01_2021', 'part_one', timeout=30)
+    assert ['ok'] == [result.status for result in results if result.part == 1]
+
+
+def test__run_limited(monkeypatch, fork_context):
+    monkeypatch.setattr(runner, '_run_part', lambda *args: ([SolutionResult(2020, 1, 1, answer=42)], 1.0))
+
+    results, import_duration = _run_limited(2020, 1, 'day_01', 'part_one', timeout=5)
+    assert [SolutionResult(2020, 1, 1, answer=42)] == results
+    assert 1.0 == import_duration
+
+
+def test__run_limited_timeout(monkeypatch, fork_context):
+    monkeypatch.setattr(runner, '_run_part', lambda *args: time.sleep(10))
+
+    start = time.perf_counter()
+    results, _ = _run_limited(2020, 1, 'day_01', 'part_two', timeout=0.2)
+    assert time.perf_counter() - start < 5
+    assert 'timeout' == results[0].status
+    assert 2 == results[0].part
+
+
+@pytest.mark.skipif(not hasattr(signal, 'SIGXCPU'), reason='requires setrlimit')
+def test__run_limited_cpu_limit(monkeypatch, fork_context):
+    def spin(*args):
+        while True:
+            pass
+
+    monkeypatch.setattr(runner, '_run_part', spin)
+
+    results, _ = _run_limited(2020, 1, 'day_01', 'part_one', timeout=10, cpu_limit=1)
+    assert 'cpu limit' == results[0].status
+
+
+def test__run_limited_raises_errors(monkeypatch, fork_context):
+    def missing_input(*args):
+        raise FileNotFoundError('day_01.txt')
+
+    monkeypatch.setattr(runner, '_run_part', missing_input)
+
+    with pytest.raises(FileNotFoundError):
+        _run_limited(2020, 1, 'day_01', 'part_one', timeout=5)
+
+
+def test__parse_args_jsonl():
+    assert '-' == _parse_args(['--jsonl']).jsonl
+    assert 'results.jsonl' == _parse_args(['--jsonl', 'results.jsonl']).jsonl
+
+    with pytest.raises(SystemExit):
+        _parse_args(['--json', '--jsonl'])
+
+
+def test__report_missing_input_jsonl(monkeypatch, capsys):
+    monkeypatch.setenv('AOC_OUTPUT', 'jsonl')
+    monkeypatch.delenv('AOC_OUTPUT_FILE', raising=False)
+    monkeypatch.setattr(output, '_writer', None)
+
+    _report_missing_input(2022, 3, PARTS)
+    output.flush_results()
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(record['part'], record['status']) for record in records] == [(1, 'missing input'), (2, 'missing input')]
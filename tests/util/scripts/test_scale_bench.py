@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from adventofcode.scripts import scale_bench as scale_bench_script
+from adventofcode.scripts.scale_bench import scale_bench, scaled_inputs, input_sizes, loglog_chart, _parse_args
+from adventofcode.util.benchmark import PowerLawFit
+
+
+@pytest.fixture(autouse=True)
+def environment(monkeypatch):
+    # scale_bench sets both variables, they are restored after every test
+    monkeypatch.setenv('AOC_PARSE_CACHE', '0')
+    monkeypatch.setenv('AOC_TRACK_MEMORY', '0')
+
+
+def test_parse_args():
+    args = _parse_args(['2022', '8', '2', '--scales', '4,1,2', '--source', 'tile', '--no-memory'])
+    assert (args.year, args.day, args.part, args.scales, args.source) == (2022, 8, 2, [1, 2, 4], 'tile')
+    assert not args.track_memory
+
+    with pytest.raises(SystemExit):
+        _parse_args(['2022', '8', '2', '--scales', '0,1'])
+    with pytest.raises(SystemExit):
+        _parse_args(['2022', '8', '2', '--scales', 'a'])
+
+
+def test_scaled_inputs_real_input(mocker):
+    mocker.patch.object(scale_bench_script, 'get_input_for_day', return_value=['1', '2', '3', '4', '5', '6', '7'])
+
+    assert [len(lines) for lines in scaled_inputs(2021, 1, [1, 2, 4], 'truncate')] == [2, 4, 7]
+    assert [len(lines) for lines in scaled_inputs(2021, 1, [1, 3], 'tile')] == [7, 21]
+
+    with pytest.raises(ValueError, match='too short'):
+        scaled_inputs(2021, 1, [1, 8], 'truncate')
+
+
+def test_scaled_inputs_generate():
+    inputs = scaled_inputs(2021, 1, [1, 2], 'generate', seed=3)
+    assert len(inputs[0]) < len(inputs[1])
+    assert inputs == scaled_inputs(2021, 1, [1, 2], 'generate', seed=3)
+
+
+def test_input_sizes():
+    assert input_sizes([['ab'], ['ab', 'cd']]) == [2, 4]
+    assert input_sizes([['ab'], ['abcd']]) == [2, 4]
+    # A grid with twice the side has four times the cells
+    assert input_sizes([['ab', 'cd'], ['abcd'] * 4]) == [4, 16]
+
+
+def test_loglog_chart():
+    chart = loglog_chart([(10, 1.0), (100, 100.0)], PowerLawFit(2, 0.01, 1.0), width=20, height=5).splitlines()
+
+    assert len(chart) == 7
+    assert chart[0].startswith('100 ms') and chart[0].endswith('●')
+    assert chart[4].startswith('  1 ms') and '●' in chart[4] and chart[4].index('●') == chart[0].index('●') - 19
+    assert '·' in chart[2]
+    assert chart[6].strip() == 'n=10' + ' ' * 11 + 'n=100'
+
+
+def test_scale_bench_json(mocker, capsys):
+    mocker.patch.object(scale_bench_script.sys, 'argv',
+                        ['scale-bench', '2021', '1', '1', '--scales', '1,2,4', '--repeat', '1', '--json'])
+
+    scale_bench()
+    report = json.loads(capsys.readouterr().out)
+
+    assert [measurement['scale'] for measurement in report['measurements']] == [1, 2, 4]
+    assert all(measurement['status'] == 'ok' for measurement in report['measurements'])
+    assert all(measurement['peak'] > 0 for measurement in report['measurements'])
+    assert all(measurement['n'] == measurement['chars'] for measurement in report['measurements'])
+    assert report['time']['complexity'] and report['memory']['complexity']
+
+
+def test_scale_bench_missing_part(mocker):
+    mocker.patch.object(scale_bench_script.sys, 'argv', ['scale-bench', '2022', '10', '2'])
+
+    with pytest.raises(SystemExit):
+        scale_bench()
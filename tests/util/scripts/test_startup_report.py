@@ -0,0 +1,87 @@
+import json
+
+import pytest
+
+from adventofcode.scripts import startup_report as startup_report_script
+from adventofcode.scripts.startup_report import startup_report, parse_importtime, find_import, external_imports, \
+    rank_offenders, find_targets, measure_import
+
+IMPORTTIME = '''import time: self [us] | cumulative | imported package
+import time:       100 |        100 | site
+import time:        50 |         50 |     re
+import time:       300 |        350 |   rich.table
+import time:        20 |         20 |     json
+import time:        80 |        100 |   adventofcode.util.output
+import time:        10 |         10 |   adventofcode.config
+import time:       200 |        660 | adventofcode.scripts.bench
+'''
+
+
+def test_parse_importtime():
+    roots = parse_importtime(IMPORTTIME)
+
+    assert ['site', 'adventofcode.scripts.bench'] == [root.name for root in roots]
+    bench = roots[1]
+    assert (200, 660) == (bench.self_us, bench.cumulative_us)
+    assert ['rich.table', 'adventofcode.util.output', 'adventofcode.config'] == [child.name for child in bench.children]
+    assert ['re'] == [child.name for child in bench.children[0].children]
+
+
+def test_find_import():
+    roots = parse_importtime(IMPORTTIME)
+
+    assert 'json' == find_import(roots, 'json').name
+    assert find_import(roots, 'numpy') is None
+
+
+def test_external_imports():
+    bench = find_import(parse_importtime(IMPORTTIME), 'adventofcode.scripts.bench')
+
+    assert [('adventofcode.scripts.bench', 'rich.table'), ('adventofcode.util.output', 'json')] == \
+        [(importer, node.name) for importer, node in external_imports(bench)]
+
+
+def test_rank_offenders():
+    reports = [
+        {'imports': [{'name': 'rich.table', 'imported_by': 'a', 'ms': 20.0}, {'name': 'json', 'imported_by': 'a', 'ms': 1.0}]},
+        {'imports': [{'name': 'rich.table', 'imported_by': 'b', 'ms': 30.0}]},
+    ]
+
+    offenders = rank_offenders(reports)
+    assert ['rich.table', 'json'] == [offender['name'] for offender in offenders]
+    assert (30.0, ['a', 'b'], 2) == (offenders[0]['ms'], offenders[0]['imported_by'], offenders[0]['targets'])
+
+
+def test_find_targets():
+    targets = dict(find_targets())
+
+    assert 'adventofcode.scripts.runner' == targets['run-all']
+    assert 'adventofcode.year_2021.day_01_2021' == targets['2021 day 01']
+    assert '2021 day 01' not in dict(find_targets(scripts_only=True))
+
+
+def test_measure_import():
+    assert find_import(parse_importtime(measure_import('adventofcode.config')), 'adventofcode.config') is not None
+
+    with pytest.raises(ImportError, match='cannot be imported'):
+        measure_import('adventofcode.missing')
+
+
+@pytest.mark.parametrize(['budget', 'exits'], [
+    ('1000', False),
+    ('0', True),
+])
+def test_startup_report(mocker, capsys, budget, exits):
+    mocker.patch.object(startup_report_script, 'find_targets', return_value=[('pack-inputs', 'adventofcode.scripts.pack_inputs')])
+    mocker.patch.object(startup_report_script.sys, 'argv', ['startup-report', '--repeat', '1', '--json', '--budget', budget])
+
+    if exits:
+        with pytest.raises(SystemExit):
+            startup_report()
+    else:
+        startup_report()
+
+    report = json.loads(capsys.readouterr().out)
+    assert ['pack-inputs'] == [target['name'] for target in report['targets']]
+    assert report['targets'][0]['ms'] > 0
+    assert all(not offender['name'].startswith('adventofcode') for offender in report['offenders'])
@@ -0,0 +1,104 @@
+import statistics
+from types import SimpleNamespace
+
+import pytest
+
+from adventofcode.util.benchmark import percentile, calculate_stats, fresh_input, benchmark_part, fit_power_law, complexity_label, \
+    bootstrap_interval
+from adventofcode.util.helpers import solution_timer
+
+
+@pytest.mark.parametrize(['pct', 'expected'], [
+    (0, 1.0),
+    (50, 2.5),
+    (95, 3.85),
+    (100, 4.0),
+])
+def test_percentile(pct, expected):
+    assert expected == pytest.approx(percentile([4.0, 1.0, 3.0, 2.0], pct))
+
+
+def test_percentile_empty():
+    with pytest.raises(ValueError):
+        percentile([], 50)
+
+
+def test_calculate_stats():
+    stats = calculate_stats([2.0, 1.0, 3.0])
+    assert 3 == stats.runs
+    assert 1.0 == stats.min
+    assert 3.0 == stats.max
+    assert 2.0 == stats.median
+    assert 1.0 == stats.stdev
+    assert 500 == stats.ops_per_sec
+
+
+def test_calculate_stats_single_timing():
+    assert 0.0 == calculate_stats([2.0]).stdev
+
+
+def test_fresh_input():
+    data = [[1, 2]]
+    assert data is not fresh_input(SimpleNamespace(), data)
+    assert data is fresh_input(SimpleNamespace(parse=list), data)
+
+    copied = fresh_input(SimpleNamespace(parse=list, COPY_PARSED_INPUT=True), data)
+    assert data == copied
+    assert data[0] is not copied[0]
+
+
+def test_benchmark_part():
+    @solution_timer(2020, 1, 1)
+    def part_one(input_data):
+        input_data.append('mutated')
+        return len(input_data)
+
+    results = benchmark_part(SimpleNamespace(), part_one, ['c0ffee'], warmup=2, repeat=3)
+    assert 3 == len(results)
+    assert all(2 == result.answer for result in results)
+
+
+@pytest.mark.parametrize(['exponent', 'coefficient'], [
+    (1, 2.0),
+    (2, 0.5),
+    (3, 1e-4),
+])
+def test_fit_power_law(exponent, coefficient):
+    sizes = [10, 20, 40, 80]
+    fit = fit_power_law(sizes, [coefficient * size ** exponent for size in sizes])
+
+    assert exponent == pytest.approx(fit.exponent)
+    assert coefficient == pytest.approx(fit.coefficient)
+    assert 1.0 == pytest.approx(fit.r_squared)
+    assert coefficient * 160 ** exponent == pytest.approx(fit(160))
+
+
+def test_fit_power_law_single_size():
+    with pytest.raises(ValueError):
+        fit_power_law([10, 10], [1.0, 2.0])
+
+
+@pytest.mark.parametrize(['exponent', 'expected'], [
+    (0.1, 'O(1)'),
+    (0.9, 'O(n)'),
+    (1.4, 'O(n^1.5)'),
+    (2.1, 'O(n²)'),
+    (2.95, 'O(n³)'),
+    (11, 'O(n^11)'),
+])
+def test_complexity_label(exponent, expected):
+    assert expected == complexity_label(exponent)
+
+
+def test_bootstrap_interval():
+    timings = [1.0, 1.1, 0.9, 1.0, 1.2, 0.8, 1.0]
+    low, high = bootstrap_interval(statistics.median, timings)
+    assert low <= 1.0 <= high
+    assert (low, high) == bootstrap_interval(statistics.median, timings)
+
+    low, high = bootstrap_interval(lambda a, b: statistics.median(a) / statistics.median(b), timings,
+                                   [timing * 2 for timing in timings])
+    assert low <= 0.5 <= high
+
+    with pytest.raises(ValueError):
+        bootstrap_interval(statistics.median, [])
@@ -0,0 +1,236 @@
+import pstats
+import sqlite3
+import subprocess
+import sys
+import time
+
+import pytest
+import pytest_mock
+
+from adventofcode.util.helpers import solution_timer, collect_results, SolutionResult, memoize, CacheInfo, \
+    persistent_memoize, solution_profiler, solution_line_profiler
+
+
+def test_solution_timer_collect_results():
+    @solution_timer(2020, 1, 1)
+    def part_one():
+        return 42
+
+    @solution_timer(2020, 1, 2, 'fast')
+    def part_two():
+        return None
+
+    with collect_results(silent=True) as results:
+        assert 42 == part_one()
+        assert part_two() is None
+
+    assert 2 == len(results)
+    assert SolutionResult(2020, 1, 1, '', 42, results[0].duration) == results[0]
+    assert SolutionResult(2020, 1, 2, 'fast', status='not found') == results[1]
+
+
+def test_solution_timer_collect_results_error():
+    @solution_timer(2020, 1, 1)
+    def part_one():
+        raise ValueError('invalid input')
+
+    with collect_results(silent=True) as results:
+        part_one()
+
+    assert 'error' == results[0].status
+    assert "ValueError('invalid input')" == results[0].answer
+
+
+def test_collect_results_restores_previous(suppress_console):
+    @solution_timer(2020, 1, 1)
+    def part_one():
+        return 1
+
+    with collect_results(silent=True) as outer:
+        with collect_results() as inner:
+            part_one()
+
+        part_one()
+
+    assert 1 == len(inner)
+    assert 1 == len(outer)
+    assert 1 == suppress_console.print.call_count
+
+
+def test_memoize():
+    calls = []
+
+    @memoize
+    def total(values, scale=1):
+        calls.append(values)
+        return sum(values) * scale
+
+    assert 6 == total([1, 2, 3])
+    assert 6 == total([1, 2, 3])
+    assert 12 == total([1, 2, 3], scale=2)
+    assert 6 == total((1, 2, 3))
+    assert 2 == total([2])
+
+    assert 4 == len(calls)
+    assert CacheInfo(hits=1, misses=4, evictions=0, maxsize=100_000, currsize=4) == total.cache_info()
+
+    total.cache_clear()
+    assert CacheInfo(0, 0, 0, 100_000, 0) == total.cache_info()
+
+
+def test_memoize_unhashable_containers():
+    @memoize
+    def count(data):
+        return len(data)
+
+    assert 2 == count({'a': [1, 2], 'b': {3}})
+    assert 2 == count({'b': {3}, 'a': [1, 2]})
+    assert 1 == count.cache_info().hits
+
+
+def test_memoize_evicts_least_recently_used():
+    calls = []
+
+    @memoize(maxsize=2)
+    def square(value):
+        calls.append(value)
+        return value * value
+
+    square(1)
+    square(2)
+    square(1)  # 2 is now the least recently used
+    square(3)
+    square(1)
+    square(2)
+
+    assert [1, 2, 3, 2] == calls
+    assert 2 == square.cache_info().evictions
+    assert 2 == square.cache_info().currsize
+
+
+def test_solution_timer_prints_cache_usage(suppress_console):
+    @memoize
+    def fibonacci(n):
+        return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+    @solution_timer(2020, 1, 1)
+    def part_one():
+        return fibonacci(10)
+
+    part_one()
+
+    printed = suppress_console.print.call_args_list[-1].args[0]
+    assert 'memoize test_solution_timer_prints_cache_usage.<locals>.fibonacci: 8 hits, 11 misses' in printed
+
+
+@pytest.fixture()
+def memoize_db(tmp_path, mocker: pytest_mock.MockerFixture):
+    path = str(tmp_path / 'memoize.db')
+    mocker.patch('adventofcode.util.helpers.MEMOIZE_DB', path)
+    return path
+
+
+def test_persistent_memoize(memoize_db):
+    calls = []
+
+    def square(value, offset=0):
+        calls.append(value)
+        return value * value + offset
+
+    first = persistent_memoize('test')(square)
+    assert 4 == first(2)
+    assert 5 == first(2, offset=1)
+    assert 4 == first(2)
+
+    # A new process starts with an empty in-memory cache
+    second = persistent_memoize('test')(square)
+    assert 4 == second(2)
+    assert 5 == second(2, offset=1)
+    assert [2, 2] == calls
+
+
+def test_persistent_memoize_stable_keys(memoize_db):
+    calls = []
+
+    def count(data):
+        calls.append(data)
+        return len(data)
+
+    persistent_memoize('test')(count)({'a', 'b', 'c'})
+    persistent_memoize('test')(count)({'c', 'b', 'a'})
+    assert 1 == len(calls)
+
+
+def test_persistent_memoize_evicts_least_recently_used(memoize_db):
+    memoized = persistent_memoize('test', max_entries=2)(lambda value: value)
+
+    for value in range(5):
+        memoized(value)
+
+    with sqlite3.connect(memoize_db) as db:
+        assert 2 == db.execute('SELECT COUNT(*) FROM memoized').fetchone()[0]
+
+
+@pytest.mark.parametrize('mode', ['deterministic', 'sampling'])
+def test_solution_profiler(tmp_path, mocker: pytest_mock.MockerFixture, mode):
+    mocker.patch('adventofcode.util.profiling.PROFILE_DIR', str(tmp_path))
+
+    @solution_profiler(2020, 1, 1, mode=mode, flamegraph=True)
+    def part_one(value):
+        time.sleep(0.01)
+        return value
+
+    assert 42 == part_one(42)
+    assert (tmp_path / '2020_day_01_part_01.folded').exists()
+    assert (tmp_path / '2020_day_01_part_01.svg').read_text().startswith('<svg')
+
+
+def test_solution_profiler_sort(mocker: pytest_mock.MockerFixture):
+    sort_stats = mocker.patch('pstats.Stats.sort_stats')
+
+    solution_profiler(2020, 1, 1, sort='cumulative')(lambda: 1)()
+    sort_stats.assert_called_once_with(pstats.SortKey.CUMULATIVE)
+
+    with pytest.raises(ValueError):
+        solution_profiler(2020, 1, 1, sort='calls')  # type: ignore
+
+
+def test_solution_line_profiler(suppress_console):
+    @solution_line_profiler(2020, 1, 1)
+    def part_one(values):
+        total = 0
+        for value in values:
+            total += value
+        return total
+
+    assert 6 == part_one([1, 2, 3])
+    table = suppress_console.print.call_args_list[-1].args[0]
+    assert 'part_one' in table.title
+    assert ['1', '4', '3', '1'] == [hits for hits in table.columns[1].cells if hits]
+
+
+def test_solution_timer_track_memory(monkeypatch):
+    @solution_timer(2020, 1, 1, track_memory=True)
+    def part_one():
+        return len([bytearray(1000) for _ in range(100)])
+
+    @solution_timer(2020, 1, 2)
+    def part_two():
+        return 1
+
+    with collect_results(silent=True) as results:
+        part_one()
+        part_two()
+        monkeypatch.setenv('AOC_TRACK_MEMORY', '1')
+        part_two()
+
+    assert results[0].memory.peak >= 100_000
+    assert results[0].memory.top[0][0].startswith('util/test_helpers.py:')
+    assert results[1].memory is None
+    assert results[2].memory is not None
+
+
+def test_importing_day_skips_heavy_imports():
+    code = ('import sys, adventofcode.year_2021.day_15_2021; '
+            'print(sorted({"numpy", "pstats", "cProfile", "rich.table", "sqlite3", "adventofcode.util.profiling"} & set(sys.modules)))')
+    assert '[]' == subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout.strip()
@@ -0,0 +1,57 @@
+import pytest
+import pytest_mock
+
+from adventofcode.util.helpers import SolutionResult
+from adventofcode.util.history import record_results, load_trends, connect
+from adventofcode.util.profiling import MemoryStats
+
+
+@pytest.fixture
+def db(tmp_path, mocker: pytest_mock.MockerFixture):
+    mocker.patch('adventofcode.util.history.get_git_commit', return_value='c0ffee')
+    mocker.patch('adventofcode.util.history.get_input_hash', return_value='cafe')
+    return str(tmp_path / 'history.db')
+
+
+def test_record_results(db):
+    results = [
+        SolutionResult(2020, 1, 1, '', 42, 1.5),
+        SolutionResult(2020, 1, 2, status='not found'),
+    ]
+    assert 1 == record_results(results, db)
+
+    rows = connect(db).execute('SELECT year, day, part, git_commit, input_hash, duration FROM timings').fetchall()
+    assert [(2020, 1, 1, 'c0ffee', 'cafe', 1.5)] == rows
+
+
+def test_record_results_peak_memory(db):
+    results = [
+        SolutionResult(2020, 1, 1, '', 42, 1.5, memory=MemoryStats(peak=2048, blocks=3)),
+        SolutionResult(2020, 1, 2, '', 42, 1.5),
+    ]
+    record_results(results, db)
+
+    rows = connect(db).execute('SELECT part, peak_memory FROM timings ORDER BY part').fetchall()
+    assert [(1, 2048), (2, None)] == rows
+
+
+def test_load_trends(db):
+    for durations in ([1.0, 3.0], [2.0], [2.0], [2.5]):
+        record_results([SolutionResult(2020, 1, 1, '', 42, duration) for duration in durations], db)
+
+    trend, = load_trends(db, window=2, threshold=0.1)
+    assert (2020, 1, 1, '') == trend.solution
+    assert [2.0, 2.0, 2.0, 2.5] == trend.points
+    assert 2.0 == trend.baseline
+    assert 0.25 == trend.change
+    assert trend.is_regression
+
+
+def test_load_trends_single_run(db):
+    record_results([SolutionResult(2020, 1, 1, '', 42, 1.0)], db)
+    record_results([SolutionResult(2020, 2, 1, '', 42, 1.0)], db)
+
+    trend, = load_trends(db, day=1)
+    assert trend.baseline is None
+    assert trend.change is None
+    assert not trend.is_regression
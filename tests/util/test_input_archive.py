@@ -0,0 +1,162 @@
+import os
+
+import pytest
+import pytest_mock
+
+from adventofcode.util import input_archive, input_helpers
+from adventofcode.util.input_archive import InputArchive, build_archive, close_archive, find_stale_entries, read_archived_input, \
+    HEADER, ENTRY
+from adventofcode.util.input_helpers import get_input_for_day, get_input_for_day_as_str, iter_input_for_day
+
+
+@pytest.fixture
+def inputs_dir(tmp_path):
+    inputs = tmp_path / 'inputs'
+    (inputs / '2021').mkdir(parents=True)
+    (inputs / '2022').mkdir()
+    (inputs / '2021' / 'day_01.txt').write_bytes(b'199\r\n200\r\n208\n')
+    (inputs / '2021' / 'day_02.txt').write_bytes(b'forward 5\ndown 5\n' * 100)
+    (inputs / '2022' / 'day_01.txt').write_bytes(b'')
+    (inputs / '2022' / 'notes.md').write_bytes(b'not an input')
+    return inputs
+
+
+@pytest.fixture
+def archive_path(tmp_path, inputs_dir, mocker: pytest_mock.MockerFixture):
+    path = str(tmp_path / 'inputs.pack')
+    build_archive(path, str(inputs_dir))
+    mocker.patch('adventofcode.util.input_archive.INPUTS_ARCHIVE', path)
+    mocker.patch('adventofcode.util.input_archive._archive', None)
+    return path
+
+
+def test_build_archive(tmp_path, inputs_dir):
+    path = str(tmp_path / 'inputs.pack')
+    entries = build_archive(path, str(inputs_dir))
+
+    assert [(entry.year, entry.day) for entry in entries] == [(2021, 1), (2021, 2), (2022, 1)]
+    assert entries[0].offset == HEADER.size + 3 * ENTRY.size
+    assert entries[1].compressed_size < entries[1].size
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+    archive = InputArchive(path)
+    assert list(archive) == [(2021, 1), (2021, 2), (2022, 1)]
+    assert archive.read(2021, 1) == b'199\r\n200\r\n208\n'
+    assert archive.read(2021, 2) == b'forward 5\ndown 5\n' * 100
+    assert archive.read(2022, 1) == b''
+    assert (2022, 2) not in archive
+    archive.close()
+
+
+def test_archive_checksum(tmp_path, inputs_dir):
+    path = tmp_path / 'inputs.pack'
+    entries = build_archive(str(path), str(inputs_dir))
+
+    data = bytearray(path.read_bytes())
+    # Corrupt the block of 2021 day 1 and the checksum of 2021 day 2
+    data[entries[0].offset + entries[0].compressed_size // 2] ^= 0xff
+    data[HEADER.size + 2 * ENTRY.size - 1] ^= 0xff
+    path.write_bytes(bytes(data))
+
+    archive = InputArchive(str(path))
+    with pytest.raises(ValueError, match='2021 day 01'):
+        archive.read(2021, 1)
+    with pytest.raises(ValueError, match='2021 day 02'):
+        archive.read(2021, 2)
+    assert archive.read(2022, 1) == b''
+    archive.close()
+
+
+def test_archive_invalid_file(tmp_path):
+    path = tmp_path / 'inputs.pack'
+    path.write_bytes(b'')
+
+    with pytest.raises(ValueError, match='not an input archive'):
+        InputArchive(str(path))
+
+
+def test_read_archived_input(archive_path, inputs_dir, mocker: pytest_mock.MockerFixture):
+    assert read_archived_input(2021, 1) == b'199\r\n200\r\n208\n'
+    assert read_archived_input(2021, 3) is None
+
+    # The archive is opened and checked once, later reads do not touch the file system
+    archive = input_archive._archive[1]
+    stat = mocker.spy(input_archive.os, 'stat')
+    assert read_archived_input(2021, 2) is not None
+    assert input_archive._archive[1] is archive
+    stat.assert_not_called()
+
+    (inputs_dir / '2021' / 'day_03.txt').write_bytes(b'00100\n')
+    build_archive(archive_path, str(inputs_dir))
+    assert read_archived_input(2021, 3) is None
+    close_archive()
+    assert read_archived_input(2021, 3) == b'00100\n'
+    assert input_archive._archive[1] is not archive
+
+
+def test_read_archived_input_without_archive(tmp_path, mocker: pytest_mock.MockerFixture):
+    mocker.patch('adventofcode.util.input_archive.INPUTS_ARCHIVE', str(tmp_path / 'missing.pack'))
+    assert read_archived_input(2021, 1) is None
+
+
+def test_input_helpers_read_archive(archive_path, mocker: pytest_mock.MockerFixture):
+    mocker.patch('adventofcode.util.input_helpers.ROOT_DIR', 'missing')
+
+    assert get_input_for_day(2021, 1) == ['199', '200', '208']
+    assert get_input_for_day_as_str(2021, 1) == '199\n200\n208'
+    assert list(iter_input_for_day(2021, 1)) == ['199', '200', '208']
+    assert get_input_for_day(2022, 1) == []
+
+    with pytest.raises(FileNotFoundError):
+        get_input_for_day(2021, 3)
+
+
+def _replace_input(path, content, mtime, archive_mtime):
+    # Like fetch-inputs, which renames a new file over the input, that updates the year directory
+    temp = path.with_suffix('.tmp')
+    temp.write_bytes(content)
+    os.utime(temp, ns=(mtime, mtime))
+    os.replace(temp, path)
+    os.utime(path.parent, ns=(archive_mtime + 1, archive_mtime + 1))
+
+
+def test_input_helpers_skip_stale_archive(archive_path, inputs_dir, mocker: pytest_mock.MockerFixture):
+    mocker.patch('adventofcode.util.input_helpers.ROOT_DIR', str(inputs_dir.parent))
+    mocker.patch('adventofcode.util.input_archive.INPUTS_DIR', str(inputs_dir))
+    read_file = mocker.spy(input_helpers, '_get_input')
+    archive_mtime = os.stat(archive_path).st_mtime_ns
+    os.utime(inputs_dir / '2021', ns=(archive_mtime - 1, archive_mtime - 1))
+
+    # Unchanged input files are read from the archive
+    assert get_input_for_day(2021, 1) == ['199', '200', '208']
+    read_file.assert_not_called()
+
+    # Refreshed after the archive was built, e.g. by fetch-inputs --force
+    _replace_input(inputs_dir / '2021' / 'day_01.txt', b'1\n2\n', archive_mtime + 1, archive_mtime)
+    close_archive()
+    assert get_input_for_day(2021, 1) == ['1', '2']
+    assert get_input_for_day_as_str(2021, 1) == '1\n2'
+    assert list(iter_input_for_day(2021, 1)) == ['1', '2']
+    assert get_input_for_day(2021, 2)[0] == 'forward 5'
+    read_file.assert_called_once()
+
+    # A different size is stale even when the modification time is not newer
+    _replace_input(inputs_dir / '2021' / 'day_01.txt', b'3\n', archive_mtime - 1, archive_mtime)
+    close_archive()
+    assert get_input_for_day(2021, 1) == ['3']
+
+
+def test_find_stale_entries_skips_unchanged_years(archive_path, inputs_dir, mocker: pytest_mock.MockerFixture):
+    archive_mtime = os.stat(archive_path).st_mtime_ns
+    for year in ('2021', '2022'):
+        os.utime(inputs_dir / year, ns=(archive_mtime - 1, archive_mtime - 1))
+    (inputs_dir / '2021' / 'day_01.txt').write_bytes(b'changed in place')
+
+    scandir = mocker.spy(input_archive.os, 'scandir')
+    archive = InputArchive(archive_path)
+    assert set() == find_stale_entries(archive, archive_mtime, str(inputs_dir))
+    scandir.assert_not_called()
+
+    os.utime(inputs_dir / '2021', ns=(archive_mtime + 1, archive_mtime + 1))
+    assert {(2021, 1)} == find_stale_entries(archive, archive_mtime, str(inputs_dir))
+    archive.close()
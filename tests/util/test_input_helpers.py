@@ -1,8 +1,11 @@
+import hashlib
+
 import pytest
 import pytest_mock
 
 from adventofcode.util import input_helpers
-from adventofcode.util.input_helpers import _read_file, _get_input, get_input_for_day, get_input_for_day_as_str
+from adventofcode.util.input_helpers import _read_file, _get_input, get_input_for_day, get_input_for_day_as_str, \
+    get_input_for_day_mmap, MappedInput, iter_input_for_day
 
 
 def test_get_input_for_day(mocker: pytest_mock.MockerFixture):
@@ -33,6 +36,35 @@ def test_get_input_for_day_as_str(mocker: pytest_mock.MockerFixture):
     input_helpers.ROOT_DIR = original_root_dir
 
 
+def test_iter_input_for_day(tmp_path, mocker: pytest_mock.MockerFixture):
+    input_file = tmp_path / 'day_01.txt'
+    input_file.write_text('c0ffee\n\ncafe\n')
+    mocker.patch('adventofcode.util.input_helpers.get_input_path', return_value=str(input_file))
+
+    lines = iter_input_for_day(2020, 1, chunk_size=4)
+    assert 'c0ffee' == next(lines)
+    assert ['', 'cafe'] == list(lines)
+
+
+def test_iter_input_for_day_missing_input(tmp_path, mocker: pytest_mock.MockerFixture):
+    mocker.patch('adventofcode.util.input_helpers.get_input_path', return_value=str(tmp_path / 'day_01.txt'))
+
+    with pytest.raises(FileNotFoundError):
+        iter_input_for_day(2020, 1)
+
+
+def test_get_input_for_day_digest(tmp_path, mocker: pytest_mock.MockerFixture):
+    input_file = tmp_path / 'day_01.txt'
+    input_file.write_bytes(b'c0ffee\r\ncafe\n')
+    mocker.patch('adventofcode.util.input_helpers.get_input_path', return_value=str(input_file))
+    mocker.patch('adventofcode.util.input_helpers.read_archived_input', return_value=None)
+
+    data = get_input_for_day(2020, 1)
+    assert ['c0ffee', 'cafe'] == data
+    assert hashlib.sha256(b'c0ffee\r\ncafe\n').hexdigest() == data.digest
+    assert data.digest == data.copy().digest
+
+
 @pytest.mark.skip()
 def test__read_lines():
     ...
@@ -49,3 +81,36 @@ def test__read_file(mocker: pytest_mock.MockerFixture):
     mocker.patch('builtins.open', mocker.mock_open(read_data='test input'))
     content = _read_file('testfile.txt')
     assert 'test input' == content
+
+
+@pytest.mark.parametrize(['content', 'expected'], [
+    (b'c0ffee\ncafe\n', [b'c0ffee', b'cafe']),
+    (b'c0ffee\r\n\r\ncafe', [b'c0ffee', b'', b'cafe']),
+    (b'c0ffee\r\r\ncafe\r\n', [b'c0ffee\r', b'cafe']),
+    (b'c0ffee\r\n\r\n', [b'c0ffee', b'']),
+    (b'  indented\n', [b'  indented']),
+    (b'', []),
+])
+def test_mapped_input(tmp_path, content, expected):
+    input_file = tmp_path / 'day_01.txt'
+    input_file.write_bytes(content)
+
+    with MappedInput(str(input_file)) as mapped:
+        assert expected == [bytes(line) for line in mapped]
+        assert len(expected) == len(mapped)
+        assert expected == [bytes(mapped[i]) for i in range(len(mapped))]
+        assert content == bytes(mapped.view)
+
+        if expected:
+            assert expected[-1] == bytes(mapped[-1])
+
+        with pytest.raises(IndexError):
+            mapped[len(expected)]
+
+
+def test_get_input_for_day_mmap(mocker: pytest_mock.MockerFixture):
+    mock_mapped_input = mocker.patch('adventofcode.util.input_helpers.MappedInput')
+    mocker.patch('adventofcode.util.input_helpers.ROOT_DIR', 'dir')
+
+    get_input_for_day_mmap(2020, 1)
+    mock_mapped_input.assert_called_with('dir/inputs/2020/day_01.txt')
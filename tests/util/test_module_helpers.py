@@ -1,3 +1,4 @@
+import hashlib
 import os
 
 import pytest
@@ -5,7 +6,7 @@ import pytest_mock
 
 from adventofcode.config import ROOT_DIR
 from adventofcode.util.module_helpers import get_full_year_paths, get_full_day_paths, get_functions_from_day_file, \
-    clean_year, clean_day, year_dir_from_path, get_full_module_from_day_file
+    clean_year, clean_day, year_dir_from_path, get_full_module_from_day_file, source_hash
 
 
 def test_get_full_year_paths(mocker: pytest_mock.MockerFixture):
@@ -66,3 +67,11 @@ def test_year_dir_from_path(path, expected):
 ])
 def test_get_full_module_from_day_file(expected, path):
     assert expected == get_full_module_from_day_file(path)
+
+
+def test_source_hash():
+    with open(__file__, 'rb') as f:
+        assert hashlib.sha256(f.read()).hexdigest() == source_hash(test_source_hash)
+
+    # Functions without a source file get a key of their own
+    assert source_hash(len) != source_hash(len.__call__)
@@ -0,0 +1,123 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from adventofcode.util import output
+from adventofcode.util.console import LazyConsole
+from adventofcode.util.helpers import SolutionResult, solution_timer, collect_results
+from adventofcode.util.output import JsonLinesWriter, output_format, result_record, flush_results, write_results
+from adventofcode.util.profiling import MemoryStats
+
+
+@pytest.fixture
+def jsonl(monkeypatch):
+    monkeypatch.setenv('AOC_OUTPUT', 'jsonl')
+    monkeypatch.delenv('AOC_OUTPUT_FILE', raising=False)
+    monkeypatch.setattr(output, '_writer', None)
+
+
+@pytest.mark.parametrize(['value', 'expected'], [
+    (None, 'rich'),
+    ('jsonl', 'jsonl'),
+    ('xml', 'rich'),
+])
+def test_output_format(monkeypatch, value, expected):
+    if value is None:
+        monkeypatch.delenv('AOC_OUTPUT', raising=False)
+    else:
+        monkeypatch.setenv('AOC_OUTPUT', value)
+
+    assert expected == output_format()
+
+
+def test_result_record():
+    record = result_record(SolutionResult(2022, 1, 2, 'fast', 42, 1.5))
+    assert record == {'year': 2022, 'day': 1, 'part': 2, 'version': 'fast', 'answer': 42, 'ns': 1_500_000, 'status': 'ok'}
+
+    memory = MemoryStats(peak=1024, blocks=1, top=[])
+    assert 1024 == result_record(SolutionResult(2022, 1, 2, memory=memory))['peak']
+
+
+def test_json_lines_writer_file(tmp_path):
+    path = tmp_path / 'results.jsonl'
+    writer = JsonLinesWriter(str(path))
+
+    writer.write({'answer': 1})
+    writer.write({'answer': 2})
+    # The lines are buffered until they are flushed
+    assert '' == path.read_text()
+
+    writer.flush()
+    assert [{'answer': 1}, {'answer': 2}] == [json.loads(line) for line in path.read_text().splitlines()]
+    writer.close()
+
+
+def test_write_results(monkeypatch, mocker, capsys):
+    monkeypatch.delenv('AOC_OUTPUT', raising=False)
+    mock_console = mocker.patch('adventofcode.util.output.console')
+    results = [SolutionResult(2022, 1, 1, answer=42)]
+
+    write_results(results, as_json=True, summary='summary')
+    assert 42 == json.loads(capsys.readouterr().out)[0]['answer']
+    mock_console.print.assert_not_called()
+
+    write_results(results, as_json=False, summary='summary')
+    mock_console.print.assert_called_once_with('summary')
+
+
+def test_solution_timer_writes_json_lines(jsonl, capsys, suppress_console):
+    @solution_timer(2022, 1, 1)
+    def part_one(input_data):
+        return sum(input_data)
+
+    @solution_timer(2022, 1, 2)
+    def part_two(input_data):
+        raise ValueError('invalid input')
+
+    part_one([1, 2])
+    part_two([1, 2])
+    flush_results()
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(record['part'], record['answer'], record['status']) for record in records] == [
+        (1, 3, 'ok'), (2, "ValueError('invalid input')", 'error')
+    ]
+    assert isinstance(records[0]['ns'], int)
+    assert not suppress_console.print.called
+    assert not suppress_console.print_exception.called
+
+
+def test_solution_timer_writes_json_lines_to_file(jsonl, monkeypatch, tmp_path, capsys):
+    path = tmp_path / 'results.jsonl'
+    monkeypatch.setenv('AOC_OUTPUT_FILE', str(path))
+
+    @solution_timer(2022, 1, 1)
+    def part_one(input_data):
+        return 'answer'
+
+    part_one([])
+    with collect_results(silent=True):
+        part_one([])
+    flush_results()
+
+    assert 1 == len(path.read_text().splitlines())
+    assert '' == capsys.readouterr().out
+    output._writer.close()
+
+
+def test_lazy_console():
+    console = LazyConsole(color_system=None)
+    assert console._console is None
+
+    with console.capture() as capture:
+        console.print('hello')
+
+    assert console._console is not None
+    assert 'hello\n' == capture.get()
+
+
+def test_importing_console_does_not_import_rich():
+    code = 'import sys, adventofcode.util.console; print("rich.console" in sys.modules)'
+    assert 'False' == subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout.strip()
@@ -0,0 +1,141 @@
+import os
+import time
+
+import pytest
+import pytest_mock
+
+from adventofcode.util import parse_cache
+from adventofcode.util.input_helpers import InputLines
+from adventofcode.util.parse_cache import cached_parse, evict
+
+
+@pytest.fixture
+def cache_dir(tmp_path, mocker: pytest_mock.MockerFixture):
+    path = str(tmp_path / 'parsed')
+    mocker.patch('adventofcode.util.parse_cache.PARSE_CACHE_DIR', path)
+    return path
+
+
+def test_cached_parse(cache_dir):
+    calls = []
+
+    @cached_parse()
+    def parse(input_data):
+        calls.append(input_data)
+        return [int(line) for line in input_data]
+
+    assert [1, 2] == parse(['1', '2'])
+    assert [1, 2] == parse(['1', '2'])
+    assert [3] == parse(['3'])
+    assert 2 == len(calls)
+    assert 2 == len(os.listdir(cache_dir))
+
+
+def test_cached_parse_input_digest(cache_dir):
+    calls = []
+
+    @cached_parse()
+    def parse(input_data):
+        calls.append(input_data)
+        return [int(line) for line in input_data]
+
+    # Inputs from the input loader are keyed on their digest, not on their lines
+    assert [1, 2] == parse(InputLines(['1', '2'], 'digest'))
+    assert [1, 2] == parse(InputLines(['3'], 'digest'))
+    assert [3] == parse(InputLines(['3'], 'other'))
+    assert 2 == len(calls)
+
+
+def test_cached_parse_disabled(cache_dir, mocker: pytest_mock.MockerFixture):
+    mocker.patch.dict(os.environ, {'AOC_PARSE_CACHE': '0'})
+
+    @cached_parse()
+    def parse(input_data):
+        return input_data
+
+    assert ['1'] == parse(['1'])
+    assert not os.path.exists(cache_dir)
+
+
+def test_cached_parse_unpicklable(cache_dir):
+    @cached_parse()
+    def parse(input_data):
+        return lambda: input_data
+
+    assert ['1'] == parse(['1'])()
+    assert [] == os.listdir(cache_dir)
+
+
+def test_cached_parse_corrupt_entry(cache_dir):
+    @cached_parse()
+    def parse(input_data):
+        return len(input_data)
+
+    assert 1 == parse(['1'])
+    entry, = os.listdir(cache_dir)
+    with open(os.path.join(cache_dir, entry), 'wb') as f:
+        f.write(b'corrupt')
+
+    assert 1 == parse(['1'])
+
+
+def test_evict(cache_dir):
+    os.makedirs(cache_dir)
+    now = time.time()
+    for name, age in (('expired', 100), ('old', 20), ('new', 10)):
+        path = os.path.join(cache_dir, name)
+        with open(path, 'wb') as f:
+            f.write(b'x' * 10)
+        os.utime(path, (now - age, now - age))
+
+    assert 2 == evict(max_size=10, max_age=50, cache_dir=cache_dir)
+    assert ['new'] == os.listdir(cache_dir)
+
+
+def test_evict_skips_entries_being_written(cache_dir, mocker: pytest_mock.MockerFixture):
+    os.makedirs(cache_dir)
+    for name in ('entry.pickle', 'entry.pickle.123.tmp', 'removed.pickle'):
+        with open(os.path.join(cache_dir, name), 'wb') as f:
+            f.write(b'x' * 10)
+
+    stat = os.stat
+
+    def removed_by_other_process(path, *args, **kwargs):
+        if path.endswith('removed.pickle'):
+            raise FileNotFoundError(path)
+        return stat(path, *args, **kwargs)
+
+    mocker.patch('adventofcode.util.parse_cache.os.stat', side_effect=removed_by_other_process)
+
+    assert 1 == evict(max_size=0, cache_dir=cache_dir)
+    assert ['entry.pickle.123.tmp', 'removed.pickle'] == sorted(os.listdir(cache_dir))
+
+
+def test_cached_parse_concurrent_eviction(cache_dir, mocker: pytest_mock.MockerFixture):
+    @cached_parse()
+    def parse(input_data):
+        return len(input_data)
+
+    assert 1 == parse(['1'])
+    mocker.patch('adventofcode.util.parse_cache.os.utime', side_effect=FileNotFoundError)
+    assert 1 == parse(['1'])
+
+    mocker.patch('adventofcode.util.parse_cache.os.replace', side_effect=FileNotFoundError)
+    assert 2 == parse(['1', '2'])
+    assert 1 == len(os.listdir(cache_dir))
+
+
+def test_evict_missing_dir(cache_dir):
+    assert 0 == evict(cache_dir=parse_cache.PARSE_CACHE_DIR)
+
+
+def test_cached_parse_evicts_in_cache_dir(cache_dir, mocker: pytest_mock.MockerFixture):
+    remove = mocker.patch('adventofcode.util.parse_cache._remove')
+
+    @cached_parse(max_size=0)
+    def parse(input_data):
+        return input_data
+
+    parse(['1'])
+    entry, = os.listdir(cache_dir)
+    remove.assert_called_once_with(os.path.join(cache_dir, entry))
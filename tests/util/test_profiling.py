@@ -0,0 +1,171 @@
+import cProfile
+import pstats
+import sys
+import time
+
+import pytest
+
+from adventofcode.util.profiling import LineProfiler, MemoryTracker, StackSampler, collapse_pstats, format_bytes, frame_name, \
+    render_flamegraph, write_collapsed
+
+
+def leaf():
+    total = 0
+    for i in range(50_000):
+        total += i
+    return total
+
+
+def branch():
+    return leaf() + leaf()
+
+
+def generate(n):
+    for i in range(n):
+        yield i
+
+
+def fail():
+    raise ValueError('fail')
+
+
+def solve():
+    total = sum(generate(3))
+    for _ in range(2):
+        total += leaf()
+    try:
+        fail()
+    except ValueError:
+        total += 1
+    return total
+
+
+def line_hits(profiler, func):
+    first = func.__code__.co_firstlineno
+    return {line - first: int(hits) for line, (hits, _) in profiler.lines[func.__code__].items() if hits}
+
+
+def test_line_profiler():
+    expected = 2 * leaf() + 4
+
+    with LineProfiler(solve) as profiler:
+        assert expected == solve()
+
+    assert {1: 1, 2: 3, 3: 2, 4: 1, 5: 1, 6: 1, 7: 1, 8: 1} == line_hits(profiler, solve)
+    assert {1: 2, 2: 100_002, 3: 100_000, 4: 2} == line_hits(profiler, leaf)
+    assert {1: 4, 2: 3} == line_hits(profiler, generate)
+    assert 1 == line_hits(profiler, fail)[1]
+
+    durations = {line: duration for line, (_, duration) in profiler.lines[solve.__code__].items()}
+    first = solve.__code__.co_firstlineno
+    # The time of a line includes the time of the functions it calls
+    assert durations[first + 3] > durations[first + 1]
+
+
+@pytest.mark.parametrize('use_monitoring', [False, True])
+def test_line_profiler_restores_tracing(use_monitoring):
+    if use_monitoring and not hasattr(sys, 'monitoring'):
+        pytest.skip('sys.monitoring requires python 3.12')
+
+    previous = sys.gettrace()
+    profiler = LineProfiler(leaf)
+    profiler.use_monitoring = use_monitoring
+
+    with profiler:
+        leaf()
+
+    assert previous is sys.gettrace()
+    assert profiler.lines
+
+
+def test_frame_name():
+    assert 'leaf (day_01_2020.py:9)' == frame_name('/src/year_2020/day_01_2020.py', 9, 'leaf')
+    assert "<method 'add' of 'set' objects>" == frame_name('~', 0, "<method 'add' of 'set' objects>")
+
+
+def test_collapse_pstats():
+    with cProfile.Profile() as profiler:
+        branch()
+
+    stacks = collapse_pstats(pstats.Stats(profiler))
+    names = {stack.split(' (')[0] for stack in stacks}
+
+    assert {'branch'} == names
+    assert any(stack.startswith('branch (') and stack.split(';')[-1].startswith('leaf (') for stack in stacks)
+    assert all(count > 0 for count in stacks.values())
+
+
+def test_stack_sampler():
+    def sleeper():
+        for _ in range(20):
+            time.sleep(0.002)
+
+    with StackSampler(interval=0.001) as sampler:
+        sleeper()
+
+    assert sampler.samples > 0
+    assert sampler.samples == sum(sampler.stacks.values())
+    assert all(stack.startswith('sleeper (') for stack in sampler.stacks)
+
+
+def test_write_collapsed(tmp_path):
+    path = tmp_path / 'profile.folded'
+    write_collapsed({'main;solve': 3, 'main': 1}, str(path))
+    assert 'main 1\nmain;solve 3\n' == path.read_text()
+
+
+def test_render_flamegraph():
+    svg = render_flamegraph({'main;solve': 3, 'main;parse<x>': 1}, 'title')
+
+    assert svg.startswith('<svg')
+    assert '<title>main (4 samples)</title>' in svg
+    assert '<title>solve (3 samples)</title>' in svg
+    assert 'parse&lt;x&gt;' in svg
+
+
+def allocate():
+    blocks = [bytearray(1000) for _ in range(100)]
+    return len(blocks)
+
+
+def test_memory_tracker():
+    with MemoryTracker(allocate) as tracker:
+        allocate()
+
+    stats = tracker.stats
+    assert stats.peak >= 100_000
+    assert abs(stats.blocks) < 50
+    site, size, blocks = stats.top[0]
+    first = allocate.__code__.co_firstlineno
+    assert f'util/test_profiling.py:{first + 1}' == site
+    assert size >= 100_000
+    assert blocks >= 100
+
+
+def test_memory_tracker_without_reset_peak(monkeypatch):
+    # tracemalloc.reset_peak is new in Python 3.9
+    import tracemalloc
+    monkeypatch.delattr(tracemalloc, 'reset_peak')
+
+    with MemoryTracker(allocate) as tracker:
+        allocate()
+
+    assert tracker.stats.peak >= 100_000
+    assert tracker.stats.top
+
+    tracemalloc.start()
+    try:
+        bytearray(1_000_000)  # a peak before the run
+        with MemoryTracker(allocate) as tracker:
+            kept = bytearray(1000)
+    finally:
+        tracemalloc.stop()
+
+    assert 1000 <= tracker.stats.peak < 1_000_000
+    assert kept
+
+
+def test_format_bytes():
+    assert '512 B' == format_bytes(512)
+    assert '1.5 KiB' == format_bytes(1536)
+    assert '2.0 GiB' == format_bytes(2 * 1024 ** 3)
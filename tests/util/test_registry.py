@@ -0,0 +1,80 @@
+import os
+
+import pytest
+import pytest_mock
+
+from adventofcode.util import registry
+from adventofcode.util.registry import DayEntry, load_registry, part_versions
+
+DAY_FILE = '''
+from adventofcode.util.helpers import solution_timer
+
+
+def helper():
+    ...
+
+
+@solution_timer(2020, 1, 1)
+def part_one(input_data):
+    ...
+
+
+@solution_timer(2020, 1, 2, version='fast')
+def part_two(input_data):
+    ...
+'''
+
+
+@pytest.fixture()
+def year_path(tmp_path, mocker: pytest_mock.MockerFixture):
+    path = tmp_path / 'year_2020'
+    path.mkdir()
+    (path / 'day_01_2020.py').write_text(DAY_FILE)
+    mocker.patch('adventofcode.util.registry.get_full_year_paths', return_value=[str(path)])
+    return path
+
+
+def test_load_registry(tmp_path, year_path):
+    entries = load_registry(str(tmp_path / 'registry.json'))
+
+    assert 1 == len(entries)
+    assert (2020, 1) == (entries[0].year, entries[0].day)
+    assert 'adventofcode.year_2020.day_01_2020' == entries[0].module
+    assert ['helper', 'part_one', 'part_two'] == entries[0].functions
+    assert {'part_one': [1, ''], 'part_two': [2, 'fast']} == entries[0].versions
+    assert {'part_one': True, 'part_two': True} == entries[0].parts
+
+
+def test_load_registry_only_scans_changed_files(tmp_path, year_path, mocker: pytest_mock.MockerFixture):
+    registry_file = str(tmp_path / 'registry.json')
+    load_registry(registry_file)
+    scan = mocker.spy(registry, '_scan_day_file')
+
+    assert load_registry(registry_file)[0].functions == ['helper', 'part_one', 'part_two']
+    scan.assert_not_called()
+
+    (year_path / 'day_02_2020.py').write_text('def part_one(input_data):\n    ...\n')
+    entries = load_registry(registry_file)
+    assert 1 == scan.call_count
+    assert {'part_one': True, 'part_two': False} == entries[1].parts
+
+    os.remove(year_path / 'day_01_2020.py')
+    assert [2] == [entry.day for entry in load_registry(registry_file)]
+    assert [2] == [entry.day for entry in load_registry(registry_file)]
+
+
+def test_load_registry_ignores_corrupt_registry(tmp_path, year_path):
+    registry_file = tmp_path / 'registry.json'
+    registry_file.write_text('{not json')
+
+    assert 1 == len(load_registry(str(registry_file)))
+
+
+def test_part_versions():
+    entry = DayEntry(2020, 1, 'module', 'path', 0, 0, 'hash', versions={
+        'part_one_slow': [1, 'slow'], 'part_one': [1, ''], 'part_two': [2, 'fast'], 'part_one_fast': [1, 'fast'],
+    })
+
+    assert {'part_one': 'part_one', 'slow': 'part_one_slow', 'fast': 'part_one_fast'} == part_versions(entry, 1)
+    assert ['part_one', 'slow', 'fast'] == list(part_versions(entry, 1))
+    assert {'fast': 'part_two'} == part_versions(entry, 2)
@@ -0,0 +1,20 @@
+import argparse
+
+import pytest
+
+from adventofcode.util.selection import parse_selection
+
+
+@pytest.mark.parametrize(['value', 'expected'], [
+    ('5', {5}),
+    ('5-7', {5, 6, 7}),
+    ('1,3,5-7', {1, 3, 5, 6, 7}),
+])
+def test_parse_selection(value, expected):
+    assert expected == parse_selection(value)
+
+
+@pytest.mark.parametrize('value', ['', 'five', '1-', '7-5'])
+def test_parse_selection_invalid(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_selection(value)